@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sample agent that runs a fetch-then-analyze workflow as a single tool."""
+
+import asyncio
+
+from google.adk.agents import Agent
+from google.adk.agents import ParallelAgent
+from google.adk.agents import SequentialAgent
+from google.adk.tools import AgentTool
+
+
+async def query_sales(region: str) -> dict:
+  """Returns the monthly sales figures for a region.
+
+  Args:
+    region: The sales region, e.g. "EMEA" or "APAC".
+
+  Returns:
+    A dictionary with the monthly sales figures.
+  """
+  # Simulate a slow database query (non-blocking).
+  await asyncio.sleep(2)
+  return {
+      'region': region,
+      'monthly_sales': {'2025-07': 120_000, '2025-08': 95_000},
+  }
+
+
+async def query_inventory(region: str) -> dict:
+  """Returns the current stock levels for a region.
+
+  Args:
+    region: The warehouse region, e.g. "EMEA" or "APAC".
+
+  Returns:
+    A dictionary with the stock level per product.
+  """
+  # Simulate a slow database query (non-blocking).
+  await asyncio.sleep(2)
+  return {
+      'region': region,
+      'stock': {'widget': 1_200, 'gadget': 40},
+  }
+
+
+sales_agent = Agent(
+    model='gemini-2.5-flash',
+    name='sales_agent',
+    instruction="""\
+Use the query_sales tool to fetch the sales data the request needs.
+Reply with the fetched data only.
+""",
+    tools=[query_sales],
+    output_key='sales_data',
+)
+
+inventory_agent = Agent(
+    model='gemini-2.5-flash',
+    name='inventory_agent',
+    instruction="""\
+Use the query_inventory tool to fetch the inventory data the request needs.
+Reply with the fetched data only.
+""",
+    tools=[query_inventory],
+    output_key='inventory_data',
+)
+
+# Both data sources are queried at the same time.
+fetch_agent = ParallelAgent(
+    name='fetch_agent',
+    sub_agents=[sales_agent, inventory_agent],
+)
+
+analysis_agent = Agent(
+    model='gemini-2.5-flash',
+    name='analysis_agent',
+    instruction="""\
+You are a business analyst. Answer the request using only the data below.
+
+Sales data:
+{sales_data}
+
+Inventory data:
+{inventory_data}
+""",
+    include_contents='none',
+)
+
+# The fixed fetch -> analyze order is encoded here rather than left to the
+# coordinator, which saves the coordinator a model call per step.
+analysis_workflow = SequentialAgent(
+    name='analysis_workflow',
+    description=(
+        'Fetches the sales and inventory data for a request in parallel and'
+        ' returns an analysis of both. Use this for any question that needs'
+        ' sales and inventory data together.'
+    ),
+    sub_agents=[fetch_agent, analysis_agent],
+)
+
+root_agent = Agent(
+    model='gemini-2.5-flash',
+    name='coordinator_agent',
+    instruction="""\
+You answer questions about sales and inventory.
+For questions that need data, call the analysis_workflow tool once with the
+full question and relay its answer.
+""",
+    tools=[AgentTool(agent=analysis_workflow)],
+)
@@ -14,6 +14,8 @@
 
 import logging
 import sys
+from typing import Any
+from typing import TYPE_CHECKING
 
 from .base_agent import BaseAgent
 from .invocation_context import InvocationContext
@@ -26,6 +28,10 @@ from .parallel_agent import ParallelAgent
 from .run_config import RunConfig
 from .sequential_agent import SequentialAgent
 
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .mcp_instruction_provider import McpInstructionProvider
+
 __all__ = [
     'Agent',
     'BaseAgent',
@@ -46,8 +52,26 @@ if sys.version_info < (3, 10):
       ' version in order to use it.'
   )
 else:
-  from .mcp_instruction_provider import McpInstructionProvider
-
   __all__.extend([
       'McpInstructionProvider',
   ])
+
+
+def __getattr__(name: str) -> Any:
+  """Lazy loads McpInstructionProvider.
+
+  It pulls in the MCP client and the MCP toolset's dependencies, which most
+  agents never use, so it is only imported on first access.
+  """
+  if name == 'McpInstructionProvider' and name in __all__:
+    from .mcp_instruction_provider import McpInstructionProvider
+
+    globals()[name] = McpInstructionProvider
+    return McpInstructionProvider
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# __dir__ is used to expose all public interfaces to keep mocking with autoscope
+# working.
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
@@ -66,6 +66,9 @@ AfterAgentCallback: TypeAlias = Union[
 
 SelfAgent = TypeVar('SelfAgent', bound='BaseAgent')
 
+# List fields that `clone` handles separately instead of shallow copying.
+_CLONE_SKIPPED_LIST_FIELDS = frozenset(('sub_agents',))
+
 
 @experimental
 class BaseAgentState(BaseModel):
@@ -224,9 +227,8 @@ class BaseAgent(BaseModel):
       )
 
     # Only allow updating fields that are defined in the agent class.
-    allowed_fields = set(self.__class__.model_fields)
     if update is not None:
-      invalid_fields = set(update) - allowed_fields
+      invalid_fields = set(update) - self.__class__.model_fields.keys()
       if invalid_fields:
         raise ValueError(
             f'Cannot update nonexistent fields in {self.__class__.__name__}:'
@@ -237,15 +239,20 @@ class BaseAgent(BaseModel):
 
     # If any field is stored as list and not provided in the update, need to
     # shallow copy it for the cloned agent to avoid sharing the same list object
-    # with the original agent.
-    for field_name in cloned_agent.__class__.model_fields:
-      if field_name == 'sub_agents':
-        continue
-      if update is not None and field_name in update:
-        continue
-      field = getattr(cloned_agent, field_name)
-      if isinstance(field, list):
-        setattr(cloned_agent, field_name, field.copy())
+    # with the original agent. The copies are written straight into the
+    # instance dict: agents don't validate assignments, so going through
+    # pydantic's __setattr__ for each list field would only add overhead.
+    skipped_fields = (
+        _CLONE_SKIPPED_LIST_FIELDS
+        if update is None
+        else _CLONE_SKIPPED_LIST_FIELDS.union(update)
+    )
+    cloned_fields = cloned_agent.__dict__
+    cloned_fields.update({
+        field_name: field.copy()
+        for field_name, field in cloned_fields.items()
+        if isinstance(field, list) and field_name not in skipped_fields
+    })
 
     if update is None or 'sub_agents' not in update:
       # If `sub_agents` is not provided in the update, need to recursively clone
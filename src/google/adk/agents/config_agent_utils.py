@@ -23,6 +23,7 @@ from typing import List
 import yaml
 
 from ..utils.feature_decorator import experimental
+from ..utils.file_utils import load_file_cached
 from .agent_config import AgentConfig
 from .base_agent import BaseAgent
 from .base_agent_config import BaseAgentConfig
@@ -93,11 +94,10 @@ def _load_config_from_path(config_path: str) -> AgentConfig:
     FileNotFoundError: If config file doesn't exist.
     ValidationError: If config file's content is invalid YAML.
   """
-  if not os.path.exists(config_path):
-    raise FileNotFoundError(f"Config file not found: {config_path}")
-
-  with open(config_path, "r", encoding="utf-8") as f:
-    config_data = yaml.safe_load(f)
+  try:
+    config_data = load_file_cached(config_path, yaml.safe_load)
+  except FileNotFoundError as e:
+    raise FileNotFoundError(f"Config file not found: {config_path}") from e
 
   return AgentConfig.model_validate(config_data)
 
@@ -65,16 +65,23 @@ class RealtimeCacheEntry(BaseModel):
   """Timestamp when the audio chunk was received."""
 
 
-class _InvocationCostManager(BaseModel):
+class _InvocationCostManager:
   """A container to keep track of the cost of invocation.
 
   While we don't expect the metrics captured here to be a direct
   representative of monetary cost incurred in executing the current
   invocation, they in some ways have an indirect effect.
+
+  This is a plain slotted class rather than a pydantic model: the counter is
+  bumped before every LLM call, and pydantic routes each read and write of a
+  private attribute through its generic attribute hooks.
   """
 
-  _number_of_llm_calls: int = 0
-  """A counter that keeps track of number of llm calls made."""
+  __slots__ = ("_number_of_llm_calls",)
+
+  def __init__(self):
+    self._number_of_llm_calls: int = 0
+    """A counter that keeps track of number of llm calls made."""
 
   def increment_and_enforce_llm_calls_limit(
       self, run_config: Optional[RunConfig]
@@ -35,6 +35,7 @@ from pydantic import BaseModel
 from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
@@ -145,12 +146,9 @@ async def _convert_tool_union_to_tools(
   # the built-in tools cannot be used together with other tools.
   # TODO(b/448114567): Remove once the workaround is no longer needed.
   if multiple_tools and isinstance(tool_union, GoogleSearchTool):
-    from ..tools.google_search_agent_tool import create_google_search_agent
-    from ..tools.google_search_agent_tool import GoogleSearchAgentTool
-
     search_tool = cast(GoogleSearchTool, tool_union)
     if search_tool.bypass_multi_tools_limit:
-      return [GoogleSearchAgentTool(create_google_search_agent(model))]
+      return [search_tool.as_agent_tool(model)]
 
   # Replace VertexAiSearchTool with DiscoveryEngineSearchTool if there are
   # multiple tools because the built-in tools cannot be used together with
@@ -436,6 +434,9 @@ class LlmAgent(BaseAgent):
   """
   # Callbacks - End
 
+  _function_tools: dict[int, FunctionTool] = PrivateAttr(default_factory=dict)
+  """FunctionTool wrappers for the plain callables in `tools`, keyed by id()."""
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -581,11 +582,33 @@ class LlmAgent(BaseAgent):
     for tool_union in self.tools:
       resolved_tools.extend(
           await _convert_tool_union_to_tools(
-              tool_union, ctx, self.model, multiple_tools
+              self._get_function_tool(tool_union),
+              ctx,
+              self.model,
+              multiple_tools,
           )
       )
     return resolved_tools
 
+  def _get_function_tool(self, tool_union: ToolUnion) -> ToolUnion:
+    """Returns a reusable FunctionTool for a plain callable in `tools`.
+
+    Wrapping a callable inspects its signature and builds its function
+    declaration from scratch, so each callable is wrapped once per agent rather
+    than on every LLM request. Other tool unions are returned unchanged.
+
+    This method is only for use by Agent Development Kit.
+    """
+    if isinstance(tool_union, BaseTool) or not callable(tool_union):
+      return tool_union
+    function_tool = self._function_tools.get(id(tool_union))
+    # The cached FunctionTool keeps its callable alive, so its id can't be
+    # reused by another object while it is cached.
+    if function_tool is None or function_tool.func is not tool_union:
+      function_tool = FunctionTool(func=tool_union)
+      self._function_tools[id(tool_union)] = function_tool
+    return function_tool
+
   @property
   def canonical_before_model_callbacks(
       self,
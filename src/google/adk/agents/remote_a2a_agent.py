@@ -528,7 +528,8 @@ class RemoteA2aAgent(BaseAgent):
           context_id=context_id,
       )
 
-    logger.debug(build_a2a_request_log(a2a_request))
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(build_a2a_request_log(a2a_request))
 
     try:
       request_metadata = None
@@ -539,7 +540,8 @@ class RemoteA2aAgent(BaseAgent):
           request=a2a_request,
           request_metadata=request_metadata,
       ):
-        logger.debug(build_a2a_response_log(a2a_response))
+        if logger.isEnabledFor(logging.DEBUG):
+          logger.debug(build_a2a_response_log(a2a_response))
 
         event = await self._handle_a2a_response(a2a_response, ctx)
         if not event:
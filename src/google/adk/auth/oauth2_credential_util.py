@@ -73,7 +73,7 @@ def create_oauth2_session(
       )
       return None, None
   else:
-    logger.warning(f"Unsupported auth_scheme type: {type(auth_scheme)}")
+    logger.warning("Unsupported auth_scheme type: %s", type(auth_scheme))
     return None, None
 
   if (
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from typing import List
 from typing import Optional
 from urllib.parse import urlparse
@@ -48,6 +49,37 @@ class ProtectedResourceMetadata(BaseModel):
   authorization_servers: List[str] = []
 
 
+# Discovery metadata rarely changes, so successful lookups are shared by every
+# OAuth2DiscoveryManager in the process for a while instead of being re-fetched
+# for each credential request. Failed lookups are not cached.
+_METADATA_CACHE_TTL_SECONDS = 300.0
+_auth_server_metadata_cache: dict[
+    str, tuple[float, AuthorizationServerMetadata]
+] = {}
+_resource_metadata_cache: dict[str, tuple[float, ProtectedResourceMetadata]] = (
+    {}
+)
+
+
+def _get_cached_metadata(cache: dict, key: str):
+  entry = cache.get(key)
+  if entry is None:
+    return None
+  expires_at, metadata = entry
+  if time.monotonic() >= expires_at:
+    cache.pop(key, None)
+    return None
+  # Hand out copies so callers cannot mutate the shared entry.
+  return metadata.model_copy(deep=True)
+
+
+def _set_cached_metadata(cache: dict, key: str, metadata) -> None:
+  cache[key] = (
+      time.monotonic() + _METADATA_CACHE_TTL_SECONDS,
+      metadata.model_copy(deep=True),
+  )
+
+
 @experimental
 class OAuth2DiscoveryManager:
   """Implements Metadata discovery for OAuth2 following RFC8414 and RFC9728."""
@@ -56,6 +88,16 @@ class OAuth2DiscoveryManager:
       self, issuer_url: str
   ) -> Optional[AuthorizationServerMetadata]:
     """Discovers the OAuth2 authorization server metadata."""
+    if cached := _get_cached_metadata(_auth_server_metadata_cache, issuer_url):
+      return cached
+    metadata = await self._fetch_auth_server_metadata(issuer_url)
+    if metadata:
+      _set_cached_metadata(_auth_server_metadata_cache, issuer_url, metadata)
+    return metadata
+
+  async def _fetch_auth_server_metadata(
+      self, issuer_url: str
+  ) -> Optional[AuthorizationServerMetadata]:
     try:
       parsed_url = urlparse(issuer_url)
       base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -107,6 +149,16 @@ class OAuth2DiscoveryManager:
       self, resource_url: str
   ) -> Optional[ProtectedResourceMetadata]:
     """Discovers the OAuth2 protected resource metadata."""
+    if cached := _get_cached_metadata(_resource_metadata_cache, resource_url):
+      return cached
+    metadata = await self._fetch_resource_metadata(resource_url)
+    if metadata:
+      _set_cached_metadata(_resource_metadata_cache, resource_url, metadata)
+    return metadata
+
+  async def _fetch_resource_metadata(
+      self, resource_url: str
+  ) -> Optional[ProtectedResourceMetadata]:
     try:
       parsed_url = urlparse(resource_url)
       base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -460,8 +460,10 @@ class AdkWebServer:
     # Handle cleanup
     if app_name in self.runners_to_clean:
       self.runners_to_clean.remove(app_name)
+      # The app may have changed before its runner was ever created.
       runner = self.runner_dict.pop(app_name, None)
-      await cleanup.close_runners(list([runner]))
+      if runner is not None:
+        await cleanup.close_runners([runner])
 
     # Return cached runner if exists
     if app_name in self.runner_dict:
@@ -667,7 +669,7 @@ class AdkWebServer:
       finally:
         tear_down_observer(observer, self)
         # Create tasks for all runner closures to run concurrently
-        await cleanup.close_runners(list(self.runner_dict.values()))
+        await cleanup.close_runners(self.runner_dict.values())
 
     memory_exporter = InMemoryExporter(session_trace_dict)
 
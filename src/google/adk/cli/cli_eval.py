@@ -67,6 +67,14 @@ def _import_from_path(module_name, file_path):
 def _get_agent_module(agent_module_file_path: str):
   file_path = os.path.join(agent_module_file_path, "__init__.py")
   module_name = "agent"
+  # Reuse the module if it was already loaded from the same file, so that
+  # `get_root_agent` and `try_get_reset_func` don't each re-execute the agent
+  # package and construct its agents and toolsets again.
+  module = sys.modules.get(module_name)
+  if module is not None and os.path.abspath(
+      getattr(module, "__file__", None) or ""
+  ) == os.path.abspath(file_path):
+    return module
   return _import_from_path(module_name, file_path)
 
 
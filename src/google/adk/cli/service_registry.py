@@ -127,27 +127,24 @@ class ServiceRegistry:
   ) -> BaseSessionService | None:
     """Create session service from URI using registered factories."""
     scheme = urlparse(uri).scheme
-    if scheme and scheme in self._session_factories:
-      return self._session_factories[scheme](uri, **kwargs)
-    return None
+    factory = self._session_factories.get(scheme) if scheme else None
+    return factory(uri, **kwargs) if factory else None
 
   def create_artifact_service(
       self, uri: str, **kwargs
   ) -> BaseArtifactService | None:
     """Create artifact service from URI using registered factories."""
     scheme = urlparse(uri).scheme
-    if scheme and scheme in self._artifact_factories:
-      return self._artifact_factories[scheme](uri, **kwargs)
-    return None
+    factory = self._artifact_factories.get(scheme) if scheme else None
+    return factory(uri, **kwargs) if factory else None
 
   def create_memory_service(
       self, uri: str, **kwargs
   ) -> BaseMemoryService | None:
     """Create memory service from URI using registered factories."""
     scheme = urlparse(uri).scheme
-    if scheme and scheme in self._memory_factories:
-      return self._memory_factories[scheme](uri, **kwargs)
-    return None
+    factory = self._memory_factories.get(scheme) if scheme else None
+    return factory(uri, **kwargs) if factory else None
 
 
 def get_service_registry() -> ServiceRegistry:
@@ -35,9 +35,10 @@ from .base_agent_loader import BaseAgentLoader
 
 logger = logging.getLogger("google_adk." + __name__)
 
-# Special agents directory for agents with names starting with double underscore
-SPECIAL_AGENTS_DIR = os.path.join(
-    os.path.dirname(__file__), "..", "..", "built_in_agents"
+# Special agents directory for agents with names starting with double underscore.
+# Normalized once at import rather than on every special agent load.
+SPECIAL_AGENTS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "built_in_agents")
 )
 
 
@@ -189,7 +190,7 @@ class AgentLoader(BaseAgentLoader):
     # Determine the directory to use for loading
     if agent_name.startswith("__"):
       # Special agent: use special agents directory
-      agents_dir = os.path.abspath(SPECIAL_AGENTS_DIR)
+      agents_dir = SPECIAL_AGENTS_DIR
       # Remove the double underscore prefix for the actual agent name
       actual_agent_name = agent_name[2:]
     else:
@@ -12,29 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import List
+from typing import Iterable
+from typing import Optional
 
 from ...runners import Runner
 
 logger = logging.getLogger("google_adk." + __name__)
 
 
-async def close_runners(runners: List[Runner]) -> None:
-  cleanup_tasks = [asyncio.create_task(runner.close()) for runner in runners]
-  if cleanup_tasks:
-    # Wait for all cleanup tasks with timeout
-    done, pending = await asyncio.wait(
-        cleanup_tasks,
-        timeout=30.0,  # 30 second timeout for cleanup
-        return_when=asyncio.ALL_COMPLETED,
-    )
+async def close_runners(runners: Iterable[Optional[Runner]]) -> None:
+  """Closes the given runners concurrently, skipping any `None` entries."""
+  cleanup_tasks = [
+      asyncio.create_task(runner.close())
+      for runner in runners
+      if runner is not None
+  ]
+  if not cleanup_tasks:
+    return
 
-    # If any tasks are still pending, log it
-    if pending:
-      logger.warning(
-          "%s runner close tasks didn't complete in time", len(pending)
-      )
-      for task in pending:
-        task.cancel()
+  # Wait for all cleanup tasks with timeout
+  done, pending = await asyncio.wait(
+      cleanup_tasks,
+      timeout=30.0,  # 30 second timeout for cleanup
+      return_when=asyncio.ALL_COMPLETED,
+  )
+
+  # If any tasks are still pending, log it
+  if pending:
+    logger.warning(
+        "%s runner close tasks didn't complete in time", len(pending)
+    )
+    for task in pending:
+      task.cancel()
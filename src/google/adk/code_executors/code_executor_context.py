@@ -135,9 +135,10 @@ class CodeExecutorContext:
     Returns:
       The error count for the given invocation ID.
     """
-    if _ERROR_COUNT_KEY not in self._session_state:
+    error_counts = self._session_state.get(_ERROR_COUNT_KEY)
+    if error_counts is None:
       return 0
-    return self._session_state[_ERROR_COUNT_KEY].get(invocation_id, 0)
+    return error_counts.get(invocation_id, 0)
 
   def increment_error_count(self, invocation_id: str):
     """Increments the error count from the session state.
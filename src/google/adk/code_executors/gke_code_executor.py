@@ -101,13 +101,16 @@ class GkeCodeExecutor(BaseCodeExecutor):
 
     if self.kubeconfig_path:
       try:
-        logger.info(f"Using explicit kubeconfig from '{self.kubeconfig_path}'.")
+        logger.info(
+            "Using explicit kubeconfig from '%s'.", self.kubeconfig_path
+        )
         config.load_kube_config(
             config_file=self.kubeconfig_path, context=self.kubeconfig_context
         )
       except config.ConfigException as e:
         logger.error(
-            f"Failed to load explicit kubeconfig from {self.kubeconfig_path}",
+            "Failed to load explicit kubeconfig from %s",
+            self.kubeconfig_path,
             exc_info=True,
         )
         raise RuntimeError(
@@ -160,15 +163,16 @@ class GkeCodeExecutor(BaseCodeExecutor):
       self._add_owner_reference(created_job, configmap_name)
 
       logger.info(
-          f"Submitted Job '{job_name}' to namespace '{self.namespace}'."
+          "Submitted Job '%s' to namespace '%s'.", job_name, self.namespace
       )
       logger.debug("Executing code:\n```\n%s\n```", code_execution_input.code)
       return self._watch_job_completion(job_name)
 
     except ApiException as e:
       logger.error(
-          "A Kubernetes API error occurred during job"
-          f" '{job_name}': {e.reason}",
+          "A Kubernetes API error occurred during job '%s': %s",
+          job_name,
+          e.reason,
           exc_info=True,
       )
       return CodeExecutionResult(stderr=f"Kubernetes API error: {e.reason}")
@@ -179,7 +183,9 @@ class GkeCodeExecutor(BaseCodeExecutor):
       return CodeExecutionResult(stderr=stderr)
     except Exception as e:
       logger.error(
-          f"An unexpected error occurred during job '{job_name}': {e}",
+          "An unexpected error occurred during job '%s': %s",
+          job_name,
+          e,
           exc_info=True,
       )
       return CodeExecutionResult(
@@ -272,12 +278,12 @@ class GkeCodeExecutor(BaseCodeExecutor):
         job = event["object"]
         if job.status.succeeded:
           watch.stop()
-          logger.info(f"Job '{job_name}' succeeded.")
+          logger.info("Job '%s' succeeded.", job_name)
           logs = self._get_pod_logs(job_name)
           return CodeExecutionResult(stdout=logs)
         if job.status.failed:
           watch.stop()
-          logger.error(f"Job '{job_name}' failed.")
+          logger.error("Job '%s' failed.", job_name)
           logs = self._get_pod_logs(job_name)
           return CodeExecutionResult(stderr=f"Job failed. Logs:\n{logs}")
 
@@ -343,11 +349,14 @@ class GkeCodeExecutor(BaseCodeExecutor):
           body=patch_body,
       )
       logger.info(
-          f"Set Job '{owner_job.metadata.name}' as owner of ConfigMap"
-          f" '{configmap_name}'."
+          "Set Job '%s' as owner of ConfigMap '%s'.",
+          owner_job.metadata.name,
+          configmap_name,
       )
     except ApiException as e:
       logger.warning(
-          f"Failed to set ownerReference on ConfigMap '{configmap_name}'. "
-          f"Manual cleanup is required. Reason: {e.reason}"
+          "Failed to set ownerReference on ConfigMap '%s'. "
+          "Manual cleanup is required. Reason: %s",
+          configmap_name,
+          e.reason,
       )
@@ -24,6 +24,7 @@ from typing_extensions import override
 
 from ..agents.invocation_context import InvocationContext
 from .base_code_executor import BaseCodeExecutor
+from .code_execution_utils import _DATA_FRAME_HELPER_CODE
 from .code_execution_utils import CodeExecutionInput
 from .code_execution_utils import CodeExecutionResult
 from .code_execution_utils import File
@@ -33,7 +34,7 @@ logger = logging.getLogger('google_adk.' + __name__)
 _SUPPORTED_IMAGE_TYPES = ['png', 'jpg', 'jpeg']
 _SUPPORTED_DATA_FILE_TYPES = ['csv']
 
-_IMPORTED_LIBRARIES = '''
+_IMPORTED_LIBRARIES = """
 import io
 import math
 import re
@@ -42,47 +43,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import scipy
-
-def crop(s: str, max_chars: int = 64) -> str:
-  """Crops a string to max_chars characters."""
-  return s[: max_chars - 3] + '...' if len(s) > max_chars else s
-
-
-def explore_df(df: pd.DataFrame) -> None:
-  """Prints some information about a pandas DataFrame."""
-
-  with pd.option_context(
-      'display.max_columns', None, 'display.expand_frame_repr', False
-  ):
-    # Print the column names to never encounter KeyError when selecting one.
-    df_dtypes = df.dtypes
-
-    # Obtain information about data types and missing values.
-    df_nulls = (len(df) - df.isnull().sum()).apply(
-        lambda x: f'{x} / {df.shape[0]} non-null'
-    )
-
-    # Explore unique total values in columns using `.unique()`.
-    df_unique_count = df.apply(lambda x: len(x.unique()))
-
-    # Explore unique values in columns using `.unique()`.
-    df_unique = df.apply(lambda x: crop(str(list(x.unique()))))
-
-    df_info = pd.concat(
-        (
-            df_dtypes.rename('Dtype'),
-            df_nulls.rename('Non-Null Count'),
-            df_unique_count.rename('Unique Values Count'),
-            df_unique.rename('Unique Values'),
-        ),
-        axis=1,
-    )
-    df_info.index.name = 'Columns'
-    print(f"""Total rows: {df.shape[0]}
-Total columns: {df.shape[1]}
-
-{df_info}""")
-'''
+""" + _DATA_FRAME_HELPER_CODE
 
 
 def _get_code_interpreter_extension(resource_name: str = None):
@@ -485,24 +485,27 @@ class AgentEvaluator:
     # One of the two things should be satisfied, either the module should have
     # an "agent" as a member in it or the module name itself should end with
     # ".agent".
-    if not (hasattr(agent_module, "agent") or module_name.endswith(".agent")):
+    agent_member = getattr(agent_module, "agent", None)
+    if agent_member is None and not module_name.endswith(".agent"):
       raise ValueError(
           f"Module {module_name} does not have a member named `agent` or the"
           " name should endwith `.agent`."
       )
 
     agent_module_with_agent = (
-        agent_module.agent if hasattr(agent_module, "agent") else agent_module
+        agent_member if agent_member is not None else agent_module
     )
-    if hasattr(agent_module_with_agent, "root_agent"):
-      root_agent = agent_module_with_agent.root_agent
-    elif hasattr(agent_module_with_agent, "get_agent_async"):
-      root_agent, _ = await agent_module_with_agent.get_agent_async()
-    else:
-      raise ValueError(
-          f"Module {module_name} does not have a root_agent or"
-          " get_agent_async method."
+    root_agent = getattr(agent_module_with_agent, "root_agent", None)
+    if root_agent is None:
+      get_agent_async = getattr(
+          agent_module_with_agent, "get_agent_async", None
       )
+      if get_agent_async is None:
+        raise ValueError(
+            f"Module {module_name} does not have a root_agent or"
+            " get_agent_async method."
+        )
+      root_agent, _ = await get_agent_async()
 
     agent_for_eval = root_agent
     if agent_name:
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import logging
-import os
 from typing import Optional
 from typing import Union
 
@@ -25,6 +24,7 @@ from pydantic import ConfigDict
 from pydantic import Field
 
 from ..evaluation.eval_metrics import EvalMetric
+from ..utils.file_utils import load_file_cached
 from .eval_metrics import BaseCriterion
 from .eval_metrics import Threshold
 from .user_simulator import BaseUserSimulatorConfig
@@ -90,9 +90,12 @@ def get_evaluation_criteria_or_default(
 
   Otherwise a default one is returned.
   """
-  if eval_config_file_path and os.path.exists(eval_config_file_path):
-    with open(eval_config_file_path, "r", encoding="utf-8") as f:
-      content = f.read()
+  if eval_config_file_path:
+    try:
+      content = load_file_cached(eval_config_file_path)
+    except FileNotFoundError:
+      pass
+    else:
       return EvalConfig.model_validate_json(content)
 
   logger.info(
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import json
 import logging
@@ -741,13 +742,14 @@ class HallucinationsV1Evaluator(Evaluator):
         )
         continue
 
-      scores_per_step = []
-      for step in step_evaluations:
-        fs_score, _ = await self._evaluate_nl_response(
-            step.nl_response, step.context
-        )
-        if fs_score is not None:
-          scores_per_step.append(fs_score)
+      # Steps are judged independently, so their judge calls run concurrently.
+      step_results = await asyncio.gather(*(
+          self._evaluate_nl_response(step.nl_response, step.context)
+          for step in step_evaluations
+      ))
+      scores_per_step = [
+          fs_score for fs_score, _ in step_results if fs_score is not None
+      ]
 
       invocation_score = (
           statistics.mean(scores_per_step) if scores_per_step else None
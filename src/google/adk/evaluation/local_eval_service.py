@@ -243,10 +243,10 @@ class LocalEvalService(BaseEvalService):
           )
       )
 
-    for eval_metric in evaluate_config.eval_metrics:
+    async def evaluate_metric(eval_metric: EvalMetric) -> EvaluationResult:
       # Perform evaluation of the metric.
       try:
-        evaluation_result = await self._evaluate_metric(
+        return await self._evaluate_metric(
             eval_metric=eval_metric,
             actual_invocations=inference_result.inferences,
             expected_invocations=eval_case.conversation,
@@ -263,10 +263,19 @@ class LocalEvalService(BaseEvalService):
             exc_info=True,
         )
         # We use an empty result.
-        evaluation_result = EvaluationResult(
-            overall_eval_status=EvalStatus.NOT_EVALUATED
-        )
-
+        return EvaluationResult(overall_eval_status=EvalStatus.NOT_EVALUATED)
+
+    # Metrics are independent of each other, so they are evaluated
+    # concurrently. Otherwise metrics that use an llm as a judge would wait on
+    # each other's model calls.
+    evaluation_results = await asyncio.gather(*(
+        evaluate_metric(eval_metric)
+        for eval_metric in evaluate_config.eval_metrics
+    ))
+
+    for eval_metric, evaluation_result in zip(
+        evaluate_config.eval_metrics, evaluation_results
+    ):
       # Track overall score across all invocations.
       eval_metric_result_details = EvalMetricResultDetails(
           rubric_scores=evaluation_result.overall_rubric_scores
@@ -21,6 +21,7 @@ import os
 from typing_extensions import override
 
 from ..errors.not_found_error import NotFoundError
+from ..utils.file_utils import load_file_cached
 from ._eval_set_results_manager_utils import create_eval_set_result
 from .eval_result import EvalCaseResult
 from .eval_result import EvalSetResult
@@ -76,10 +77,14 @@ class LocalEvalSetResultsManager(EvalSetResultsManager):
         )
         + _EVAL_SET_RESULT_FILE_EXTENSION
     )
-    if not os.path.exists(maybe_eval_result_file_path):
-      raise NotFoundError(f"Eval set result `{eval_set_result_id}` not found.")
-    with open(maybe_eval_result_file_path, "r", encoding="utf-8") as file:
-      eval_result_data = json.load(file)
+    try:
+      eval_result_data = load_file_cached(
+          maybe_eval_result_file_path, json.load
+      )
+    except FileNotFoundError as e:
+      raise NotFoundError(
+          f"Eval set result `{eval_set_result_id}` not found."
+      ) from e
     return EvalSetResult.model_validate_json(eval_result_data)
 
   @override
@@ -28,6 +28,7 @@ from pydantic import ValidationError
 from typing_extensions import override
 
 from ..errors.not_found_error import NotFoundError
+from ..utils.file_utils import load_file_cached
 from ._eval_sets_manager_utils import add_eval_case_to_eval_set
 from ._eval_sets_manager_utils import delete_eval_case_from_eval_set
 from ._eval_sets_manager_utils import get_eval_case_from_eval_set
@@ -176,16 +177,13 @@ def load_eval_set_from_file(
     eval_set_file_path: str, eval_set_id: str
 ) -> EvalSet:
   """Returns an EvalSet that is read from the given file."""
-  with open(eval_set_file_path, "r", encoding="utf-8") as f:
-    content = f.read()
-    try:
-      return EvalSet.model_validate_json(content)
-    except ValidationError:
-      # We assume that the eval data was specified in the old format and try
-      # to convert it to the new format.
-      return convert_eval_set_to_pydantic_schema(
-          eval_set_id, json.loads(content)
-      )
+  content = load_file_cached(eval_set_file_path)
+  try:
+    return EvalSet.model_validate_json(content)
+  except ValidationError:
+    # We assume that the eval data was specified in the old format and try
+    # to convert it to the new format.
+    return convert_eval_set_to_pydantic_schema(eval_set_id, json.loads(content))
 
 
 class LocalEvalSetsManager(EvalSetsManager):
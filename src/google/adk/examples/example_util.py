@@ -14,6 +14,8 @@
 
 """Utility functions for converting examples to a string that can be used in system instructions in the prompt."""
 
+from __future__ import annotations
+
 import logging
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -49,46 +51,52 @@ def convert_examples_to_text(
     examples: list[Example], model: Optional[str]
 ) -> str:
   """Converts a list of examples to a string that can be used in a system instruction."""
-  examples_str = ""
-  for example_num, example in enumerate(examples):
-    output = f"{_EXAMPLE_START.format(example_num + 1)}{_USER_PREFIX}"
+  gemini2 = model is None or "gemini-2" in model
+  function_call_prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_CALL_PREFIX
+  function_response_prefix = (
+      _FUNCTION_PREFIX if gemini2 else _FUNCTION_RESPONSE_PREFIX
+  )
+
+  # Collect the pieces and join them once instead of concatenating strings
+  # for every part of every example.
+  pieces = [_EXAMPLES_INTRO]
+  for example_num, example in enumerate(examples, start=1):
+    pieces.append(_EXAMPLE_START.format(example_num))
+    pieces.append(_USER_PREFIX)
     if example.input and example.input.parts:
-      output += (
+      pieces.append(
           "\n".join(part.text for part in example.input.parts if part.text)
-          + "\n"
       )
+      pieces.append("\n")
 
-    gemini2 = model is None or "gemini-2" in model
     previous_role = None
     for content in example.output:
       role = _MODEL_PREFIX if content.role == "model" else _USER_PREFIX
       if role != previous_role:
-        output += role
+        pieces.append(role)
       previous_role = role
       for part in content.parts:
         if part.function_call:
-          args = []
           # Convert function call part to python-like function call
-          for k, v in part.function_call.args.items():
-            if isinstance(v, str):
-              args.append(f"{k}='{v}'")
-            else:
-              args.append(f"{k}={v}")
-          prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_CALL_PREFIX
-          output += (
-              f"{prefix}{part.function_call.name}({', '.join(args)}){_FUNCTION_CALL_SUFFIX}"
+          args = ", ".join(
+              f"{k}='{v}'" if isinstance(v, str) else f"{k}={v}"
+              for k, v in part.function_call.args.items()
+          )
+          pieces.append(
+              f"{function_call_prefix}{part.function_call.name}({args}){_FUNCTION_CALL_SUFFIX}"
           )
         # Convert function response part to json string
         elif part.function_response:
-          prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_RESPONSE_PREFIX
-          output += f"{prefix}{part.function_response.__dict__}{_FUNCTION_RESPONSE_SUFFIX}"
+          pieces.append(
+              f"{function_response_prefix}{part.function_response.__dict__}{_FUNCTION_RESPONSE_SUFFIX}"
+          )
         elif part.text:
-          output += f"{part.text}\n"
+          pieces.append(f"{part.text}\n")
 
-    output += _EXAMPLE_END
-    examples_str += output
+    pieces.append(_EXAMPLE_END)
 
-  return f"{_EXAMPLES_INTRO}{examples_str}{_EXAMPLES_END}"
+  pieces.append(_EXAMPLES_END)
+  return "".join(pieces)
 
 
 def _get_latest_message_from_user(session: "Session") -> str:
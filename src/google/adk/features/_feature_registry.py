@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+import functools
 import warnings
 
 from ..utils.env_utils import is_env_enabled
@@ -97,6 +98,24 @@ def _register_feature(
   _FEATURE_REGISTRY[feature_name] = config
 
 
+@functools.lru_cache(maxsize=None)
+def _get_feature_env_vars(feature_name: FeatureName) -> tuple[str, str]:
+  """Get the environment variables that enable and disable a feature.
+
+  Args:
+    feature_name: The feature name.
+
+  Returns:
+    A tuple of the enable and disable environment variable names.
+  """
+  feature_name_str = (
+      feature_name.value
+      if isinstance(feature_name, FeatureName)
+      else feature_name
+  )
+  return f"ADK_ENABLE_{feature_name_str}", f"ADK_DISABLE_{feature_name_str}"
+
+
 def is_feature_enabled(feature_name: FeatureName) -> bool:
   """Check if a feature is enabled at runtime.
 
@@ -125,13 +144,7 @@ def is_feature_enabled(feature_name: FeatureName) -> bool:
     raise ValueError(f"Feature {feature_name} is not registered.")
 
   # Check environment variables first (highest priority)
-  feature_name_str = (
-      feature_name.value
-      if isinstance(feature_name, FeatureName)
-      else feature_name
-  )
-  enable_var = f"ADK_ENABLE_{feature_name_str}"
-  disable_var = f"ADK_DISABLE_{feature_name_str}"
+  enable_var, disable_var = _get_feature_env_vars(feature_name)
   if is_env_enabled(enable_var):
     if config.stage != FeatureStage.STABLE:
       _emit_non_stable_warning_once(feature_name, config.stage)
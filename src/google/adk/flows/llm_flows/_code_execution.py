@@ -33,6 +33,7 @@ from typing_extensions import override
 from ...agents.invocation_context import InvocationContext
 from ...code_executors.base_code_executor import BaseCodeExecutor
 from ...code_executors.built_in_code_executor import BuiltInCodeExecutor
+from ...code_executors.code_execution_utils import _DATA_FRAME_HELPER_CODE
 from ...code_executors.code_execution_utils import CodeExecutionInput
 from ...code_executors.code_execution_utils import CodeExecutionResult
 from ...code_executors.code_execution_utils import CodeExecutionUtils
@@ -73,44 +74,9 @@ _DATA_FILE_UTIL_MAP = {
     ),
 }
 
-_DATA_FILE_HELPER_LIB = '''
+_DATA_FILE_HELPER_LIB = """
 import pandas as pd
-
-def explore_df(df: pd.DataFrame) -> None:
-  """Prints some information about a pandas DataFrame."""
-
-  with pd.option_context(
-      'display.max_columns', None, 'display.expand_frame_repr', False
-  ):
-    # Print the column names to never encounter KeyError when selecting one.
-    df_dtypes = df.dtypes
-
-    # Obtain information about data types and missing values.
-    df_nulls = (len(df) - df.isnull().sum()).apply(
-        lambda x: f'{x} / {df.shape[0]} non-null'
-    )
-
-    # Explore unique total values in columns using `.unique()`.
-    df_unique_count = df.apply(lambda x: len(x.unique()))
-
-    # Explore unique values in columns using `.unique()`.
-    df_unique = df.apply(lambda x: crop(str(list(x.unique()))))
-
-    df_info = pd.concat(
-        (
-            df_dtypes.rename('Dtype'),
-            df_nulls.rename('Non-Null Count'),
-            df_unique_count.rename('Unique Values Count'),
-            df_unique.rename('Unique Values'),
-        ),
-        axis=1,
-    )
-    df_info.index.name = 'Columns'
-    print(f"""Total rows: {df.shape[0]}
-Total columns: {df.shape[1]}
-
-{df_info}""")
-'''
+""" + _DATA_FRAME_HELPER_CODE
 
 
 class _CodeExecutionRequestProcessor(BaseLlmRequestProcessor):
@@ -403,6 +369,11 @@ def _extract_and_replace_inline_files(
           text='\nAvailable file: `%s`\n' % file_name
       )
 
+      # Files from earlier requests are already saved, so skip re-encoding
+      # their (possibly large) content on every request.
+      if file_name in saved_file_names:
+        continue
+
       # Add the inline data as input file to the code executor context.
       file = File(
           name=file_name,
@@ -411,9 +382,8 @@ def _extract_and_replace_inline_files(
           ).decode(),
           mime_type=mime_type,
       )
-      if file_name not in saved_file_names:
-        code_executor_context.add_input_files([file])
-        all_input_files.append(file)
+      code_executor_context.add_input_files([file])
+      all_input_files.append(file)
 
   return all_input_files
 
@@ -16,8 +16,10 @@
 
 from __future__ import annotations
 
+import functools
 import typing
 from typing import AsyncGenerator
+from typing import Optional
 
 from typing_extensions import override
 
@@ -56,9 +58,8 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
         )
     ])
 
-    transfer_to_agent_tool = FunctionTool(func=transfer_to_agent)
     tool_context = ToolContext(invocation_context)
-    await transfer_to_agent_tool.process_llm_request(
+    await _TRANSFER_TO_AGENT_TOOL.process_llm_request(
         tool_context=tool_context, llm_request=llm_request
     )
 
@@ -68,11 +69,15 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
 
 request_processor = _AgentTransferLlmRequestProcessor()
 
+# The tool is the same for every request, so it is built once and its function
+# declaration is generated on first use only.
+_TRANSFER_TO_AGENT_TOOL = FunctionTool(func=transfer_to_agent)
 
-def _build_target_agents_info(target_agent: BaseAgent) -> str:
+
+def _format_target_agent_info(name: str, description: str) -> str:
   return f"""
-Agent name: {target_agent.name}
-Agent description: {target_agent.description}
+Agent name: {name}
+Agent description: {description}
 """
 
 
@@ -82,9 +87,34 @@ line_break = '\n'
 def _build_target_agents_instructions(
     agent: LlmAgent, target_agents: list[BaseAgent]
 ) -> str:
+  parent_agent_name = (
+      agent.parent_agent.name
+      if agent.parent_agent and not agent.disallow_transfer_to_parent
+      else None
+  )
+  return _format_target_agents_instructions(
+      tuple(
+          (target_agent.name, target_agent.description)
+          for target_agent in target_agents
+      ),
+      parent_agent_name,
+  )
+
+
+@functools.lru_cache(maxsize=128)
+def _format_target_agents_instructions(
+    target_agents_info: tuple[tuple[str, str], ...],
+    parent_agent_name: Optional[str],
+) -> str:
+  """Formats the transfer instructions for the given target agents.
+
+  The instructions are rebuilt on every LLM call but only depend on the names
+  and descriptions of the agents involved, so identical inputs share a single
+  cached string.
+  """
   # Build list of available agent names for the NOTE
   # target_agents already includes parent agent if applicable, so no need to add it again
-  available_agent_names = [target_agent.name for target_agent in target_agents]
+  available_agent_names = [name for name, _ in target_agents_info]
 
   # Sort for consistency
   available_agent_names.sort()
@@ -98,7 +128,8 @@ def _build_target_agents_instructions(
 You have a list of other agents to transfer to:
 
 {line_break.join([
-    _build_target_agents_info(target_agent) for target_agent in target_agents
+    _format_target_agent_info(name, description)
+    for name, description in target_agents_info
 ])}
 
 If you are the best to answer the question according to your description, you
@@ -112,9 +143,9 @@ the function call.
 **NOTE**: the only available agents for `{_TRANSFER_TO_AGENT_FUNCTION_NAME}` function are {formatted_agent_names}.
 """
 
-  if agent.parent_agent and not agent.disallow_transfer_to_parent:
+  if parent_agent_name:
     si += f"""
-If neither you nor the other agents are best for the question, transfer to your parent agent {agent.parent_agent.name}.
+If neither you nor the other agents are best for the question, transfer to your parent agent {parent_agent_name}.
 """
   return si
 
@@ -74,12 +74,15 @@ class AudioCacheManager:
     )
     cache.append(audio_entry)
 
-    logger.debug(
-        'Cached %s audio chunk: %d bytes, cache size: %d',
-        cache_type,
-        len(audio_blob.data),
-        len(cache),
-    )
+    # Audio chunks arrive many times per second; skip building the log
+    # arguments unless debug logging is actually enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(
+          'Cached %s audio chunk: %d bytes, cache size: %d',
+          cache_type,
+          len(audio_blob.data),
+          len(cache),
+      )
 
   async def flush_caches(
       self,
@@ -288,8 +288,8 @@ class BaseLlmFlow(ABC):
           async for llm_response in agen:
             if llm_response.live_session_resumption_update:
               logger.info(
-                  'Update session resumption handle:'
-                  f' {llm_response.live_session_resumption_update}.'
+                  'Update session resumption handle: %s.',
+                  llm_response.live_session_resumption_update,
               )
               invocation_context.live_session_resumption_handle = (
                   llm_response.live_session_resumption_update.new_handle
@@ -472,7 +472,7 @@ class BaseLlmFlow(ABC):
 
       # Then process all tools from this tool union
       tools = await _convert_tool_union_to_tools(
-          tool_union,
+          agent._get_function_tool(tool_union),
           ReadonlyContext(invocation_context),
           agent.model,
           multiple_tools,
@@ -923,8 +923,9 @@ class BaseLlmFlow(ABC):
       A list of Event objects created from the flushed caches.
     """
 
-    # Log cache statistics if enabled
-    if DEFAULT_ENABLE_CACHE_STATISTICS:
+    # Log cache statistics if enabled. The stats walk every cached chunk, so
+    # skip them entirely when debug logging is off.
+    if DEFAULT_ENABLE_CACHE_STATISTICS and logger.isEnabledFor(logging.DEBUG):
       stats = self.audio_cache_manager.get_cache_stats(invocation_context)
       logger.debug('Audio cache stats: %s', stats)
 
@@ -39,11 +39,10 @@ class _BasicLlmRequestProcessor(BaseLlmRequestProcessor):
 
     agent = invocation_context.agent
 
-    llm_request.model = (
-        agent.canonical_model
-        if isinstance(agent.canonical_model, str)
-        else agent.canonical_model.model
-    )
+    # Resolve the model once: for string models every `canonical_model` access
+    # goes through the LLM registry and builds a fresh BaseLlm instance.
+    model = agent.canonical_model
+    llm_request.model = model if isinstance(model, str) else model.model
     llm_request.config = (
         agent.generate_content_config.model_copy(deep=True)
         if agent.generate_content_config
@@ -57,32 +56,24 @@ class _BasicLlmRequestProcessor(BaseLlmRequestProcessor):
       if not agent.tools or can_use_output_schema_with_tools(agent.model):
         llm_request.set_output_schema(agent.output_schema)
 
-    llm_request.live_connect_config.response_modalities = (
-        invocation_context.run_config.response_modalities
-    )
-    llm_request.live_connect_config.speech_config = (
-        invocation_context.run_config.speech_config
-    )
-    llm_request.live_connect_config.output_audio_transcription = (
-        invocation_context.run_config.output_audio_transcription
-    )
-    llm_request.live_connect_config.input_audio_transcription = (
-        invocation_context.run_config.input_audio_transcription
-    )
-    llm_request.live_connect_config.realtime_input_config = (
-        invocation_context.run_config.realtime_input_config
-    )
-    llm_request.live_connect_config.enable_affective_dialog = (
-        invocation_context.run_config.enable_affective_dialog
+    run_config = invocation_context.run_config
+    live_connect_config = llm_request.live_connect_config
+    live_connect_config.response_modalities = run_config.response_modalities
+    live_connect_config.speech_config = run_config.speech_config
+    live_connect_config.output_audio_transcription = (
+        run_config.output_audio_transcription
     )
-    llm_request.live_connect_config.proactivity = (
-        invocation_context.run_config.proactivity
+    live_connect_config.input_audio_transcription = (
+        run_config.input_audio_transcription
     )
-    llm_request.live_connect_config.session_resumption = (
-        invocation_context.run_config.session_resumption
+    live_connect_config.realtime_input_config = run_config.realtime_input_config
+    live_connect_config.enable_affective_dialog = (
+        run_config.enable_affective_dialog
     )
-    llm_request.live_connect_config.context_window_compression = (
-        invocation_context.run_config.context_window_compression
+    live_connect_config.proactivity = run_config.proactivity
+    live_connect_config.session_resumption = run_config.session_resumption
+    live_connect_config.context_window_compression = (
+        run_config.context_window_compression
     )
 
     # TODO: handle tool append here, instead of in BaseTool.process_llm_request.
@@ -32,6 +32,11 @@ from .functions import REQUEST_EUC_FUNCTION_CALL_NAME
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Leading part of every other-agent message presented as context. It is shared
+# by all presented events and must not be mutated; `_get_contents` deep copies
+# the contents it returns.
+_OTHER_AGENT_CONTEXT_HEADER = types.Part(text='For context:')
+
 
 class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
   """Builds the contents for the LLM request."""
@@ -82,27 +87,31 @@ def _rearrange_events_for_async_function_responses_in_history(
   """Rearrange the async function_response events in the history."""
 
   function_call_id_to_response_events_index: dict[str, int] = {}
+  # Remember which events carry function responses so the second pass below
+  # doesn't have to walk their parts again.
+  is_function_response_event: list[bool] = []
   for i, event in enumerate(events):
     function_responses = event.get_function_responses()
+    is_function_response_event.append(bool(function_responses))
     if function_responses:
       for function_response in function_responses:
         function_call_id = function_response.id
         function_call_id_to_response_events_index[function_call_id] = i
 
   result_events: list[Event] = []
-  for event in events:
-    if event.get_function_responses():
+  for event, is_response_event in zip(events, is_function_response_event):
+    if is_response_event:
       # function_response should be handled together with function_call below.
       continue
-    elif event.get_function_calls():
+    elif function_calls := event.get_function_calls():
 
       function_response_events_indices = set()
-      for function_call in event.get_function_calls():
-        function_call_id = function_call.id
-        if function_call_id in function_call_id_to_response_events_index:
-          function_response_events_indices.add(
-              function_call_id_to_response_events_index[function_call_id]
-          )
+      for function_call in function_calls:
+        response_event_index = function_call_id_to_response_events_index.get(
+            function_call.id
+        )
+        if response_event_index is not None:
+          function_response_events_indices.add(response_event_index)
       result_events.append(event)
       if not function_response_events_indices:
         continue
@@ -364,15 +373,13 @@ def _get_contents(
 
   # Parse the events, leaving the contents and the function calls and
   # responses from the current agent.
-  raw_filtered_events = [
-      e
-      for e in rewind_filtered_events
-      if _should_include_event_in_context(current_branch, e)
-  ]
-
-  has_compaction_events = any(
-      e.actions and e.actions.compaction for e in raw_filtered_events
-  )
+  raw_filtered_events = []
+  has_compaction_events = False
+  for e in rewind_filtered_events:
+    if _should_include_event_in_context(current_branch, e):
+      raw_filtered_events.append(e)
+      if e.actions and e.actions.compaction:
+        has_compaction_events = True
 
   if has_compaction_events:
     events_to_process = _process_compaction_events(raw_filtered_events)
@@ -498,19 +505,15 @@ def _present_other_agent_message(event: Event) -> Optional[Event]:
   if not event.content or not event.content.parts:
     return event
 
-  content = types.Content()
-  content.role = 'user'
-  content.parts = [types.Part(text='For context:')]
+  parts = []
   for part in event.content.parts:
     if part.thought:
       # Exclude thoughts from the context.
       continue
     elif part.text:
-      content.parts.append(
-          types.Part(text=f'[{event.author}] said: {part.text}')
-      )
+      parts.append(types.Part(text=f'[{event.author}] said: {part.text}'))
     elif part.function_call:
-      content.parts.append(
+      parts.append(
           types.Part(
               text=(
                   f'[{event.author}] called tool `{part.function_call.name}`'
@@ -520,7 +523,7 @@ def _present_other_agent_message(event: Event) -> Optional[Event]:
       )
     elif part.function_response:
       # Otherwise, create a new text part.
-      content.parts.append(
+      parts.append(
           types.Part(
               text=(
                   f'[{event.author}] `{part.function_response.name}` tool'
@@ -530,16 +533,18 @@ def _present_other_agent_message(event: Event) -> Optional[Event]:
       )
     # Fallback to the original part for non-text and non-functionCall parts.
     else:
-      content.parts.append(part)
+      parts.append(part)
 
-  # If no meaningful parts were added (only "For context:" remains), return None
-  if len(content.parts) == 1:
+  # If no meaningful parts were added, return None.
+  if not parts:
     return None
 
   return Event(
       timestamp=event.timestamp,
       author='user',
-      content=content,
+      content=types.Content(
+          role='user', parts=[_OTHER_AGENT_CONTEXT_HEADER, *parts]
+      ),
       branch=event.branch,
   )
 
@@ -592,10 +597,9 @@ def _merge_function_response_events(
     for part in event.content.parts:
       if part.function_response:
         function_call_id: str = part.function_response.id  # type: ignore
-        if function_call_id in part_indices_in_merged_event:
-          parts_in_merged_event[
-              part_indices_in_merged_event[function_call_id]
-          ] = part
+        part_index = part_indices_in_merged_event.get(function_call_id)
+        if part_index is not None:
+          parts_in_merged_event[part_index] = part
         else:
           parts_in_merged_event.append(part)
           part_indices_in_merged_event[function_call_id] = (
@@ -42,6 +42,7 @@ from ...tools.base_tool import BaseTool
 from ...tools.tool_confirmation import ToolConfirmation
 from ...tools.tool_context import ToolContext
 from ...utils.context_utils import Aclosing
+from ...utils.json_utils import JSON_SCALAR_TYPES
 
 if TYPE_CHECKING:
   from ...agents.llm_agent import LlmAgent
@@ -313,7 +314,7 @@ async def _execute_single_function_call_async(
   # in python debugger.
   # Make a deep copy to avoid being modified.
   function_args = (
-      copy.deepcopy(function_call.args) if function_call.args else {}
+      _copy_function_args(function_call.args) if function_call.args else {}
   )
 
   tool_context = _create_tool_context(
@@ -363,8 +364,8 @@ async def _execute_single_function_call_async(
     # Step 3: Otherwise, proceed calling the tool normally.
     if function_response is None:
       try:
-        function_response = await __call_tool_async(
-            tool, args=function_args, tool_context=tool_context
+        function_response = await tool.run_async(
+            args=function_args, tool_context=tool_context
         )
       except Exception as tool_error:
         error_response = await _run_on_tool_error_callbacks(
@@ -511,7 +512,7 @@ async def _execute_single_function_call_live(
   )
 
   function_args = (
-      copy.deepcopy(function_call.args) if function_call.args else {}
+      _copy_function_args(function_call.args) if function_call.args else {}
   )
 
   async def _run_with_trace():
@@ -705,12 +706,28 @@ async def _process_function_live_helper(
         )
     }
   else:
-    function_response = await __call_tool_async(
-        tool, args=function_args, tool_context=tool_context
+    function_response = await tool.run_async(
+        args=function_args, tool_context=tool_context
     )
   return function_response
 
 
+def _copy_function_args(value: Any) -> Any:
+  """Deep-copies function call args, which are plain JSON values.
+
+  Walking dicts and lists directly is about twice as fast as `copy.deepcopy`,
+  which is still used for any other value type.
+  """
+  value_type = type(value)
+  if value_type is dict:
+    return {k: _copy_function_args(v) for k, v in value.items()}
+  if value_type is list:
+    return [_copy_function_args(v) for v in value]
+  if value_type in JSON_SCALAR_TYPES:
+    return value
+  return copy.deepcopy(value)
+
+
 def _get_tool(
     function_call: types.FunctionCall, tools_dict: dict[str, BaseTool]
 ):
@@ -779,15 +796,6 @@ async def __call_tool_live(
       yield item
 
 
-async def __call_tool_async(
-    tool: BaseTool,
-    args: dict[str, Any],
-    tool_context: ToolContext,
-) -> Any:
-  """Calls the tool."""
-  return await tool.run_async(args=args, tool_context=tool_context)
-
-
 def __build_response_event(
     tool: BaseTool,
     function_result: dict[str, object],
@@ -94,14 +94,17 @@ class TranscriptionManager:
 
       # Save transcription event to session
 
-      logger.debug(
-          'Saved %s transcription event for %s: %s',
-          'input' if is_input else 'output',
-          author,
-          transcription.text
-          if hasattr(transcription, 'text')
-          else 'audio transcription',
-      )
+      # Runs for every transcription chunk of a live session; skip building
+      # the log arguments unless debug logging is on.
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            'Saved %s transcription event for %s: %s',
+            'input' if is_input else 'output',
+            author,
+            transcription.text
+            if hasattr(transcription, 'text')
+            else 'audio transcription',
+        )
 
       return transcription_event
     except Exception as e:
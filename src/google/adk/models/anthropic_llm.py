@@ -173,10 +173,11 @@ def message_to_generate_content_response(
     message: anthropic_types.Message,
 ) -> LlmResponse:
   logger.info("Received response from Claude.")
-  logger.debug(
-      "Claude response: %s",
-      message.model_dump_json(indent=2, exclude_none=True),
-  )
+  if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(
+        "Claude response: %s",
+        message.model_dump_json(indent=2, exclude_none=True),
+    )
 
   return LlmResponse(
       content=types.Content(
@@ -196,11 +196,10 @@ def _identify_api_version(model: str) -> str:
 
 def _get_model_id(model: str) -> str:
   """Returns the model ID for the model spec."""
-  model = model.removeprefix('apigee/')
-  components = model.split('/')
-
-  # Model_id is the last component in the model string.
-  return components[-1]
+  # Model_id is the last component in the model string. This runs for every
+  # request, so only the last separator is looked up instead of splitting the
+  # whole spec.
+  return model.rpartition('/')[2]
 
 
 def _validate_model_string(model: str) -> bool:
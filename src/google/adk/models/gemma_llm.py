@@ -182,8 +182,8 @@ class Gemma(Gemini):
       llm_response.content.parts = [function_call_part]
     except (json.JSONDecodeError, ValidationError) as e:
       logger.debug(
-          f'Error attempting to parse JSON into function call. Leaving as text'
-          f' response. %s',
+          'Error attempting to parse JSON into function call. Leaving as text'
+          ' response. %s',
           e,
       )
     except Exception as e:
@@ -270,6 +270,20 @@ def _convert_content_parts_for_gemma(
   return new_parts, has_function_response_part, has_function_call_part
 
 
+# Constant scaffolding of the Gemma function calling system instruction; only
+# the function declarations between them vary per request.
+_GEMMA_FUNCTION_INSTRUCTION_PREFIX = (
+    'You have access to the following functions:\n['
+)
+_GEMMA_FUNCTION_INSTRUCTION_SUFFIX = (
+    '\n]\n'
+    'When you call a function, you MUST respond in the format of: '
+    """{"name": function name, "parameters": dictionary of argument name and its value}\n"""
+    'When you call a function, you MUST NOT include any other text in the'
+    ' response.\n'
+)
+
+
 def _build_gemma_function_system_instruction(
     function_declarations: list[FunctionDeclaration],
 ) -> str:
@@ -277,23 +291,14 @@ def _build_gemma_function_system_instruction(
   if not function_declarations:
     return ''
 
-  system_instruction_prefix = 'You have access to the following functions:\n['
-  instruction_parts = []
-  for func in function_declarations:
-    instruction_parts.append(func.model_dump_json(exclude_none=True))
-
-  separator = ',\n'
-  system_instruction = (
-      f'{system_instruction_prefix}{separator.join(instruction_parts)}\n]\n'
-  )
-
-  system_instruction += (
-      'When you call a function, you MUST respond in the format of: '
-      """{"name": function name, "parameters": dictionary of argument name and its value}\n"""
-      'When you call a function, you MUST NOT include any other text in the'
-      ' response.\n'
+  return (
+      _GEMMA_FUNCTION_INSTRUCTION_PREFIX
+      + ',\n'.join(
+          func.model_dump_json(exclude_none=True)
+          for func in function_declarations
+      )
+      + _GEMMA_FUNCTION_INSTRUCTION_SUFFIX
   )
-  return system_instruction
 
 
 def _get_last_valid_json_substring(text: str) -> tuple[bool, str | None]:
@@ -137,7 +137,8 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.debug(_build_request_log(llm_request))
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(_build_request_log(llm_request))
 
     # Always add tracking headers to custom headers given it will override
     # the headers set in the api client constructor to avoid tracking headers
@@ -164,7 +165,8 @@ class Gemini(BaseLlm):
       aggregator = StreamingResponseAggregator()
       async with Aclosing(responses) as agen:
         async for response in agen:
-          logger.debug(_build_response_log(response))
+          if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_build_response_log(response))
           async with Aclosing(
               aggregator.process_response(response)
           ) as aggregator_gen:
@@ -185,7 +187,8 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       logger.info('Response received from the model.')
-      logger.debug(_build_response_log(response))
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(_build_response_log(response))
 
       llm_response = LlmResponse.create(response)
       if cache_metadata:
@@ -86,6 +86,18 @@ _SUPPORTED_FILE_CONTENT_MIME_TYPES = set(
     ["application/pdf", "application/json"]
 )
 
+# GenerateContentConfig fields forwarded to LiteLLM, paired with the LiteLLM
+# parameter name. See https://docs.litellm.ai/docs/completion/input.
+_GENERATION_PARAM_MAPPING: tuple[tuple[str, str], ...] = (
+    ("temperature", "temperature"),
+    ("max_output_tokens", "max_completion_tokens"),
+    ("top_p", "top_p"),
+    ("top_k", "top_k"),
+    ("stop_sequences", "stop"),
+    ("presence_penalty", "presence_penalty"),
+    ("frequency_penalty", "frequency_penalty"),
+)
+
 
 def _decode_inline_text_data(raw_bytes: bytes) -> str:
   """Decodes inline file bytes that represent textual content."""
@@ -170,6 +182,10 @@ class LiteLLMClient:
     )
 
 
+# Shared by the tool call arguments and responses of every request.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
 
@@ -182,7 +198,7 @@ def _safe_json_serialize(obj) -> str:
 
   try:
     # Try direct JSON serialization first
-    return json.dumps(obj, ensure_ascii=False)
+    return _JSON_ENCODER.encode(obj)
   except (TypeError, OverflowError):
     return str(obj)
 
@@ -924,26 +940,13 @@ def _get_completion_inputs(
   # 4. Extract generation parameters
   generation_params: Optional[Dict] = None
   if llm_request.config:
-    config_dict = llm_request.config.model_dump(exclude_none=True)
-    # Generate LiteLlm parameters here,
-    # Following https://docs.litellm.ai/docs/completion/input.
+    # Read only the scalar fields we forward instead of dumping the whole
+    # config, which also serializes the system instruction and every tool.
     generation_params = {}
-    param_mapping = {
-        "max_output_tokens": "max_completion_tokens",
-        "stop_sequences": "stop",
-    }
-    for key in (
-        "temperature",
-        "max_output_tokens",
-        "top_p",
-        "top_k",
-        "stop_sequences",
-        "presence_penalty",
-        "frequency_penalty",
-    ):
-      if key in config_dict:
-        mapped_key = param_mapping.get(key, key)
-        generation_params[mapped_key] = config_dict[key]
+    for key, mapped_key in _GENERATION_PARAM_MAPPING:
+      value = getattr(llm_request.config, key)
+      if value is not None:
+        generation_params[mapped_key] = value
 
     if not generation_params:
       generation_params = None
@@ -1150,7 +1153,8 @@ class LiteLlm(BaseLlm):
 
     self._maybe_append_user_content(llm_request)
     _append_fallback_user_content_if_missing(llm_request)
-    logger.debug(_build_request_log(llm_request))
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(_build_request_log(llm_request))
 
     messages, tools, response_format, generation_params = (
         _get_completion_inputs(llm_request)
@@ -110,7 +110,8 @@ class LlmRequest(BaseModel):
     as user contents.
 
     Behavior:
-      - list[str]: concatenates with existing system_instruction using \\n\\n
+      - list[str]: concatenates with existing system_instruction using \\n\\n,
+        skipping empty strings
       - types.Content: extracts text parts with references to non-text parts,
         returns non-text parts as user contents
     """
@@ -190,18 +191,7 @@ class LlmRequest(BaseModel):
 
       # Handle text parts for system instruction
       if text_parts:
-        new_text = "\n\n".join(text_parts)
-        if not self.config.system_instruction:
-          self.config.system_instruction = new_text
-        elif isinstance(self.config.system_instruction, str):
-          self.config.system_instruction += "\n\n" + new_text
-        else:
-          # Log warning for unsupported system_instruction types
-          logging.warning(
-              "Cannot append to system_instruction of unsupported type: %s. "
-              "Only string system_instruction is supported.",
-              type(self.config.system_instruction),
-          )
+        self._append_system_instruction_texts(text_parts)
 
       # Add user contents directly to llm_request.contents
       if user_contents:
@@ -216,23 +206,34 @@ class LlmRequest(BaseModel):
       if not instructions:  # Handle empty list
         return []
 
-      new_text = "\n\n".join(instructions)
-      if not self.config.system_instruction:
-        self.config.system_instruction = new_text
-      elif isinstance(self.config.system_instruction, str):
-        self.config.system_instruction += "\n\n" + new_text
-      else:
-        # Log warning for unsupported system_instruction types
-        logging.warning(
-            "Cannot append to system_instruction of unsupported type: %s. "
-            "Only string system_instruction is supported.",
-            type(self.config.system_instruction),
-        )
+      self._append_system_instruction_texts(instructions)
       return []
 
     # Invalid input
     raise TypeError("instructions must be list[str] or types.Content")
 
+  def _append_system_instruction_texts(self, texts: list[str]) -> None:
+    """Appends texts to the string system instruction, separated by \\n\\n."""
+    # Empty instructions (e.g. an instruction provider or template that
+    # rendered to nothing) would only add blank separators to the prompt.
+    texts = [text for text in texts if text]
+    if not texts:
+      return
+    system_instruction = self.config.system_instruction
+    if not system_instruction:
+      self.config.system_instruction = "\n\n".join(texts)
+    elif isinstance(system_instruction, str):
+      # Join everything in one pass: the system instruction grows with every
+      # processor that appends to it, so avoid copying it through temporaries.
+      self.config.system_instruction = "\n\n".join((system_instruction, *texts))
+    else:
+      # Log warning for unsupported system_instruction types
+      logging.warning(
+          "Cannot append to system_instruction of unsupported type: %s. "
+          "Only string system_instruction is supported.",
+          type(system_instruction),
+      )
+
   def append_tools(self, tools: list[BaseTool]) -> None:
     """Appends tools to the request.
 
@@ -34,6 +34,9 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+_llm_registry_patterns: dict[str, re.Pattern[str]] = {}
+"""Compiled form of each regex key in `_llm_registry_dict`."""
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -69,6 +72,9 @@ class LLMRegistry:
       )
 
     _llm_registry_dict[model_name_regex] = llm_cls
+    _llm_registry_patterns[model_name_regex] = re.compile(model_name_regex)
+    # Resolutions cached before this registration may now be stale.
+    LLMRegistry.resolve.cache_clear()
 
   @staticmethod
   def register(llm_cls: type[BaseLlm]):
@@ -96,7 +102,7 @@ class LLMRegistry:
     """
 
     for regex, llm_class in _llm_registry_dict.items():
-      if re.compile(regex).fullmatch(model):
+      if _llm_registry_patterns[regex].fullmatch(model):
         return llm_class
 
     raise ValueError(f'Model {model} not found.')
@@ -437,7 +437,7 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
         return self._config.content_formatter(content), False
       return _format_content(content, max_len=self._config.max_content_length)
     except Exception as e:
-      logging.warning(f"Content formatter failed: {e}")
+      logging.warning("Content formatter failed: %s", e)
       return "[FORMATTING FAILED]", False
 
   async def _ensure_init(self):
@@ -523,7 +523,7 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
           self._write_client.append_rows(iter([req]))
       ):
         if resp.error.code != 0:
-          logging.error(f"BQ Plugin: Write Error: {resp.error.message}")
+          logging.error("BQ Plugin: Write Error: %s", resp.error.message)
 
     except RuntimeError as e:
       if "Event loop is closed" not in str(e) and not self._is_shutting_down:
@@ -578,7 +578,7 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
 
     if self._background_tasks:
       logging.info(
-          f"BQ Plugin: Flushing {len(self._background_tasks)} pending logs..."
+          "BQ Plugin: Flushing %d pending logs...", len(self._background_tasks)
       )
       try:
         await asyncio.wait(
@@ -598,12 +598,12 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
             timeout=self._config.client_close_timeout,
         )
       except Exception as e:
-        logging.warning(f"BQ Plugin: Error closing write client: {e}")
+        logging.warning("BQ Plugin: Error closing write client: %s", e)
     if self._bq_client:
       try:
         self._bq_client.close()
       except Exception as e:
-        logging.warning(f"BQ Plugin: Error closing BQ client: {e}")
+        logging.warning("BQ Plugin: Error closing BQ client: %s", e)
 
     self._write_client = None
     self._bq_client = None
@@ -83,6 +83,6 @@ class ContextFilterPlugin(BasePlugin):
 
       llm_request.contents = contents
     except Exception as e:
-      logger.error(f"Failed to reduce context for request: {e}")
+      logger.error("Failed to reduce context for request: %s", e)
 
     return None
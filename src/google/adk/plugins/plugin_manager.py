@@ -84,6 +84,9 @@ class PluginManager:
       close_timeout: The timeout in seconds for each plugin's close method.
     """
     self.plugins: List[BasePlugin] = []
+    # Index of the registered plugins by name, so registration and lookups
+    # don't scan the whole plugin list.
+    self._plugins_by_name: dict[str, BasePlugin] = {}
     self._close_timeout = close_timeout
     if plugins:
       for plugin in plugins:
@@ -98,9 +101,10 @@ class PluginManager:
     Raises:
       ValueError: If a plugin with the same name is already registered.
     """
-    if any(p.name == plugin.name for p in self.plugins):
+    if plugin.name in self._plugins_by_name:
       raise ValueError(f"Plugin with name '{plugin.name}' already registered.")
     self.plugins.append(plugin)
+    self._plugins_by_name[plugin.name] = plugin
     logger.info("Plugin '%s' registered.", plugin.name)
 
   def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
@@ -112,7 +116,7 @@ class PluginManager:
     Returns:
       The plugin instance if found; otherwise, `None`.
     """
-    return next((p for p in self.plugins if p.name == plugin_name), None)
+    return self._plugins_by_name.get(plugin_name)
 
   async def run_on_user_message_callback(
       self,
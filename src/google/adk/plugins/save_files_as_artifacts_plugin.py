@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import copy
 import logging
 from typing import Optional
@@ -72,70 +73,107 @@ class SaveFilesAsArtifactsPlugin(BasePlugin):
     if not user_message.parts:
       return None
 
+    file_names = {
+        i: (
+            part.inline_data.display_name
+            or f'artifact_{invocation_context.invocation_id}_{i}'
+        )
+        for i, part in enumerate(user_message.parts)
+        if part.inline_data is not None
+    }
+    if not file_names:
+      return None
+
+    saves = [
+        self._save_part_as_artifact(
+            invocation_context=invocation_context,
+            index=i,
+            part=user_message.parts[i],
+            file_name=file_name,
+        )
+        for i, file_name in file_names.items()
+    ]
+    if len(set(file_names.values())) == len(file_names):
+      # Files with distinct names don't depend on each other, so upload them
+      # concurrently instead of blocking the user message on each in turn.
+      saved_parts = await asyncio.gather(*saves)
+    else:
+      # Files sharing a name must be saved in order so the last one wins.
+      saved_parts = [await save for save in saves]
+    replacements = dict(zip(file_names, saved_parts))
+
     new_parts = []
     modified = False
-
     for i, part in enumerate(user_message.parts):
-      if part.inline_data is None:
+      replacement = replacements.get(i)
+      if replacement is None:
         new_parts.append(part)
-        continue
-
-      try:
-        # Use display_name if available, otherwise generate a filename
-        inline_data = part.inline_data
-        file_name = inline_data.display_name
-        if not file_name:
-          file_name = f'artifact_{invocation_context.invocation_id}_{i}'
-          logger.info(
-              f'No display_name found, using generated filename: {file_name}'
-          )
-
-        # Store original filename for display to user/ placeholder
-        display_name = file_name
-
-        # Create a copy to stop mutation of the saved artifact if the original part is modified
-        version = await invocation_context.artifact_service.save_artifact(
-            app_name=invocation_context.app_name,
-            user_id=invocation_context.user_id,
-            session_id=invocation_context.session.id,
-            filename=file_name,
-            artifact=copy.copy(part),
-        )
+      else:
+        new_parts.extend(replacement)
+        modified = True
 
-        placeholder_part = types.Part(
-            text=f'[Uploaded Artifact: "{display_name}"]'
-        )
-        new_parts.append(placeholder_part)
+    if modified:
+      return types.Content(role=user_message.role, parts=new_parts)
+    else:
+      return None
 
-        file_part = await self._build_file_reference_part(
-            invocation_context=invocation_context,
-            filename=file_name,
-            version=version,
-            mime_type=inline_data.mime_type,
-            display_name=display_name,
+  async def _save_part_as_artifact(
+      self,
+      *,
+      invocation_context: InvocationContext,
+      index: int,
+      part: types.Part,
+      file_name: str,
+  ) -> Optional[list[types.Part]]:
+    """Saves a file part as an artifact and returns the parts replacing it.
+
+    Returns None if the artifact could not be saved, in which case the original
+    part is kept in the user message.
+    """
+    try:
+      inline_data = part.inline_data
+      if not inline_data.display_name:
+        logger.info(
+            'No display_name found, using generated filename: %s', file_name
         )
-        if file_part:
-          new_parts.append(file_part)
-        else:
-          logger.debug(
-              'Artifact %s is not exposed via a model-accessible URI; keeping'
-              ' inline data in user message.',
-              file_name,
-          )
-          new_parts.append(part)
 
-        modified = True
-        logger.info(f'Successfully saved artifact: {file_name}')
+      # Store original filename for display to user/ placeholder
+      display_name = file_name
+
+      # Create a copy to stop mutation of the saved artifact if the original part is modified
+      version = await invocation_context.artifact_service.save_artifact(
+          app_name=invocation_context.app_name,
+          user_id=invocation_context.user_id,
+          session_id=invocation_context.session.id,
+          filename=file_name,
+          artifact=copy.copy(part),
+      )
 
-      except Exception as e:
-        logger.error(f'Failed to save artifact for part {i}: {e}')
-        # Keep the original part if saving fails
+      new_parts = [types.Part(text=f'[Uploaded Artifact: "{display_name}"]')]
+
+      file_part = await self._build_file_reference_part(
+          invocation_context=invocation_context,
+          filename=file_name,
+          version=version,
+          mime_type=inline_data.mime_type,
+          display_name=display_name,
+      )
+      if file_part:
+        new_parts.append(file_part)
+      else:
+        logger.debug(
+            'Artifact %s is not exposed via a model-accessible URI; keeping'
+            ' inline data in user message.',
+            file_name,
+        )
         new_parts.append(part)
-        continue
 
-    if modified:
-      return types.Content(role=user_message.role, parts=new_parts)
-    else:
+      logger.info('Successfully saved artifact: %s', file_name)
+      return new_parts
+
+    except Exception as e:
+      logger.error('Failed to save artifact for part %s: %s', index, e)
+      # Keep the original part if saving fails
       return None
 
   async def _build_file_reference_part(
@@ -0,0 +1,118 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+from typing import Iterable
+from typing import Optional
+import uuid
+
+from google.genai import types
+
+from ..tools.base_tool import BaseTool
+from ..tools.tool_context import ToolContext
+from ..utils.feature_decorator import experimental
+from .base_plugin import BasePlugin
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+@experimental
+class ToolResultArtifactPlugin(BasePlugin):
+  """Saves large tool results as artifacts instead of inlining them.
+
+  Tool results are stored in the session and sent to the model with every
+  later request of the conversation. For tools that can return large payloads,
+  such as query results, this plugin saves results above `max_inline_bytes` as
+  JSON artifacts and replaces them with a short reference. Add the
+  `load_artifacts` tool to the agent, or load the artifact in your own tool, to
+  read the full result when it is needed.
+
+  Results that cannot be serialized to JSON are left unchanged.
+
+  Example:
+  ```python
+  runner = Runner(
+      ...,
+      artifact_service=InMemoryArtifactService(),
+      plugins=[ToolResultArtifactPlugin(tool_names=["execute_sql"])],
+  )
+  ```
+  """
+
+  def __init__(
+      self,
+      tool_names: Iterable[str],
+      name: str = "tool_result_artifact_plugin",
+      max_inline_bytes: int = 32 * 1024,
+  ):
+    """Initializes the ToolResultArtifactPlugin.
+
+    Args:
+      tool_names: Names of the tools whose large results are saved as
+        artifacts.
+      name: Plugin instance identifier.
+      max_inline_bytes: Size of the JSON-encoded result above which it is
+        saved as an artifact.
+    """
+    super().__init__(name)
+    if max_inline_bytes <= 0:
+      raise ValueError("max_inline_bytes must be a positive integer.")
+    self.tool_names = frozenset(tool_names)
+    self.max_inline_bytes = max_inline_bytes
+
+  async def after_tool_callback(
+      self,
+      *,
+      tool: BaseTool,
+      tool_args: dict[str, Any],
+      tool_context: ToolContext,
+      result: dict,
+  ) -> Optional[dict]:
+    """Replaces a large tool result with a reference to its artifact."""
+    if tool.name not in self.tool_names or result is None:
+      return None
+    try:
+      data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+    except (TypeError, ValueError):
+      return None
+    if len(data) <= self.max_inline_bytes:
+      return None
+
+    call_id = tool_context.function_call_id or uuid.uuid4().hex
+    filename = f"{tool.name}_result_{call_id}.json"
+    try:
+      await tool_context.save_artifact(
+          filename,
+          types.Part.from_bytes(data=data, mime_type="application/json"),
+      )
+    except ValueError as e:
+      logger.warning(
+          "Could not save the result of tool %s as an artifact: %s",
+          tool.name,
+          e,
+      )
+      return None
+
+    return {
+        "result_artifact": filename,
+        "result_size_bytes": len(data),
+        "message": (
+            "The result is too large to include inline and was saved as"
+            f" artifact `{filename}`. Load the artifact to read it."
+        ),
+    }
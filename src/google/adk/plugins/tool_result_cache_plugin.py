@@ -0,0 +1,219 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any
+from typing import Iterable
+from typing import Optional
+
+from google.genai import types
+from typing_extensions import override
+
+from ..agents.callback_context import CallbackContext
+from ..events.event_actions import EventActions
+from ..models.llm_request import LlmRequest
+from ..models.llm_response import LlmResponse
+from ..tools.base_tool import BaseTool
+from ..tools.tool_context import ToolContext
+from ..utils.feature_decorator import experimental
+from .base_plugin import BasePlugin
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Cache key: the tool name and the SHA-256 digest of its arguments serialized
+# as canonical JSON, so that large arguments are not kept in memory twice.
+_CacheKey = tuple[str, bytes]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@experimental
+class ToolResultCachePlugin(BasePlugin):
+  """Reuses the results of expensive, deterministic tool calls.
+
+  Some tools, such as natural-language-to-SQL generators, are slow and are
+  frequently called again with exactly the same arguments. This plugin keeps
+  the results of the configured tools in a process-local LRU cache and, on a
+  repeated call, returns the cached result instead of running the tool again.
+  Entries expire after `ttl_seconds`.
+
+  The configured tools are wrapped before each model request, so the cache
+  only ever sits in place of the tool's own `run_async`. Tool callbacks of
+  plugins and agents still run on every call, receive the wrapping tool, which
+  has the same name, and their responses are never cached.
+
+  Only results the tool produced without side effects are cached. Calls that
+  raise, request authentication, go through confirmation, update the state or
+  artifacts, or transfer or escalate are not cached, so that a repeated call
+  runs the tool again instead of replaying an incomplete response.
+
+  With `normalize_string_args`, string arguments are compared ignoring case
+  and surrounding or repeated whitespace, so trivially re-phrased natural
+  language questions share one cache entry.
+
+  Example:
+  ```python
+  runner = Runner(
+      ...,
+      plugins=[ToolResultCachePlugin(tool_names=["generate_sql"])],
+  )
+  ```
+  """
+
+  def __init__(
+      self,
+      tool_names: Iterable[str],
+      name: str = "tool_result_cache_plugin",
+      max_entries: int = 512,
+      ttl_seconds: float = 3600.0,
+      normalize_string_args: bool = False,
+  ):
+    """Initializes the ToolResultCachePlugin.
+
+    Args:
+      tool_names: Names of the tools whose results may be cached. Only list
+        tools whose result depends solely on their arguments.
+      name: Plugin instance identifier.
+      max_entries: Maximum number of cached results; the least recently used
+        entry is evicted first.
+      ttl_seconds: How long a cached result stays valid.
+      normalize_string_args: Whether to ignore case and whitespace differences
+        in string arguments when looking up cached results. Only enable this
+        for tools whose result does not depend on them.
+    """
+    super().__init__(name)
+    if max_entries <= 0:
+      raise ValueError("max_entries must be a positive integer.")
+    if ttl_seconds <= 0:
+      raise ValueError("ttl_seconds must be positive.")
+    self.tool_names = frozenset(tool_names)
+    self.max_entries = max_entries
+    self.ttl_seconds = ttl_seconds
+    self.normalize_string_args = normalize_string_args
+    self._cache: OrderedDict[_CacheKey, tuple[float, Any]] = OrderedDict()
+
+  async def before_model_callback(
+      self, *, callback_context: CallbackContext, llm_request: LlmRequest
+  ) -> Optional[LlmResponse]:
+    """Routes the calls of the configured tools through the cache."""
+    for tool_name in self.tool_names & llm_request.tools_dict.keys():
+      tool = llm_request.tools_dict[tool_name]
+      if not isinstance(tool, _CachingTool):
+        llm_request.tools_dict[tool_name] = _CachingTool(tool, self)
+    return None
+
+  async def _run_tool(
+      self,
+      tool: BaseTool,
+      args: dict[str, Any],
+      tool_context: ToolContext,
+  ) -> Any:
+    """Returns the cached result of the call, running the tool on a miss."""
+    key = _make_cache_key(
+        tool.name,
+        _normalize_string_args(args) if self.normalize_string_args else args,
+    )
+    if key is None:
+      return await tool.run_async(args=args, tool_context=tool_context)
+
+    entry = self._cache.get(key)
+    if entry is not None:
+      expires_at, result = entry
+      if time.monotonic() < expires_at:
+        self._cache.move_to_end(key)
+        logger.debug("Tool result cache hit for tool %s", tool.name)
+        return copy.deepcopy(result)
+      del self._cache[key]
+
+    result = await tool.run_async(args=args, tool_context=tool_context)
+    if (
+        result is None
+        or tool_context.tool_confirmation is not None
+        or _has_side_effects(tool_context.actions)
+    ):
+      return result
+
+    self._cache[key] = (
+        time.monotonic() + self.ttl_seconds,
+        copy.deepcopy(result),
+    )
+    while len(self._cache) > self.max_entries:
+      self._cache.popitem(last=False)
+    return result
+
+
+class _CachingTool(BaseTool):
+  """Runs a tool through the cache of a ToolResultCachePlugin."""
+
+  def __init__(self, tool: BaseTool, plugin: ToolResultCachePlugin):
+    super().__init__(
+        name=tool.name,
+        description=tool.description,
+        is_long_running=tool.is_long_running,
+        custom_metadata=tool.custom_metadata,
+    )
+    self._tool = tool
+    self._plugin = plugin
+
+  @override
+  def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+    return self._tool._get_declaration()
+
+  @override
+  async def run_async(
+      self, *, args: dict[str, Any], tool_context: ToolContext
+  ) -> Any:
+    return await self._plugin._run_tool(self._tool, args, tool_context)
+
+
+def _has_side_effects(actions: EventActions) -> bool:
+  """Whether a replayed result would drop what the tool call asked for."""
+  return bool(
+      actions.requested_auth_configs
+      or actions.requested_tool_confirmations
+      or actions.state_delta
+      or actions.artifact_delta
+      or actions.transfer_to_agent
+      or actions.escalate
+  )
+
+
+def _make_cache_key(
+    tool_name: str, tool_args: dict[str, Any]
+) -> Optional[_CacheKey]:
+  try:
+    serialized_args = json.dumps(tool_args, sort_keys=True)
+  except (TypeError, ValueError):
+    # Arguments that cannot be serialized are not cached.
+    return None
+  return tool_name, hashlib.sha256(serialized_args.encode("utf-8")).digest()
+
+
+def _normalize_string_args(value: Any) -> Any:
+  """Lowercases and collapses whitespace in all strings within `value`."""
+  if isinstance(value, str):
+    return _WHITESPACE_RE.sub(" ", value.strip()).lower()
+  if isinstance(value, dict):
+    return {k: _normalize_string_args(v) for k, v in value.items()}
+  if isinstance(value, list):
+    return [_normalize_string_args(v) for v in value]
+  return value
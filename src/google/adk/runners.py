@@ -15,8 +15,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
+import os
 from pathlib import Path
 import queue
 from typing import Any
@@ -58,6 +60,7 @@ from .plugins.plugin_manager import PluginManager
 from .sessions.base_session_service import BaseSessionService
 from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
+from .sessions.state import State
 from .telemetry.tracing import tracer
 from .tools.base_toolset import BaseToolset
 from .utils._debug_output import print_event
@@ -65,6 +68,40 @@ from .utils.context_utils import Aclosing
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# App- and user-scoped state is shared beyond a single session, so rewinding a
+# session never reverts it.
+_REWIND_SKIPPED_STATE_PREFIXES = (State.APP_PREFIX, State.USER_PREFIX)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_agent_origin(
+    agent_cls: type[BaseAgent], project_root: str
+) -> tuple[Optional[str], Optional[Path]]:
+  """Infers the app name and directory an agent class was loaded from.
+
+  Resolving the module path hits the filesystem once per path component, and
+  runners are constructed per request (e.g. by AgentTool), so the result is
+  cached per agent class and working directory.
+  """
+  module = inspect.getmodule(agent_cls)
+  if not module:
+    return None, None
+  module_file = getattr(module, '__file__', None)
+  if not module_file:
+    return None, None
+  module_path = Path(module_file).resolve()
+  try:
+    relative_path = module_path.relative_to(project_root)
+  except ValueError:
+    return None, module_path.parent
+  origin_dir = module_path.parent
+  if 'agents' not in relative_path.parts:
+    return None, origin_dir
+  origin_name = origin_dir.name
+  if origin_name.startswith('.'):
+    return None, origin_dir
+  return origin_name, origin_dir
+
 
 class Runner:
   """The Runner class is used to run agents.
@@ -227,25 +264,7 @@ class Runner:
   def _infer_agent_origin(
       self, agent: BaseAgent
   ) -> tuple[Optional[str], Optional[Path]]:
-    module = inspect.getmodule(agent.__class__)
-    if not module:
-      return None, None
-    module_file = getattr(module, '__file__', None)
-    if not module_file:
-      return None, None
-    module_path = Path(module_file).resolve()
-    project_root = Path.cwd()
-    try:
-      relative_path = module_path.relative_to(project_root)
-    except ValueError:
-      return None, module_path.parent
-    origin_dir = module_path.parent
-    if 'agents' not in relative_path.parts:
-      return None, origin_dir
-    origin_name = origin_dir.name
-    if origin_name.startswith('.'):
-      return None, origin_dir
-    return origin_name, origin_dir
+    return _resolve_agent_origin(agent.__class__, os.getcwd())
 
   def _enforce_app_name_alignment(self) -> None:
     origin_name = self._agent_origin_app_name
@@ -505,7 +524,7 @@ class Runner:
     for i in range(rewind_event_index):
       if session.events[i].actions.state_delta:
         for k, v in session.events[i].actions.state_delta.items():
-          if k.startswith('app:') or k.startswith('user:'):
+          if k.startswith(_REWIND_SKIPPED_STATE_PREFIXES):
             continue
           if v is None:
             state_at_rewind_point.pop(k, None)
@@ -524,7 +543,7 @@ class Runner:
     #    but not in state_at_rewind_point. These keys were added after the
     #    rewind point and need to be removed.
     for key in current_state:
-      if key.startswith('app:') or key.startswith('user:'):
+      if key.startswith(_REWIND_SKIPPED_STATE_PREFIXES):
         continue
       if key not in state_at_rewind_point:
         rewind_state_delta[key] = None
@@ -831,8 +850,6 @@ class Runner:
     # TODO(hangfei): switch to use canonical_tools.
     # for shell agents, there is no tools associated with it so we should skip.
     if hasattr(invocation_context.agent, 'tools'):
-      import inspect
-
       for tool in invocation_context.agent.tools:
         # We use `inspect.signature()` to examine the tool's underlying function (`tool.func`).
         # This approach is deliberately chosen over `typing.get_type_hints()` for robustness.
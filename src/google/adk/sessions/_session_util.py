@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Utility functions for session service."""
+
 from __future__ import annotations
 
+import copy
+import json
 from typing import Any
 from typing import Optional
 from typing import Type
@@ -23,6 +26,25 @@ from .state import State
 
 M = TypeVar("M")
 
+try:
+  # pydantic-core's compiled JSON parser is faster than json.loads on the
+  # state and content blobs read on every session load. It is only available
+  # from pydantic-core 2.14 on.
+  from pydantic_core import from_json as _from_json
+except ImportError:
+  _from_json = json.loads
+
+
+def decode_json(data: str | bytes) -> Any:
+  """Decodes a value stored as a JSON string, such as a state dictionary."""
+  try:
+    return _from_json(data)
+  except ValueError:
+    # from_json is stricter than json.loads, e.g. it rejects lone surrogate
+    # escapes that json.dumps writes. Anything json.dumps wrote must still
+    # load.
+    return json.loads(data)
+
 
 def decode_model(
     data: Optional[dict[str, Any]], model_cls: Type[M]
@@ -47,3 +69,19 @@ def extract_state_delta(
       elif not key.startswith(State.TEMP_PREFIX):
         deltas["session"][key] = state[key]
   return deltas
+
+
+def merge_state(
+    app_state: dict[str, Any],
+    user_state: dict[str, Any],
+    session_state: dict[str, Any],
+) -> dict[str, Any]:
+  """Merges app, user, and session states into a single state dictionary."""
+  merged_state = copy.deepcopy(session_state)
+  merged_state.update(
+      {State.APP_PREFIX + key: value for key, value in app_state.items()}
+  )
+  merged_state.update(
+      {State.USER_PREFIX + key: value for key, value in user_state.items()}
+  )
+  return merged_state
@@ -14,7 +14,6 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 from datetime import datetime
 from datetime import timezone
 import json
@@ -95,7 +94,8 @@ class DynamicJSON(TypeDecorator):
       if dialect.name == "postgresql":
         return value  # JSONB returns dict directly
       else:
-        return json.loads(value)  # Deserialize from JSON string for TEXT
+        # Deserialize from JSON string for TEXT
+        return _session_util.decode_json(value)
     return value
 
 
@@ -533,7 +533,7 @@ class DatabaseSessionService(BaseSessionService):
       await sql_session.refresh(storage_session)
 
       # Merge states for response
-      merged_state = _merge_state(
+      merged_state = _session_util.merge_state(
           storage_app_state.state, storage_user_state.state, session_state
       )
       session = storage_session.to_session(state=merged_state)
@@ -589,7 +589,9 @@ class DatabaseSessionService(BaseSessionService):
       session_state = storage_session.state
 
       # Merge states
-      merged_state = _merge_state(app_state, user_state, session_state)
+      merged_state = _session_util.merge_state(
+          app_state, user_state, session_state
+      )
 
       # Convert storage session to session
       events = [e.to_event() for e in reversed(storage_events)]
@@ -634,7 +636,9 @@ class DatabaseSessionService(BaseSessionService):
       for storage_session in results:
         session_state = storage_session.state
         user_state = user_states_map.get(storage_session.user_id, {})
-        merged_state = _merge_state(app_state, user_state, session_state)
+        merged_state = _session_util.merge_state(
+            app_state, user_state, session_state
+        )
         sessions.append(storage_session.to_session(state=merged_state))
       return ListSessionsResponse(sessions=sessions)
 
@@ -713,17 +717,3 @@ class DatabaseSessionService(BaseSessionService):
     # Also update the in-memory session
     await super().append_event(session=session, event=event)
     return event
-
-
-def _merge_state(
-    app_state: dict[str, Any],
-    user_state: dict[str, Any],
-    session_state: dict[str, Any],
-) -> dict[str, Any]:
-  """Merge app, user, and session states into a single state dictionary."""
-  merged_state = copy.deepcopy(session_state)
-  for key in app_state.keys():
-    merged_state[State.APP_PREFIX + key] = app_state[key]
-  for key in user_state.keys():
-    merged_state[State.USER_PREFIX + key] = user_state[key]
-  return merged_state
@@ -199,23 +199,19 @@ class InMemorySessionService(BaseSessionService):
   ) -> Session:
     """Merges app and user state into session state."""
     # Merge app state
-    if app_name in self.app_state:
-      for key in self.app_state[app_name].keys():
-        copied_session.state[State.APP_PREFIX + key] = self.app_state[app_name][
-            key
-        ]
+    if app_state := self.app_state.get(app_name):
+      copied_session.state.update(
+          {State.APP_PREFIX + key: value for key, value in app_state.items()}
+      )
 
-    if (
-        app_name not in self.user_state
-        or user_id not in self.user_state[app_name]
-    ):
+    user_state = self.user_state.get(app_name, {}).get(user_id)
+    if user_state is None:
       return copied_session
 
     # Merge session state with user state.
-    for key in self.user_state[app_name][user_id].keys():
-      copied_session.state[State.USER_PREFIX + key] = self.user_state[app_name][
-          user_id
-      ][key]
+    copied_session.state.update(
+        {State.USER_PREFIX + key: value for key, value in user_state.items()}
+    )
     return copied_session
 
   @override
@@ -295,19 +291,24 @@ class InMemorySessionService(BaseSessionService):
     user_id = session.user_id
     session_id = session.id
 
-    def _warning(message: str) -> None:
-      logger.warning(
-          f'Failed to append event to session {session_id}: {message}'
+    app_sessions = self.sessions.get(app_name)
+    if app_sessions is None:
+      _warn_append_event_failed(
+          session_id, f'app_name {app_name} not in sessions'
       )
-
-    if app_name not in self.sessions:
-      _warning(f'app_name {app_name} not in sessions')
       return event
-    if user_id not in self.sessions[app_name]:
-      _warning(f'user_id {user_id} not in sessions[app_name]')
+    user_sessions = app_sessions.get(user_id)
+    if user_sessions is None:
+      _warn_append_event_failed(
+          session_id, f'user_id {user_id} not in sessions[app_name]'
+      )
       return event
-    if session_id not in self.sessions[app_name][user_id]:
-      _warning(f'session_id {session_id} not in sessions[app_name][user_id]')
+    storage_session = user_sessions.get(session_id)
+    if storage_session is None:
+      _warn_append_event_failed(
+          session_id,
+          f'session_id {session_id} not in sessions[app_name][user_id]',
+      )
       return event
 
     # Update the in-memory session.
@@ -315,7 +316,6 @@ class InMemorySessionService(BaseSessionService):
     session.last_update_time = event.timestamp
 
     # Update the storage session
-    storage_session = self.sessions[app_name][user_id].get(session_id)
     storage_session.events.append(event)
     storage_session.last_update_time = event.timestamp
 
@@ -336,3 +336,9 @@ class InMemorySessionService(BaseSessionService):
         storage_session.state.update(session_state_delta)
 
     return event
+
+
+def _warn_append_event_failed(session_id: str, message: str) -> None:
+  logger.warning(
+      'Failed to append event to session %s: %s', session_id, message
+  )
@@ -14,7 +14,6 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-import copy
 import json
 import logging
 import os
@@ -34,7 +33,6 @@ from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
 from .base_session_service import ListSessionsResponse
 from .session import Session
-from .state import State
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -175,7 +173,7 @@ class SqliteSessionService(BaseSessionService):
       await db.commit()
 
       # Merge states for response
-      merged_state = _merge_state(
+      merged_state = _session_util.merge_state(
           storage_app_state, storage_user_state, session_state
       )
       return Session(
@@ -205,7 +203,7 @@ class SqliteSessionService(BaseSessionService):
         session_row = await cursor.fetchone()
         if session_row is None:
           return None
-        session_state = json.loads(session_row["state"])
+        session_state = _session_util.decode_json(session_row["state"])
         last_update_time = session_row["update_time"]
 
       # Build events query
@@ -233,7 +231,9 @@ class SqliteSessionService(BaseSessionService):
       user_state = await self._get_user_state(db, app_name, user_id)
 
       # Merge states
-      merged_state = _merge_state(app_state, user_state, session_state)
+      merged_state = _session_util.merge_state(
+          app_state, user_state, session_state
+      )
 
       # Deserialize events and reverse to chronological order
       events = [
@@ -285,14 +285,18 @@ class SqliteSessionService(BaseSessionService):
             (app_name,),
         ) as cursor:
           async for row in cursor:
-            user_states_map[row["user_id"]] = json.loads(row["state"])
+            user_states_map[row["user_id"]] = _session_util.decode_json(
+                row["state"]
+            )
 
       # Build session list
       for row in session_rows:
         session_user_id = row["user_id"]
-        session_state = json.loads(row["state"])
+        session_state = _session_util.decode_json(row["state"])
         user_state = user_states_map.get(session_user_id, {})
-        merged_state = _merge_state(app_state, user_state, session_state)
+        merged_state = _session_util.merge_state(
+            app_state, user_state, session_state
+        )
         sessions_list.append(
             Session(
                 app_name=app_name,
@@ -418,7 +422,7 @@ class SqliteSessionService(BaseSessionService):
     """Fetches and deserializes a JSON state column from a single row."""
     async with db.execute(query, params) as cursor:
       row = await cursor.fetchone()
-      return json.loads(row["state"]) if row else {}
+      return _session_util.decode_json(row["state"]) if row else {}
 
   async def _get_app_state(
       self, db: aiosqlite.Connection, app_name: str
@@ -527,13 +531,3 @@ class SqliteSessionService(BaseSessionService):
       raise RuntimeError(
           f"Error accessing database {self._db_path}: {e}"
       ) from e
-
-
-def _merge_state(app_state, user_state, session_state):
-  """Merges app, user, and session states into a single dictionary."""
-  merged_state = copy.deepcopy(session_state)
-  for key, value in app_state.items():
-    merged_state[State.APP_PREFIX + key] = value
-  for key, value in user_state.items():
-    merged_state[State.USER_PREFIX + key] = value
-  return merged_state
@@ -16,10 +16,17 @@ from __future__ import annotations
 
 from typing import Any
 
+# Sentinel for lookups where None is a valid state value.
+_MISSING = object()
+
 
 class State:
   """A state dict that maintains the current value and the pending-commit delta."""
 
+  # A State is created for every callback and tool context, so skip the
+  # per-instance __dict__.
+  __slots__ = ("_value", "_delta")
+
   APP_PREFIX = "app:"
   USER_PREFIX = "user:"
   TEMP_PREFIX = "temp:"
@@ -35,8 +42,9 @@ class State:
 
   def __getitem__(self, key: str) -> Any:
     """Returns the value of the state dict for the given key."""
-    if key in self._delta:
-      return self._delta[key]
+    value = self._delta.get(key, _MISSING)
+    if value is not _MISSING:
+      return value
     return self._value[key]
 
   def __setitem__(self, key: str, value: Any):
@@ -52,11 +60,11 @@ class State:
 
   def setdefault(self, key: str, default: Any = None) -> Any:
     """Gets the value of a key, or sets it to a default if the key doesn't exist."""
-    if key in self:
-      return self[key]
-    else:
+    value = self.get(key, _MISSING)
+    if value is _MISSING:
       self[key] = default
       return default
+    return value
 
   def has_delta(self) -> bool:
     """Whether the state has pending delta."""
@@ -64,9 +72,10 @@ class State:
 
   def get(self, key: str, default: Any = None) -> Any:
     """Returns the value of the state dict for the given key."""
-    if key not in self:
-      return default
-    return self[key]
+    value = self._delta.get(key, _MISSING)
+    if value is not _MISSING:
+      return value
+    return self._value.get(key, default)
 
   def update(self, delta: dict[str, Any]):
     """Updates the state dict with the given delta."""
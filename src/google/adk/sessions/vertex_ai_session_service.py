@@ -15,7 +15,6 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import json
 import logging
 import re
 from typing import Any
@@ -254,7 +253,7 @@ class VertexAiSessionService(BaseSessionService):
           'transfer_agent': event.actions.transfer_to_agent,
           'escalate': event.actions.escalate,
           'requested_auth_configs': {
-              k: json.loads(v.model_dump_json(exclude_none=True, by_alias=True))
+              k: v.model_dump(exclude_none=True, by_alias=True, mode='json')
               for k, v in event.actions.requested_auth_configs.items()
           },
           # TODO: add requested_tool_confirmations, compaction, agent_state once
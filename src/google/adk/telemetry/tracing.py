@@ -64,6 +64,12 @@ tracer = trace.get_tracer(
 )
 
 
+# Trace payloads are serialized several times per agent step.
+_TRACE_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, default=lambda o: '<not serializable>'
+)
+
+
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
 
@@ -76,9 +82,7 @@ def _safe_json_serialize(obj) -> str:
 
   try:
     # Try direct JSON serialization first
-    return json.dumps(
-        obj, ensure_ascii=False, default=lambda o: '<not serializable>'
-    )
+    return _TRACE_JSON_ENCODER.encode(obj)
   except (TypeError, OverflowError):
     return '<not serializable>'
 
@@ -129,6 +133,10 @@ def trace_tool_call(
     function_response_event: The event with the function response details.
   """
   span = trace.get_current_span()
+  # Without a configured tracer provider the span records nothing, so skip
+  # serializing the tool args and response.
+  if not span.is_recording():
+    return
 
   span.set_attribute(GEN_AI_OPERATION_NAME, 'execute_tool')
 
@@ -197,6 +205,8 @@ def trace_merged_tool_calls(
   """
 
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
 
   span.set_attribute(GEN_AI_OPERATION_NAME, 'execute_tool')
   span.set_attribute(GEN_AI_TOOL_NAME, '(merged tools)')
@@ -206,14 +216,13 @@ def trace_merged_tool_calls(
   # TODO(b/441461932): See if these are still necessary
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
-
   if _should_add_request_response_to_spans():
+    try:
+      function_response_event_json = function_response_event.model_dumps_json(
+          exclude_none=True
+      )
+    except Exception:  # pylint: disable=broad-exception-caught
+      function_response_event_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.tool_response',
         function_response_event_json,
@@ -247,6 +256,8 @@ def trace_call_llm(
     llm_response: The LLM response object.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -258,8 +269,9 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  add_request_response = _should_add_request_response_to_spans()
   # Consider removing once GenAI SDK provides a way to record this info.
-  if _should_add_request_response_to_spans():
+  if add_request_response:
     span.set_attribute(
         'gcp.vertex.agent.llm_request',
         _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
@@ -279,12 +291,12 @@ def trace_call_llm(
           llm_request.config.max_output_tokens,
       )
 
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
-
-  if _should_add_request_response_to_spans():
+  if add_request_response:
+    # Only serialize the response when it is actually recorded.
+    try:
+      llm_response_json = llm_response.model_dump_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      llm_response_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.llm_response',
         llm_response_json,
@@ -329,6 +341,8 @@ def trace_send_data(
     data: A list of content objects.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
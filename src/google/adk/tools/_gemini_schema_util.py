@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 from typing import Optional
@@ -32,6 +33,19 @@ class _ExtendedJSONSchema(JSONSchema):
   )
 
 
+# Field names recognised by `_sanitize_schema_formats_for_gemini`, built once
+# rather than on every recursive call.
+# Gemini rejects schemas that include `additionalProperties`, so drop it.
+_SUPPORTED_FIELDS: frozenset[str] = frozenset(
+    _ExtendedJSONSchema.model_fields
+) - {"additional_properties"}
+_SCHEMA_FIELD_NAMES: frozenset[str] = frozenset({"items"})
+_LIST_SCHEMA_FIELD_NAMES: frozenset[str] = frozenset({
+    "any_of",  # 'one_of', 'all_of', 'not' to come
+})
+_DICT_SCHEMA_FIELD_NAMES: frozenset[str] = frozenset({"properties", "defs"})
+
+
 def _to_snake_case(text: str) -> str:
   """Converts a string into snake_case.
 
@@ -74,6 +88,16 @@ def _to_snake_case(text: str) -> str:
   return text
 
 
+@functools.lru_cache(maxsize=256)
+def _schema_key_to_snake_case(key: str) -> str:
+  """Cached `_to_snake_case` for JSON schema keys.
+
+  Schema keys come from a small, fixed vocabulary (`type`, `anyOf`,
+  `maxLength`, ...), so each distinct key is only converted once.
+  """
+  return _to_snake_case(key)
+
+
 def _dereference_schema(schema: dict[str, Any]) -> dict[str, Any]:
   """Resolves $ref pointers in a JSON schema."""
 
@@ -116,29 +140,18 @@ def _sanitize_schema_formats_for_gemini(
     schema: dict[str, Any],
 ) -> dict[str, Any]:
   """Filters the schema to only include fields that are supported by JSONSchema."""
-  supported_fields: set[str] = set(_ExtendedJSONSchema.model_fields.keys())
-  # Gemini rejects schemas that include `additionalProperties`, so drop it.
-  supported_fields.discard("additional_properties")
-  schema_field_names: set[str] = {"items"}
-  list_schema_field_names: set[str] = {
-      "any_of",  # 'one_of', 'all_of', 'not' to come
-  }
   snake_case_schema = {}
-  dict_schema_field_names: tuple[str, ...] = (
-      "properties",
-      "defs",
-  )
   for field_name, field_value in schema.items():
-    field_name = _to_snake_case(field_name)
-    if field_name in schema_field_names:
+    field_name = _schema_key_to_snake_case(field_name)
+    if field_name in _SCHEMA_FIELD_NAMES:
       snake_case_schema[field_name] = _sanitize_schema_formats_for_gemini(
           field_value
       )
-    elif field_name in list_schema_field_names:
+    elif field_name in _LIST_SCHEMA_FIELD_NAMES:
       snake_case_schema[field_name] = [
           _sanitize_schema_formats_for_gemini(value) for value in field_value
       ]
-    elif field_name in dict_schema_field_names and field_value is not None:
+    elif field_name in _DICT_SCHEMA_FIELD_NAMES and field_value is not None:
       snake_case_schema[field_name] = {
           key: _sanitize_schema_formats_for_gemini(value)
           for key, value in field_value.items()
@@ -155,7 +168,7 @@ def _sanitize_schema_formats_for_gemini(
           (current_type == "string" and field_value in ("date-time", "enum"))
       ):
         snake_case_schema[field_name] = field_value
-    elif field_name in supported_fields and field_value is not None:
+    elif field_name in _SUPPORTED_FIELDS and field_value is not None:
       snake_case_schema[field_name] = field_value
 
   # If the schema is empty, assume it has the type of object
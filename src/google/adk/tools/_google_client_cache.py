@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import TypeVar
+
+import google.auth.credentials
+import google.oauth2.credentials
+
+_ClientT = TypeVar("_ClientT")
+
+
+class GoogleClientCache(Generic[_ClientT]):
+  """Shares Google Cloud clients between tool calls with the same credentials.
+
+  Each client owns its own connections, so tool calls made with the same
+  credentials object (e.g. service account or application default
+  credentials) reuse one client instead of reconnecting every time.
+  Credentials are compared by identity. User OAuth credentials are rebuilt
+  from the session state on every tool call, so clients for them are never
+  cached. The least recently used client is closed when it is evicted.
+  """
+
+  def __init__(self, maxsize: int = 16):
+    self._maxsize = maxsize
+    self._clients: OrderedDict[tuple[Any, ...], _ClientT] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get_or_create(
+      self,
+      credentials: google.auth.credentials.Credentials,
+      key: tuple[Any, ...],
+      create_client: Callable[[], _ClientT],
+  ) -> _ClientT:
+    """Returns the shared client for the credentials and key.
+
+    Args:
+      credentials: The credentials the client is created with.
+      key: The other client arguments, such as the project.
+      create_client: Creates the client if there is no shared one.
+
+    Returns:
+      The shared client, or a new unshared one for user OAuth credentials.
+    """
+    if isinstance(credentials, google.oauth2.credentials.Credentials):
+      return create_client()
+
+    key = (credentials, *key)
+    with self._lock:
+      client = self._clients.get(key)
+      if client is not None:
+        self._clients.move_to_end(key)
+        return client
+      client = self._clients[key] = create_client()
+      if len(self._clients) > self._maxsize:
+        _, evicted_client = self._clients.popitem(last=False)
+        evicted_client.close()
+      return client
+
+  def clear(self) -> None:
+    """Closes and drops all shared clients."""
+    with self._lock:
+      clients = list(self._clients.values())
+      self._clients.clear()
+    for client in clients:
+      client.close()
@@ -140,11 +140,7 @@ class AgentTool(BaseTool):
         plugins=list(tool_context._invocation_context.plugin_manager.plugins),
     )
 
-    state_dict = {
-        k: v
-        for k, v in tool_context.state.to_dict().items()
-        if not k.startswith('_adk')  # Filter out adk internal states
-    }
+    state_dict = self._get_forwarded_state(tool_context)
     session = await runner.session_service.create_session(
         app_name=child_app_name,
         user_id=tool_context._invocation_context.user_id,
@@ -179,6 +175,15 @@ class AgentTool(BaseTool):
       tool_result = merged_text
     return tool_result
 
+  def _get_forwarded_state(self, tool_context: ToolContext) -> dict[str, Any]:
+    """Returns the parent state to seed the agent tool's session with."""
+    # to_dict() already returns a fresh copy, so drop the ADK internal states
+    # from it rather than copying the whole state a second time.
+    state_dict = tool_context.state.to_dict()
+    for key in [key for key in state_dict if key.startswith('_adk')]:
+      del state_dict[key]
+    return state_dict
+
   @override
   @classmethod
   def from_config(
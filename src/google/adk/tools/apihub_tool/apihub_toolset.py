@@ -14,6 +14,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import time
 from typing import List
 from typing import Optional
 from typing import Union
@@ -31,6 +35,8 @@ from ..openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
 from ..openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 from .clients.apihub_client import APIHubClient
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 
 class APIHubToolset(BaseToolset):
   """APIHubTool generates tools from a given API Hub resource.
@@ -73,6 +79,7 @@ class APIHubToolset(BaseToolset):
       # Optionally, you can provide a custom API Hub client
       apihub_client: Optional[APIHubClient] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      spec_refresh_interval_seconds: Optional[float] = None,
   ):
     """Initializes the APIHubTool with the given parameters.
 
@@ -130,18 +137,26 @@ class APIHubToolset(BaseToolset):
         tool_filter: The filter used to filter the tools in the toolset. It can
           be either a tool predicate or a list of tool names of the tools to
           expose.
+        spec_refresh_interval_seconds: If set, the spec is fetched again when
+          tools are requested more than this many seconds after the last
+          fetch, and the tools are regenerated if the spec changed. By
+          default the spec is fetched only once.
     """
     super().__init__(tool_filter=tool_filter)
     self.name = name
     self.description = description
     self._apihub_resource_name = apihub_resource_name
     self._lazy_load_spec = lazy_load_spec
+    self._spec_refresh_interval_seconds = spec_refresh_interval_seconds
     self._apihub_client = apihub_client or APIHubClient(
         access_token=access_token,
         service_account_json=service_account_json,
     )
 
     self._openapi_toolset = None
+    self._spec_fingerprint: Optional[str] = None
+    self._spec_fetched_at = 0.0
+    self._spec_lock = asyncio.Lock()
     self._auth_scheme = auth_scheme
     self._auth_credential = auth_credential
 
@@ -157,16 +172,39 @@ class APIHubToolset(BaseToolset):
     Returns:
         A list of all available RestApiTool objects.
     """
-    if not self._openapi_toolset:
-      self._prepare_toolset()
+    if not self._openapi_toolset or self._is_spec_refresh_due():
+      # Concurrent callers wait for a single fetch instead of each starting
+      # their own.
+      async with self._spec_lock:
+        if not self._openapi_toolset:
+          # Fetching the spec is a blocking network call, keep it off the
+          # event loop so that other sessions are not stalled while it loads.
+          await asyncio.to_thread(self._prepare_toolset)
+        elif self._is_spec_refresh_due():
+          try:
+            await asyncio.to_thread(self._prepare_toolset)
+          except Exception as e:  # pylint: disable=broad-except
+            logger.warning(
+                'Failed to refresh spec %s, keeping the current tools: %s',
+                self._apihub_resource_name,
+                e,
+            )
     if not self._openapi_toolset:
       return []
     return await self._openapi_toolset.get_tools(readonly_context)
 
   def _prepare_toolset(self) -> None:
     """Fetches the spec from API Hub and generates the toolset."""
+    # Start the refresh interval before fetching, so that a failing fetch is
+    # retried once per interval rather than on every call.
+    self._spec_fetched_at = time.monotonic()
     # For each API, get the first version and the first spec of that version.
     spec_str = self._apihub_client.get_spec_content(self._apihub_resource_name)
+    # Parsing the spec and generating the tools is much more expensive than
+    # fetching it, so keep the current tools while the spec is unchanged.
+    spec_fingerprint = hashlib.sha256(spec_str.encode()).hexdigest()
+    if self._openapi_toolset and spec_fingerprint == self._spec_fingerprint:
+      return
     spec_dict = yaml.safe_load(spec_str)
     if not spec_dict:
       return
@@ -183,6 +221,14 @@ class APIHubToolset(BaseToolset):
         auth_scheme=self._auth_scheme,
         tool_filter=self.tool_filter,
     )
+    self._spec_fingerprint = spec_fingerprint
+
+  def _is_spec_refresh_due(self) -> bool:
+    return (
+        self._spec_refresh_interval_seconds is not None
+        and time.monotonic() - self._spec_fetched_at
+        > self._spec_refresh_interval_seconds
+    )
 
   @override
   async def close(self):
@@ -104,11 +104,12 @@ class IntegrationClient:
     except google.auth.exceptions.DefaultCredentialsError as e:
       raise PermissionError(f"Credentials error: {e}") from e
     except requests.exceptions.RequestException as e:
+      msg = str(e)
       if (
-          "404" in str(e)
-          or "Not found" in str(e)
-          or "400" in str(e)
-          or "Bad request" in str(e)
+          "404" in msg
+          or "Not found" in msg
+          or "400" in msg
+          or "Bad request" in msg
       ):
         raise ValueError(
             "Invalid request. Please check the provided values of"
@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-import inspect
 import logging
 from typing import Any
 from typing import Callable
@@ -100,8 +99,9 @@ class AuthenticatedFunctionTool(FunctionTool):
       tool_context: ToolContext,
       credential: AuthCredential,
   ) -> Any:
-    args_to_call = args.copy()
-    signature = inspect.signature(self.func)
-    if "credential" in signature.parameters:
-      args_to_call["credential"] = credential
+    # FunctionTool.run_async never mutates its args, so only copy when a
+    # credential has to be injected.
+    args_to_call = args
+    if "credential" in self._signature.parameters:
+      args_to_call = {**args, "credential": credential}
     return await super().run_async(args=args_to_call, tool_context=tool_context)
@@ -180,12 +180,14 @@ class BaseToolset(ABC):
     if not self.tool_filter:
       return True
 
-    if isinstance(self.tool_filter, ToolPredicate):
-      return self.tool_filter(tool, readonly_context)
-
+    # Check for a list first: isinstance() against the runtime-checkable
+    # ToolPredicate protocol is far slower than a plain type check.
     if isinstance(self.tool_filter, list):
       return tool.name in self.tool_filter
 
+    if isinstance(self.tool_filter, ToolPredicate):
+      return self.tool_filter(tool, readonly_context)
+
     return False
 
   async def process_llm_request(
@@ -27,10 +27,45 @@ definition. The rationales to have customized tool are:
    execute_sql can't arbitrarily mutate existing data.
 """
 
-from .bigquery_credentials import BigQueryCredentialsConfig
-from .bigquery_toolset import BigQueryToolset
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .bigquery_credentials import BigQueryCredentialsConfig
+  from .bigquery_toolset import BigQueryToolset
+
+# BigQueryToolset pulls in the google-cloud-bigquery client libraries, so it is
+# only imported on first access. This keeps imports of the lightweight config
+# and credentials modules in this package cheap.
+_LAZY_MAPPING = {
+    "BigQueryToolset": (".bigquery_toolset", "BigQueryToolset"),
+    "BigQueryCredentialsConfig": (
+        ".bigquery_credentials",
+        "BigQueryCredentialsConfig",
+    ),
+}
 
 __all__ = [
     "BigQueryToolset",
     "BigQueryCredentialsConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+  """Lazy loads BigQuery tools to avoid expensive imports."""
+  if name not in _LAZY_MAPPING:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  module_path, attr_name = _LAZY_MAPPING[name]
+  module = importlib.import_module(module_path, __name__)
+  attr = getattr(module, attr_name)
+  globals()[name] = attr
+  return attr
+
+
+# __dir__ is used to expose all public interfaces to keep mocking with autoscope
+# working.
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
@@ -21,6 +21,7 @@ from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from ... import version
+from .._google_client_cache import GoogleClientCache
 
 USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 
@@ -28,6 +29,8 @@ USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 from typing import List
 from typing import Union
 
+_client_cache: GoogleClientCache[bigquery.Client] = GoogleClientCache()
+
 
 def get_bigquery_client(
     *,
@@ -55,15 +58,27 @@ def get_bigquery_client(
     else:
       user_agents.extend([ua for ua in user_agent if ua])
 
-  client_info = google.api_core.client_info.ClientInfo(
-      user_agent=" ".join(user_agents)
+  client_user_agent = " ".join(user_agents)
+  return _client_cache.get_or_create(
+      credentials,
+      (project, location, client_user_agent),
+      lambda: _create_bigquery_client(
+          project, credentials, location, client_user_agent
+      ),
   )
 
-  bigquery_client = bigquery.Client(
+
+def _create_bigquery_client(
+    project: Optional[str],
+    credentials: Credentials,
+    location: Optional[str],
+    user_agent: str,
+) -> bigquery.Client:
+  client_info = google.api_core.client_info.ClientInfo(user_agent=user_agent)
+
+  return bigquery.Client(
       project=project,
       credentials=credentials,
       location=location,
       client_info=client_info,
   )
-
-  return bigquery_client
@@ -26,6 +26,7 @@ from google.cloud import bigquery
 
 from . import client
 from ..tool_context import ToolContext
+from ...utils.json_utils import JSON_SCALAR_TYPES
 from .config import BigQueryToolConfig
 from .config import WriteMode
 
@@ -72,6 +73,9 @@ def _execute_sql(
     if caller_id:
       bq_job_labels["adk-bigquery-tool"] = caller_id
 
+    # Dry run of the query, if one was needed to validate it
+    dry_run_query_job = None
+
     if not settings or settings.write_mode == WriteMode.BLOCKED:
       dry_run_query_job = bq_client.query(
           query,
@@ -138,18 +142,24 @@ def _execute_sql(
             ),
         }
 
-    # Return the dry run characteristics of the query if requested
+    # Return the dry run characteristics of the query if requested. The
+    # validation dry run above used the same job config, so reuse it rather
+    # than making another round trip to BigQuery.
     if dry_run:
-      dry_run_job = bq_client.query(
-          query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
-              dry_run=True,
-              connection_properties=bq_connection_properties,
-              labels=bq_job_labels,
-          ),
-      )
-      return {"status": "SUCCESS", "dry_run_info": dry_run_job.to_api_repr()}
+      if dry_run_query_job is None:
+        dry_run_query_job = bq_client.query(
+            query,
+            project=project_id,
+            job_config=bigquery.QueryJobConfig(
+                dry_run=True,
+                connection_properties=bq_connection_properties,
+                labels=bq_job_labels,
+            ),
+        )
+      return {
+          "status": "SUCCESS",
+          "dry_run_info": dry_run_query_job.to_api_repr(),
+      }
 
     # Finally execute the query, fetch the result, and return it
     job_config = bigquery.QueryJobConfig(
@@ -167,12 +177,18 @@ def _execute_sql(
     rows = []
     for row in row_iterator:
       row_values = {}
-      for key, val in row.items():
-        try:
-          # if the json serialization of the value succeeds, use it as is
-          json.dumps(val)
-        except:
-          val = str(val)
+      # Row.items() deep-copies every value it yields; the row is discarded
+      # right after conversion, so read the values by key instead.
+      for key in row.keys():
+        val = row[key]
+        # Most column values are JSON scalars already, so only probe the rest
+        # with a trial serialization.
+        if not isinstance(val, JSON_SCALAR_TYPES):
+          try:
+            # if the json serialization of the value succeeds, use it as is
+            json.dumps(val)
+          except:
+            val = str(val)
         row_values[key] = val
       rows.append(row_values)
 
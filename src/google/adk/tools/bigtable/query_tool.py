@@ -25,6 +25,7 @@ from google.cloud import bigtable
 
 from . import client
 from ..tool_context import ToolContext
+from ...utils.json_utils import JSON_SCALAR_TYPES
 from .settings import BigtableToolSettings
 
 DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS = 50
@@ -94,12 +95,17 @@ def execute_sql(
           truncated = True
           break
         row_values = {}
-        for key, val in dict(row.fields).items():
-          try:
-            # if the json serialization of the value succeeds, use it as is
-            json.dumps(val)
-          except:
-            val = str(val)
+        # `fields` is already a list of (name, value) pairs, so iterate it
+        # directly rather than materializing an intermediate dict per row.
+        for key, val in row.fields:
+          # Most column values are JSON scalars already, so only probe the
+          # rest with a trial serialization.
+          if not isinstance(val, JSON_SCALAR_TYPES):
+            try:
+              # if the json serialization of the value succeeds, use it as is
+              json.dumps(val)
+            except:
+              val = str(val)
           row_values[key] = val
         rows.append(row_values)
         counter -= 1
@@ -30,6 +30,15 @@ from .base_computer import ComputerState
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Coordinate arguments of computer control functions, mapped to the screen
+# axis (0 for width, 1 for height) they are normalized along.
+_COORDINATE_ARG_AXES = {
+    "x": 0,
+    "y": 1,
+    "destination_x": 0,
+    "destination_y": 1,
+}
+
 
 @experimental
 class ComputerUseTool(FunctionTool):
@@ -83,23 +92,25 @@ class ComputerUseTool(FunctionTool):
     if virtual_screen_size[0] <= 0 or virtual_screen_size[1] <= 0:
       raise ValueError("virtual_screen_size dimensions must be positive")
 
-  def _normalize_x(self, x: int) -> int:
-    """Normalize x coordinate from virtual screen space to actual screen width."""
-    if not isinstance(x, (int, float)):
-      raise ValueError(f"x coordinate must be numeric, got {type(x)}")
+  def _normalize_coordinate(self, value: int, axis: int) -> int:
+    """Normalize a coordinate from virtual screen space to the actual screen."""
+    if not isinstance(value, (int, float)):
+      raise ValueError(
+          f"{'xy'[axis]} coordinate must be numeric, got {type(value)}"
+      )
 
-    normalized = int(x / self._coordinate_space[0] * self._screen_size[0])
+    screen_size = self._screen_size[axis]
+    normalized = int(value / self._coordinate_space[axis] * screen_size)
     # Clamp to screen bounds
-    return max(0, min(normalized, self._screen_size[0] - 1))
+    return max(0, min(normalized, screen_size - 1))
+
+  def _normalize_x(self, x: int) -> int:
+    """Normalize x coordinate from virtual screen space to actual screen width."""
+    return self._normalize_coordinate(x, 0)
 
   def _normalize_y(self, y: int) -> int:
     """Normalize y coordinate from virtual screen space to actual screen height."""
-    if not isinstance(y, (int, float)):
-      raise ValueError(f"y coordinate must be numeric, got {type(y)}")
-
-    normalized = int(y / self._coordinate_space[1] * self._screen_size[1])
-    # Clamp to screen bounds
-    return max(0, min(normalized, self._screen_size[1] - 1))
+    return self._normalize_coordinate(y, 1)
 
   @override
   async def run_async(
@@ -108,35 +119,23 @@ class ComputerUseTool(FunctionTool):
     """Run the computer control function with normalized coordinates."""
 
     try:
-      # Normalize coordinates if present
-      if "x" in args:
-        original_x = args["x"]
-        args["x"] = self._normalize_x(args["x"])
-        logger.debug("Normalized x: %s -> %s", original_x, args["x"])
-
-      if "y" in args:
-        original_y = args["y"]
-        args["y"] = self._normalize_y(args["y"])
-        logger.debug("Normalized y: %s -> %s", original_y, args["y"])
-
-      # Handle destination coordinates for drag and drop
-      if "destination_x" in args:
-        original_dest_x = args["destination_x"]
-        args["destination_x"] = self._normalize_x(args["destination_x"])
-        logger.debug(
-            "Normalized destination_x: %s -> %s",
-            original_dest_x,
-            args["destination_x"],
-        )
-
-      if "destination_y" in args:
-        original_dest_y = args["destination_y"]
-        args["destination_y"] = self._normalize_y(args["destination_y"])
-        logger.debug(
-            "Normalized destination_y: %s -> %s",
-            original_dest_y,
-            args["destination_y"],
-        )
+      # Normalize coordinates (including drag and drop destinations) if
+      # present. The caller's args are copied only when a coordinate needs
+      # rewriting.
+      normalized_args = args
+      for arg_name, axis in _COORDINATE_ARG_AXES.items():
+        if arg_name in args:
+          original = args[arg_name]
+          if normalized_args is args:
+            normalized_args = args.copy()
+          normalized_args[arg_name] = self._normalize_coordinate(original, axis)
+          logger.debug(
+              "Normalized %s: %s -> %s",
+              arg_name,
+              original,
+              normalized_args[arg_name],
+          )
+      args = normalized_args
 
       # Execute the actual computer control function
       result = await super().run_async(args=args, tool_context=tool_context)
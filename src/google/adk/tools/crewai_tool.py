@@ -83,7 +83,7 @@ class CrewaiTool(FunctionTool):
     # Preprocess arguments (includes Pydantic model conversion)
     args_to_call = self._preprocess_args(args)
 
-    signature = inspect.signature(self.func)
+    signature = self._signature
     valid_params = {param for param in signature.parameters}
 
     # Check if function accepts **kwargs
@@ -95,11 +95,14 @@ class CrewaiTool(FunctionTool):
     if has_kwargs:
       # For functions with **kwargs, we pass all arguments. We defensively
       # remove arguments like `self` that are managed by the framework and not
-      # intended to be passed through **kwargs.
-      args_to_call.pop('self', None)
-      # We also remove `tool_context` that might have been passed in `args`,
-      # as it will be explicitly injected later if it's a valid parameter.
-      args_to_call.pop('tool_context', None)
+      # intended to be passed through **kwargs. We also remove `tool_context`
+      # that might have been passed in `args`, as it will be explicitly
+      # injected later if it's a valid parameter.
+      args_to_call = {
+          k: v
+          for k, v in args_to_call.items()
+          if k not in ('self', 'tool_context')
+      }
     else:
       # For functions without **kwargs, use the original filtering.
       args_to_call = {
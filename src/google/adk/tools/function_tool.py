@@ -82,20 +82,77 @@ class FunctionTool(BaseTool):
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
     self._require_confirmation = require_confirmation
+    self._signature_func: Optional[Callable[..., Any]] = None
+    self._cached_signature: Optional[inspect.Signature] = None
+    self._declaration_cache_key: Optional[tuple[Any, ...]] = None
+    self._cached_declaration: Optional[types.FunctionDeclaration] = None
+    self._pydantic_params_signature: Optional[inspect.Signature] = None
+    self._cached_pydantic_params: dict[str, type[pydantic.BaseModel]] = {}
+
+  @property
+  def _signature(self) -> inspect.Signature:
+    """The signature of `func`, computed once and reused across calls.
+
+    Subclasses may reassign `func` after construction, so the cached value is
+    invalidated whenever the wrapped callable changes.
+    """
+    if self._cached_signature is None or self._signature_func is not self.func:
+      self._cached_signature = inspect.signature(self.func)
+      self._signature_func = self.func
+    return self._cached_signature
+
+  @property
+  def _pydantic_params(self) -> dict[str, type[pydantic.BaseModel]]:
+    """Parameters of `func` annotated with a Pydantic model, by name.
+
+    Resolving the annotations takes several typing introspection calls per
+    parameter, so it is done once per signature rather than on every call.
+    """
+    signature = self._signature
+    if self._pydantic_params_signature is not signature:
+      pydantic_params = {}
+      for param_name, param in signature.parameters.items():
+        if param.annotation == inspect.Parameter.empty:
+          continue
+        target_type = param.annotation
+
+        # Handle Optional[PydanticModel] types
+        if get_origin(param.annotation) is Union:
+          union_args = get_args(param.annotation)
+          # Find the non-None type in Optional[T] (which is Union[T, None])
+          non_none_types = [arg for arg in union_args if arg is not type(None)]
+          if len(non_none_types) == 1:
+            target_type = non_none_types[0]
+
+        if inspect.isclass(target_type) and issubclass(
+            target_type, pydantic.BaseModel
+        ):
+          pydantic_params[param_name] = target_type
+      self._cached_pydantic_params = pydantic_params
+      self._pydantic_params_signature = signature
+    return self._cached_pydantic_params
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
-    function_decl = types.FunctionDeclaration.model_validate(
-        build_function_declaration(
-            func=self.func,
-            # The model doesn't understand the function context.
-            # input_stream is for streaming tool
-            ignore_params=self._ignore_params,
-            variant=self._api_variant,
-        )
-    )
+    # Building the declaration introspects the function on every LLM request,
+    # so it is built once per (func, ignored params, API variant).
+    variant = self._api_variant
+    cache_key = (self.func, tuple(self._ignore_params), variant)
+    if self._declaration_cache_key != cache_key:
+      self._cached_declaration = types.FunctionDeclaration.model_validate(
+          build_function_declaration(
+              func=self.func,
+              # The model doesn't understand the function context.
+              # input_stream is for streaming tool
+              ignore_params=self._ignore_params,
+              variant=variant,
+          )
+      )
+      self._declaration_cache_key = cache_key
 
-    return function_decl
+    # Callers such as LongRunningFunctionTool and prefixed toolsets modify the
+    # returned declaration, so hand out a copy.
+    return self._cached_declaration.model_copy(deep=True)
 
   def _preprocess_args(self, args: dict[str, Any]) -> dict[str, Any]:
     """Preprocess and convert function arguments before invocation.
@@ -112,44 +169,35 @@ class FunctionTool(BaseTool):
       args: Raw arguments from the LLM tool call
 
     Returns:
-      Processed arguments ready for function invocation
+      Processed arguments ready for function invocation. This is `args` itself
+      when no conversion was needed, so callers must not mutate it.
     """
-    signature = inspect.signature(self.func)
-    converted_args = args.copy()
-
-    for param_name, param in signature.parameters.items():
-      if param_name in args and param.annotation != inspect.Parameter.empty:
-        target_type = param.annotation
-
-        # Handle Optional[PydanticModel] types
-        if get_origin(param.annotation) is Union:
-          union_args = get_args(param.annotation)
-          # Find the non-None type in Optional[T] (which is Union[T, None])
-          non_none_types = [arg for arg in union_args if arg is not type(None)]
-          if len(non_none_types) == 1:
-            target_type = non_none_types[0]
-
-        # Check if the target type is a Pydantic model
-        if inspect.isclass(target_type) and issubclass(
-            target_type, pydantic.BaseModel
-        ):
-          # Skip conversion if the value is None and the parameter is Optional
-          if args[param_name] is None:
-            continue
-
-          # Convert to Pydantic model if it's not already the correct type
-          if not isinstance(args[param_name], target_type):
-            try:
-              converted_args[param_name] = target_type.model_validate(
-                  args[param_name]
-              )
-            except Exception as e:
-              logger.warning(
-                  f"Failed to convert argument '{param_name}' to Pydantic model"
-                  f' {target_type.__name__}: {e}'
-              )
-              # Keep the original value if conversion fails
-              pass
+    # Copied lazily, on the first converted argument.
+    converted_args = args
+
+    for param_name, target_type in self._pydantic_params.items():
+      if param_name not in args:
+        continue
+      # Skip conversion if the value is None and the parameter is Optional
+      if args[param_name] is None:
+        continue
+
+      # Convert to Pydantic model if it's not already the correct type
+      if not isinstance(args[param_name], target_type):
+        try:
+          converted_value = target_type.model_validate(args[param_name])
+          if converted_args is args:
+            converted_args = args.copy()
+          converted_args[param_name] = converted_value
+        except Exception as e:
+          logger.warning(
+              "Failed to convert argument '%s' to Pydantic model %s: %s",
+              param_name,
+              target_type.__name__,
+              e,
+          )
+          # Keep the original value if conversion fails
+          pass
 
     return converted_args
 
@@ -160,13 +208,13 @@ class FunctionTool(BaseTool):
     # Preprocess arguments (includes Pydantic model conversion)
     args_to_call = self._preprocess_args(args)
 
-    signature = inspect.signature(self.func)
+    signature = self._signature
     valid_params = {param for param in signature.parameters}
-    if 'tool_context' in valid_params:
-      args_to_call['tool_context'] = tool_context
 
     # Filter args_to_call to only include valid parameters for the function
     args_to_call = {k: v for k, v in args_to_call.items() if k in valid_params}
+    if 'tool_context' in valid_params:
+      args_to_call['tool_context'] = tool_context
 
     # Before invoking the function, we check for if the list of args passed in
     # has all the mandatory arguments or not.
@@ -194,10 +242,6 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
 
     if require_confirmation:
       if not tool_context.tool_confirmation:
-        args_to_show = args_to_call.copy()
-        if 'tool_context' in args_to_show:
-          args_to_show.pop('tool_context')
-
         tool_context.request_confirmation(
             hint=(
                 f'Please approve or reject the tool call {self.name}() by'
@@ -243,7 +287,7 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       invocation_context,
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
+    signature = self._signature
     if (
         self.name in invocation_context.active_streaming_tools
         and invocation_context.active_streaming_tools[self.name].stream
@@ -267,7 +311,7 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
     Returns:
       A list of strings, where each string is the name of a mandatory parameter.
     """
-    signature = inspect.signature(self.func)
+    signature = self._signature
     mandatory_params = []
 
     for name, param in signature.parameters.items():
@@ -14,6 +14,9 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -27,10 +30,22 @@ from ...auth.auth_schemes import OpenIdConnectWithConfig
 from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ..openapi_tool import OpenAPIToolset
+from ..openapi_tool import RestApiTool
 from .google_api_tool import GoogleApiTool
 from .googleapi_to_openapi_converter import GoogleApiToOpenApiConverter
 
 
+@functools.lru_cache(maxsize=None)
+def _get_openapi_spec(api_name: str, api_version: str) -> Dict[str, Any]:
+  """Fetches and converts a Google API discovery document, once per process.
+
+  Building the spec requires a network round trip to the discovery service, so
+  toolsets for the same API and version share a single converted spec.
+  Callers must not mutate the returned dict.
+  """
+  return GoogleApiToOpenApiConverter(api_name, api_version).convert()
+
+
 class GoogleApiToolset(BaseToolset):
   """Google API Toolset contains tools for interacting with Google APIs.
 
@@ -70,31 +85,41 @@ class GoogleApiToolset(BaseToolset):
     self._service_account = service_account
     self._additional_headers = additional_headers
     self._openapi_toolset = self._load_toolset_with_oidc_auth()
+    # GoogleApiTool wrappers keyed by the RestApiTool they wrap, so repeated
+    # get_tools calls don't re-wrap and re-configure auth for every tool.
+    self._google_api_tools: Dict[RestApiTool, GoogleApiTool] = {}
 
   @override
   async def get_tools(
       self, readonly_context: Optional[ReadonlyContext] = None
   ) -> List[GoogleApiTool]:
     """Get all tools in the toolset."""
-    return [
-        GoogleApiTool(
+    tools = []
+    for tool in await self._openapi_toolset.get_tools(readonly_context):
+      if not self._is_tool_selected(tool, readonly_context):
+        continue
+      google_api_tool = self._google_api_tools.get(tool)
+      if google_api_tool is None:
+        google_api_tool = GoogleApiTool(
             tool,
             self._client_id,
             self._client_secret,
             self._service_account,
             additional_headers=self._additional_headers,
         )
-        for tool in await self._openapi_toolset.get_tools(readonly_context)
-        if self._is_tool_selected(tool, readonly_context)
-    ]
+        self._google_api_tools[tool] = google_api_tool
+      tools.append(google_api_tool)
+    return tools
 
   def set_tool_filter(self, tool_filter: Union[ToolPredicate, List[str]]):
     self.tool_filter = tool_filter
 
   def _load_toolset_with_oidc_auth(self) -> OpenAPIToolset:
-    spec_dict = GoogleApiToOpenApiConverter(
-        self.api_name, self.api_version
-    ).convert()
+    # Each toolset gets its own copy so that tools parsed from it never share
+    # mutable spec objects with another toolset.
+    spec_dict = copy.deepcopy(
+        _get_openapi_spec(self.api_name, self.api_version)
+    )
     scope = list(
         spec_dict['components']['securitySchemes']['oauth2']['flows'][
             'authorizationCode'
@@ -124,9 +149,11 @@ class GoogleApiToolset(BaseToolset):
   def configure_auth(self, client_id: str, client_secret: str):
     self._client_id = client_id
     self._client_secret = client_secret
+    self._google_api_tools.clear()
 
   def configure_sa_auth(self, service_account: ServiceAccount):
     self._service_account = service_account
+    self._google_api_tools.clear()
 
   @override
   async def close(self):
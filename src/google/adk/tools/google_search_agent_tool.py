@@ -97,11 +97,7 @@ class GoogleSearchAgentTool(AgentTool):
         plugins=list(tool_context._invocation_context.plugin_manager.plugins),
     )
 
-    state_dict = {
-        k: v
-        for k, v in tool_context.state.to_dict().items()
-        if not k.startswith('_adk')  # Filter out adk internal states
-    }
+    state_dict = self._get_forwarded_state(tool_context)
     session = await runner.session_service.create_session(
         app_name=self.agent.name,
         user_id=tool_context._invocation_context.user_id,
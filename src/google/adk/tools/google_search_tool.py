@@ -14,7 +14,9 @@
 
 from __future__ import annotations
 
+from typing import Optional
 from typing import TYPE_CHECKING
+from typing import Union
 
 from google.genai import types
 from typing_extensions import override
@@ -25,7 +27,9 @@ from .base_tool import BaseTool
 from .tool_context import ToolContext
 
 if TYPE_CHECKING:
+  from ..models import BaseLlm
   from ..models import LlmRequest
+  from .google_search_agent_tool import GoogleSearchAgentTool
 
 
 class GoogleSearchTool(BaseTool):
@@ -46,6 +50,30 @@ class GoogleSearchTool(BaseTool):
     # Name and description are not used because this is a model built-in tool.
     super().__init__(name='google_search', description='google_search')
     self.bypass_multi_tools_limit = bypass_multi_tools_limit
+    # The GoogleSearchAgentTool this tool is wrapped into when it is used
+    # together with other tools, reused while the model stays the same.
+    self._agent_tool: Optional[GoogleSearchAgentTool] = None
+
+  def as_agent_tool(self, model: Union[str, BaseLlm]) -> GoogleSearchAgentTool:
+    """Returns this tool wrapped into an agent, for use with other tools.
+
+    Tools are resolved for every LLM request, so the wrapping agent is built
+    once and reused for as long as the model stays the same.
+
+    Args:
+      model: The model of the agent this tool is used by.
+
+    Returns:
+      The GoogleSearchAgentTool wrapping this tool.
+    """
+    from .google_search_agent_tool import create_google_search_agent
+    from .google_search_agent_tool import GoogleSearchAgentTool
+
+    if self._agent_tool is None or self._agent_tool.agent.model != model:
+      self._agent_tool = GoogleSearchAgentTool(
+          create_google_search_agent(model)
+      )
+    return self._agent_tool
 
   @override
   async def process_llm_request(
@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-import inspect
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -123,10 +122,14 @@ class GoogleTool(FunctionTool):
     Returns:
         The result of the tool execution
     """
-    args_to_call = args.copy()
-    signature = inspect.signature(self.func)
-    if "credentials" in signature.parameters:
-      args_to_call["credentials"] = credentials
-    if "settings" in signature.parameters:
-      args_to_call["settings"] = tool_settings
+    # FunctionTool.run_async never mutates its args, so only copy when
+    # credentials or settings have to be injected.
+    args_to_call = args
+    parameters = self._signature.parameters
+    if "credentials" in parameters or "settings" in parameters:
+      args_to_call = args.copy()
+      if "credentials" in parameters:
+        args_to_call["credentials"] = credentials
+      if "settings" in parameters:
+        args_to_call["settings"] = tool_settings
     return await super().run_async(args=args_to_call, tool_context=tool_context)
@@ -18,8 +18,6 @@ import asyncio
 from contextlib import AsyncExitStack
 from datetime import timedelta
 import functools
-import hashlib
-import json
 import logging
 import sys
 from typing import Any
@@ -50,6 +48,8 @@ except ImportError as e:
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_SessionKey = Union[str, tuple[tuple[str, str], ...]]
+
 
 class StdioConnectionParams(BaseModel):
   """Parameters for the MCP Stdio connection.
@@ -181,25 +181,26 @@ class MCPSessionManager:
     self._errlog = errlog
 
     # Session pool: maps session keys to (session, exit_stack) tuples
-    self._sessions: Dict[str, tuple[ClientSession, AsyncExitStack]] = {}
+    self._sessions: Dict[_SessionKey, tuple[ClientSession, AsyncExitStack]] = {}
 
     # Lock to prevent race conditions in session creation
     self._session_lock = asyncio.Lock()
 
   def _generate_session_key(
       self, merged_headers: Optional[Dict[str, str]] = None
-  ) -> str:
+  ) -> _SessionKey:
     """Generates a session key based on connection params and merged headers.
 
     For StdioConnectionParams, returns a constant key since headers are not
-    supported. For SSE and StreamableHTTP connections, generates a key based
-    on the provided merged headers.
+    supported. For SSE and StreamableHTTP connections, the merged headers
+    themselves, frozen into a sorted tuple, identify the session.
 
     Args:
         merged_headers: Already merged headers (base + additional).
 
     Returns:
-        A unique session key string.
+        A unique, hashable session key. It may contain credentials from the
+        headers, so it must not be logged.
     """
     if isinstance(self._connection_params, StdioConnectionParams):
       # For stdio connections, headers are not supported, so use constant key
@@ -207,9 +208,7 @@ class MCPSessionManager:
 
     # For SSE and StreamableHTTP connections, use merged headers
     if merged_headers:
-      headers_json = json.dumps(merged_headers, sort_keys=True)
-      headers_hash = hashlib.md5(headers_json.encode()).hexdigest()
-      return f'session_{headers_hash}'
+      return tuple(sorted(merged_headers.items()))
     else:
       return 'session_no_headers'
 
@@ -348,7 +347,7 @@ class MCPSessionManager:
           return session
         else:
           # Session is disconnected, clean it up
-          logger.info('Cleaning up disconnected session: %s', session_key)
+          logger.info('Cleaning up disconnected MCP session.')
           try:
             await exit_stack.aclose()
           except Exception as e:
@@ -389,7 +388,7 @@ class MCPSessionManager:
 
         # Store session and exit stack in the pool
         self._sessions[session_key] = (session, exit_stack)
-        logger.debug('Created new session: %s', session_key)
+        logger.debug('Created new MCP session.')
         return session
 
       except Exception as e:
@@ -413,8 +412,7 @@ class MCPSessionManager:
         except Exception as e:
           # Log the error but don't re-raise to avoid blocking shutdown
           print(
-              'Warning: Error during MCP session cleanup for'
-              f' {session_key}: {e}',
+              f'Warning: Error during MCP session cleanup: {e}',
               file=self._errlog,
           )
         finally:
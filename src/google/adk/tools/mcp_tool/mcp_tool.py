@@ -163,10 +163,6 @@ class McpTool(BaseAuthenticatedTool):
 
     if require_confirmation:
       if not tool_context.tool_confirmation:
-        args_to_show = args.copy()
-        if "tool_context" in args_to_show:
-          args_to_show.pop("tool_context")
-
         tool_context.request_confirmation(
             hint=(
                 f"Please approve or reject the tool call {self.name}() by"
@@ -163,7 +163,9 @@ class OpenApiSpecParser:
         resolved.
     """
 
-    openapi_spec = copy.deepcopy(openapi_spec)  # Work on a copy
+    # No upfront deep copy of the whole spec is needed: the traversal below
+    # rebuilds every dict and list it visits, and resolved references are
+    # deep-copied on use, so the caller's spec is never mutated.
     resolved_cache = {}  # Cache resolved references
 
     def resolve_ref(ref_string, current_doc):
@@ -222,7 +224,7 @@ class OpenApiSpecParser:
             resolved_cache[ref_string] = resolved_value
             return copy.deepcopy(resolved_value)  # return the cached result
           else:
-            return obj  # return original if no resolved value.
+            return dict(obj)  # return a copy of original if no resolved value.
 
         else:
           new_dict = {}
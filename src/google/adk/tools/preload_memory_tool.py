@@ -28,6 +28,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_PAST_CONVERSATIONS_START = """The following content is from your previous conversations with the user.
+They may be useful for answering the user's current query.
+<PAST_CONVERSATIONS>"""
+_PAST_CONVERSATIONS_END = '</PAST_CONVERSATIONS>\n'
+
 
 class PreloadMemoryTool(BaseTool):
   """A tool that preloads the memory for the current user.
@@ -79,13 +84,11 @@ class PreloadMemoryTool(BaseTool):
     if not memory_text_lines:
       return
 
-    full_memory_text = '\n'.join(memory_text_lines)
-    si = f"""The following content is from your previous conversations with the user.
-They may be useful for answering the user's current query.
-<PAST_CONVERSATIONS>
-{full_memory_text}
-</PAST_CONVERSATIONS>
-"""
+    # Join the memories and the surrounding instruction in one pass instead
+    # of joining the memories first and copying them again into a template.
+    si = '\n'.join(
+        [_PAST_CONVERSATIONS_START, *memory_text_lines, _PAST_CONVERSATIONS_END]
+    )
     llm_request.append_instructions([si])
 
 
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import Any
 from typing import Optional
 
@@ -57,8 +58,6 @@ class SetModelResponseTool(BaseTool):
       return 'Response set successfully.'
 
     # Add the schema fields as parameters to the function dynamically
-    import inspect
-
     schema_fields = output_schema.model_fields
     params = []
     for field_name, field_info in schema_fields.items():
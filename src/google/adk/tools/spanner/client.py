@@ -18,15 +18,27 @@ from google.auth.credentials import Credentials
 from google.cloud import spanner
 
 from ... import version
+from .._google_client_cache import GoogleClientCache
 
 USER_AGENT = f"adk-spanner-tool google-adk/{version.__version__}"
 
+_client_cache: GoogleClientCache[spanner.Client] = GoogleClientCache()
+
 
 def get_spanner_client(
     *, project: str, credentials: Credentials
 ) -> spanner.Client:
   """Get a Spanner client."""
+  return _client_cache.get_or_create(
+      credentials,
+      (project,),
+      lambda: _create_spanner_client(project, credentials),
+  )
+
 
+def _create_spanner_client(
+    project: str, credentials: Credentials
+) -> spanner.Client:
   spanner_client = spanner.Client(project=project, credentials=credentials)
   spanner_client._client_info.user_agent = USER_AGENT
 
@@ -23,6 +23,7 @@ from typing import Optional
 from google.adk.tools.spanner import client
 from google.adk.tools.spanner.settings import SpannerToolSettings
 from google.adk.tools.tool_context import ToolContext
+from google.adk.utils.json_utils import JSON_SCALAR_TYPES
 from google.auth.credentials import Credentials
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 from google.cloud.spanner_v1.database import Database
@@ -424,11 +425,13 @@ def similarity_search(
       rows = []
       result = {}
       for row in result_set:
-        try:
-          # if the json serialization of the row succeeds, use it as is
-          json.dumps(row)
-        except:
-          row = str(row)
+        # Rows of plain JSON scalars need no trial serialization.
+        if not all(isinstance(val, JSON_SCALAR_TYPES) for val in row):
+          try:
+            # if the json serialization of the row succeeds, use it as is
+            json.dumps(row)
+          except:
+            row = str(row)
 
         rows.append(row)
 
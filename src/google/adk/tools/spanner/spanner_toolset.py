@@ -73,12 +73,12 @@ class SpannerToolset(BaseToolset):
     if self.tool_filter is None:
       return True
 
-    if isinstance(self.tool_filter, ToolPredicate):
-      return self.tool_filter(tool, readonly_context)
-
     if isinstance(self.tool_filter, list):
       return tool.name in self.tool_filter
 
+    if isinstance(self.tool_filter, ToolPredicate):
+      return self.tool_filter(tool, readonly_context)
+
     return False
 
   @override
@@ -22,6 +22,7 @@ from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 
 from . import client
 from ..tool_context import ToolContext
+from ...utils.json_utils import JSON_SCALAR_TYPES
 from .settings import SpannerToolSettings
 
 DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS = 50
@@ -85,11 +86,13 @@ def execute_sql(
           else DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS
       )
       for row in result_set:
-        try:
-          # if the json serialization of the row succeeds, use it as is
-          json.dumps(row)
-        except:
-          row = str(row)
+        # Rows of plain JSON scalars need no trial serialization.
+        if not all(isinstance(val, JSON_SCALAR_TYPES) for val in row):
+          try:
+            # if the json serialization of the row succeeds, use it as is
+            json.dumps(row)
+          except:
+            row = str(row)
 
         rows.append(row)
         counter -= 1
@@ -22,6 +22,8 @@ from __future__ import annotations
 
 import os
 
+_ENABLED_VALUES = frozenset(('true', '1'))
+
 
 def is_env_enabled(env_var_name: str, default: str = '0') -> bool:
   """Check if an environment variable is enabled.
@@ -56,4 +58,4 @@ def is_env_enabled(env_var_name: str, default: str = '0') -> bool:
     >>> is_env_enabled('NONEXISTENT_FLAG', default='1')
     True
   """
-  return os.environ.get(env_var_name, default).lower() in ['true', '1']
+  return os.environ.get(env_var_name, default).lower() in _ENABLED_VALUES
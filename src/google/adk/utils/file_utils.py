@@ -0,0 +1,58 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import TextIO
+
+
+def load_file_cached(
+    file_path: str, loader: Optional[Callable[[TextIO], Any]] = None
+) -> Any:
+  """Loads a text file, re-reading it only when it has changed.
+
+  The file's mtime and size are part of the cache key, so an edited file is
+  picked up on the next call. The returned value is shared between callers
+  and must not be mutated.
+
+  Args:
+    file_path: Path to the file.
+    loader: Function that parses the opened file, e.g. `yaml.safe_load`. If
+      not set, the text of the file is returned.
+
+  Returns:
+    The loaded content of the file.
+
+  Raises:
+    FileNotFoundError: If the file_path does not exist.
+  """
+  stat = os.stat(file_path)
+  return _load_file(file_path, stat.st_mtime_ns, stat.st_size, loader)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_file(
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+    loader: Optional[Callable[[TextIO], Any]],
+) -> Any:
+  del mtime_ns, size  # Only used as part of the cache key.
+  with open(file_path, 'r', encoding='utf-8') as f:
+    return loader(f) if loader else f.read()
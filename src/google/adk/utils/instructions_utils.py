@@ -26,6 +26,15 @@ __all__ = [
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Sentinel for state lookups, where None is a valid value.
+_MISSING = object()
+
+# State prefixes (without the trailing ':') accepted in `{prefix:name}`.
+_VALID_STATE_PREFIXES = frozenset(
+    prefix.removesuffix(':')
+    for prefix in (State.APP_PREFIX, State.USER_PREFIX, State.TEMP_PREFIX)
+)
+
 
 async def inject_session_state(
     template: str,
@@ -106,8 +115,8 @@ async def inject_session_state(
     else:
       if not _is_valid_state_name(var_name):
         return match.group()
-      if var_name in invocation_context.session.state:
-        value = invocation_context.session.state[var_name]
+      value = invocation_context.session.state.get(var_name, _MISSING)
+      if value is not _MISSING:
         if value is None:
           return ''
         return str(value)
@@ -138,12 +147,7 @@ def _is_valid_state_name(var_name):
   Returns:
     True if the variable name is a valid state name, False otherwise.
   """
-  parts = var_name.split(':')
-  if len(parts) == 1:
+  prefix, sep, name = var_name.partition(':')
+  if not sep:
     return var_name.isidentifier()
-
-  if len(parts) == 2:
-    prefixes = [State.APP_PREFIX, State.USER_PREFIX, State.TEMP_PREFIX]
-    if (parts[0] + ':') in prefixes:
-      return parts[1].isidentifier()
-  return False
+  return prefix in _VALID_STATE_PREFIXES and name.isidentifier()
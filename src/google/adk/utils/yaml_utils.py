@@ -40,9 +40,12 @@ def load_yaml_file(file_path: Union[str, Path]) -> Any:
     FileNotFoundError: If the file_path does not exist.
   """
   file_path = Path(file_path)
-  if not file_path.is_file():
-    raise FileNotFoundError(f'YAML file not found: {file_path}')
-  with file_path.open('r', encoding='utf-8') as f:
+  # Let open() report a missing file instead of stat-ing it up front.
+  try:
+    f = file_path.open('r', encoding='utf-8')
+  except (FileNotFoundError, IsADirectoryError) as e:
+    raise FileNotFoundError(f'YAML file not found: {file_path}') from e
+  with f:
     return yaml.safe_load(f)
 
 
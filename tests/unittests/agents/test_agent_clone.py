@@ -231,6 +231,26 @@ def test_clone_without_updates():
   assert cloned.description == "Test agent"
 
 
+def test_clone_copies_list_fields():
+  """Test that list fields are not shared between original and clone."""
+
+  def tool_a():
+    pass
+
+  def tool_b():
+    pass
+
+  original = LlmAgent(name="test_agent", tools=[tool_a])
+
+  cloned = original.clone()
+  cloned.tools.append(tool_b)
+  updated = original.clone(update={"tools": [tool_b]})
+
+  assert original.tools == [tool_a]
+  assert cloned.tools == [tool_a, tool_b]
+  assert updated.tools == [tool_b]
+
+
 def test_clone_with_multiple_updates():
   """Test cloning with multiple field updates."""
   original = LlmAgent(
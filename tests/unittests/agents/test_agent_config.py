@@ -280,3 +280,8 @@ other_field: other value
       config.root.model_dump()
   )
   assert my_custom_config.other_field == "other value"
+
+
+def test_load_config_from_path_missing_file(tmp_path: Path):
+  with pytest.raises(FileNotFoundError, match="Config file not found"):
+    config_agent_utils._load_config_from_path(str(tmp_path / "missing.yaml"))
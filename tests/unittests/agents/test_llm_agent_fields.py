@@ -14,6 +14,7 @@
 
 """Unit tests for canonical_xxx fields in LlmAgent."""
 
+import asyncio
 from typing import Any
 from typing import Optional
 from unittest import mock
@@ -25,6 +26,8 @@ from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.registry import LLMRegistry
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.google_search_tool import google_search
 from google.adk.tools.google_search_tool import GoogleSearchTool
 from google.adk.tools.vertex_ai_search_tool import VertexAiSearchTool
@@ -297,6 +300,40 @@ class TestCanonicalTools:
     assert tools[1].name == 'google_search_agent'
     assert tools[1].__class__.__name__ == 'GoogleSearchAgentTool'
 
+  async def test_google_search_agent_tool_is_reused_across_calls(self):
+    """Test that google_search is wrapped into an agent once per model."""
+    search_tool = GoogleSearchTool(bypass_multi_tools_limit=True)
+    agent = LlmAgent(
+        name='test_agent',
+        model='gemini-pro',
+        tools=[self._my_tool, search_tool],
+    )
+    ctx = await _create_readonly_context(agent)
+
+    first = await agent.canonical_tools(ctx)
+    second = await agent.canonical_tools(ctx)
+    agent.model = 'gemini-1.5-flash'
+    third = await agent.canonical_tools(ctx)
+
+    assert second[1] is first[1]
+    assert third[1] is not first[1]
+    assert third[1].agent.model == 'gemini-1.5-flash'
+
+  async def test_function_tools_are_reused_across_calls(self):
+    """Test that plain callables are wrapped into a FunctionTool only once."""
+    agent = LlmAgent(
+        name='test_agent',
+        model='gemini-pro',
+        tools=[self._my_tool],
+    )
+    ctx = await _create_readonly_context(agent)
+
+    first = await agent.canonical_tools(ctx)
+    second = await agent.canonical_tools(ctx)
+
+    assert first[0].__class__.__name__ == 'FunctionTool'
+    assert second[0] is first[0]
+
   async def test_handle_google_search_with_other_tools_no_bypass(self):
     """Test that google_search is not wrapped into an agent."""
     agent = LlmAgent(
@@ -411,3 +448,27 @@ class TestCanonicalTools:
     assert len(tools) == 1
     assert tools[0].name == 'vertex_ai_search'
     assert tools[0].__class__.__name__ == 'VertexAiSearchTool'
+
+  async def test_toolsets_are_resolved_in_caller_task(self):
+    """Test that toolsets are listed in the task that resolves the tools."""
+    tasks = []
+
+    class _RecordingToolset(BaseToolset):
+
+      async def get_tools(self, readonly_context=None):
+        tasks.append(asyncio.current_task())
+        return [FunctionTool(func=TestCanonicalTools._my_tool)]
+
+      async def close(self):
+        pass
+
+    agent = LlmAgent(
+        name='test_agent',
+        model='gemini-pro',
+        tools=[_RecordingToolset(), _RecordingToolset()],
+    )
+    ctx = await _create_readonly_context(agent)
+    tools = await agent.canonical_tools(ctx)
+
+    assert tasks == [asyncio.current_task()] * 2
+    assert len(tools) == 2
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 """Unit tests for McpInstructionProvider."""
+
 import sys
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -208,3 +209,13 @@ class TestMcpInstructionProvider:
     self.mock_session.get_prompt.assert_called_once_with(
         self.prompt_name, arguments={}
     )
+
+
+def test_agents_package_exports_mcp_instruction_provider_lazily():
+  """Test that the lazy package export resolves to the real class."""
+  from google.adk import agents
+
+  assert agents.McpInstructionProvider is McpInstructionProvider
+  assert "McpInstructionProvider" in dir(agents)
+  with pytest.raises(AttributeError):
+    _ = agents.NotAnAgent
@@ -17,6 +17,7 @@ from unittest.mock import call
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from google.adk.auth import oauth2_discovery
 from google.adk.auth.oauth2_discovery import AuthorizationServerMetadata
 from google.adk.auth.oauth2_discovery import OAuth2DiscoveryManager
 from google.adk.auth.oauth2_discovery import ProtectedResourceMetadata
@@ -27,6 +28,15 @@ import pytest
 class TestOAuth2Discovery:
   """Tests for the OAuth2DiscoveryManager class."""
 
+  @pytest.fixture(autouse=True)
+  def clear_metadata_caches(self):
+    """Isolate tests from metadata cached by earlier discoveries."""
+    oauth2_discovery._auth_server_metadata_cache.clear()
+    oauth2_discovery._resource_metadata_cache.clear()
+    yield
+    oauth2_discovery._auth_server_metadata_cache.clear()
+    oauth2_discovery._resource_metadata_cache.clear()
+
   @pytest.fixture
   def auth_server_metadata(self):
     """Create AuthorizationServerMetadata object."""
@@ -283,3 +293,49 @@ class TestOAuth2Discovery:
         "https://resource.example.com/.well-known/oauth-protected-resource",
         timeout=5,
     )
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_discover_auth_server_metadata_shared_across_managers(
+      self,
+      mock_get,
+      auth_server_metadata,
+  ):
+    """Test successful discoveries are reused by other manager instances."""
+    mock_get.return_value = self.mock_success_response(auth_server_metadata)
+
+    first = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+    first.token_endpoint = "https://mutated.example.com/token"
+    second = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+
+    assert second == auth_server_metadata
+    mock_get.assert_called_once()
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_discover_resource_metadata_failure_not_cached(
+      self,
+      mock_get,
+      resource_metadata,
+      mock_failed_response,
+  ):
+    """Test failed discoveries are retried on the next call."""
+    mock_get.side_effect = [
+        mock_failed_response,
+        self.mock_success_response(resource_metadata),
+    ]
+    discovery_manager = OAuth2DiscoveryManager()
+
+    assert not await discovery_manager.discover_resource_metadata(
+        "https://resource.example.com"
+    )
+    result = await discovery_manager.discover_resource_metadata(
+        "https://resource.example.com"
+    )
+
+    assert result == resource_metadata
+    assert mock_get.call_count == 2
@@ -952,6 +952,38 @@ def test_get_event_graph_returns_dot_src_for_app_agent():
   assert "dotSrc" in response.json()
 
 
+@pytest.mark.asyncio
+async def test_get_runner_async_skips_cleanup_for_app_without_runner():
+  """A changed app without a cached runner has nothing to close."""
+  from google.adk.cli.adk_web_server import AdkWebServer
+
+  root_agent = DummyAgent(name="dummy_agent")
+  loader = MagicMock()
+  loader.load_agent.return_value = root_agent
+
+  adk_web_server = AdkWebServer(
+      agent_loader=loader,
+      session_service=InMemorySessionService(),
+      memory_service=MagicMock(),
+      artifact_service=MagicMock(),
+      credential_service=MagicMock(),
+      eval_sets_manager=MagicMock(),
+      eval_set_results_manager=MagicMock(),
+      agents_dir=".",
+  )
+  adk_web_server.runners_to_clean.add("test_app")
+
+  with patch(
+      "google.adk.cli.adk_web_server.cleanup.close_runners",
+      new_callable=AsyncMock,
+  ) as mock_close_runners:
+    runner = await adk_web_server.get_runner_async("test_app")
+
+  mock_close_runners.assert_not_awaited()
+  assert adk_web_server.runner_dict["test_app"] is runner
+  assert not adk_web_server.runners_to_clean
+
+
 @pytest.mark.skipif(
     sys.version_info < (3, 10), reason="A2A requires Python 3.10+"
 )
@@ -887,3 +887,12 @@ class TestAgentLoader:
       # Verify they are different agents
       assert default_agent.name != custom_agent.name
       assert explicit_agent.name == default_agent.name
+
+  def test_special_agents_dir_is_normalized(self):
+    """SPECIAL_AGENTS_DIR is an absolute, normalized built-in agents path."""
+    from google.adk.cli.utils import agent_loader
+
+    special_dir = agent_loader.SPECIAL_AGENTS_DIR
+    assert os.path.isabs(special_dir)
+    assert ".." not in Path(special_dir).parts
+    assert Path(special_dir).name == "built_in_agents"
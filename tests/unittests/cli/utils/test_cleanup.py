@@ -0,0 +1,48 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from google.adk.cli.utils import cleanup
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_close_runners_closes_all_runners():
+  runners = [MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())]
+
+  await cleanup.close_runners(runners)
+
+  for runner in runners:
+    runner.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_runners_skips_none():
+  runner = MagicMock(close=AsyncMock())
+
+  await cleanup.close_runners([None, runner, None])
+
+  runner.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_runners_with_only_none_does_not_wait(monkeypatch):
+  mock_wait = AsyncMock()
+  monkeypatch.setattr(cleanup.asyncio, "wait", mock_wait)
+
+  await cleanup.close_runners([None])
+
+  mock_wait.assert_not_awaited()
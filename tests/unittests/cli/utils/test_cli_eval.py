@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import sys
 from types import SimpleNamespace
 from unittest import mock
 
@@ -49,3 +50,30 @@ def test_get_eval_sets_manager_gcs(monkeypatch):
   )
   assert manager == mock_gcs_manager
   mock_create_gcs.assert_called_once_with("gs://bucket")
+
+
+def test_get_root_agent_and_reset_func_import_agent_module_once(
+    tmp_path, monkeypatch
+):
+  agent_dir = tmp_path / "my_agent"
+  agent_dir.mkdir()
+  (agent_dir / "__init__.py").write_text("from . import agent\n")
+  (agent_dir / "agent.py").write_text(
+      "root_agent = object()\n\ndef reset_data():\n  pass\n"
+  )
+  monkeypatch.delitem(sys.modules, "agent", raising=False)
+  monkeypatch.delitem(sys.modules, "agent.agent", raising=False)
+  from google.adk.cli.cli_eval import get_root_agent
+  from google.adk.cli.cli_eval import try_get_reset_func
+
+  try:
+    root_agent = get_root_agent(str(agent_dir))
+    reset_func = try_get_reset_func(str(agent_dir))
+
+    agent_module = sys.modules["agent"].agent
+    assert root_agent is agent_module.root_agent
+    assert reset_func is agent_module.reset_data
+    assert get_root_agent(str(agent_dir)) is root_agent
+  finally:
+    sys.modules.pop("agent", None)
+    sys.modules.pop("agent.agent", None)
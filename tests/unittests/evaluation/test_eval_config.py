@@ -26,23 +26,21 @@ def test_get_evaluation_criteria_or_default_returns_default():
   assert get_evaluation_criteria_or_default("") == _DEFAULT_EVAL_CONFIG
 
 
-def test_get_evaluation_criteria_or_default_reads_from_file(mocker):
-  mocker.patch("os.path.exists", return_value=True)
+def test_get_evaluation_criteria_or_default_reads_from_file(tmp_path):
   eval_config = EvalConfig(
       criteria={"tool_trajectory_avg_score": 0.5, "response_match_score": 0.5}
   )
-  mocker.patch(
-      "builtins.open", mocker.mock_open(read_data=eval_config.model_dump_json())
-  )
-  assert get_evaluation_criteria_or_default("dummy_path") == eval_config
+  config_path = tmp_path / "test_config.json"
+  config_path.write_text(eval_config.model_dump_json(), encoding="utf-8")
+  assert get_evaluation_criteria_or_default(str(config_path)) == eval_config
 
 
 def test_get_evaluation_criteria_or_default_returns_default_if_file_not_found(
-    mocker,
+    tmp_path,
 ):
-  mocker.patch("os.path.exists", return_value=False)
   assert (
-      get_evaluation_criteria_or_default("dummy_path") == _DEFAULT_EVAL_CONFIG
+      get_evaluation_criteria_or_default(str(tmp_path / "missing.json"))
+      == _DEFAULT_EVAL_CONFIG
   )
 
 
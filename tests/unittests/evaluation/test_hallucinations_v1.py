@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 
 from google.adk.evaluation.app_details import AgentDetails
@@ -1391,6 +1392,62 @@ async def test_evaluate_invocations_success_path(hallucinations_metric, mocker):
   assert per_invocation_result.score == pytest.approx(0.5)
 
 
+@pytest.mark.asyncio
+async def test_evaluate_invocations_judges_steps_concurrently(
+    hallucinations_metric, mocker
+):
+  metric = hallucinations_metric
+  app_details = AppDetails(
+      agent_details={
+          "root": AgentDetails(
+              name="root",
+              instructions="Root agent instructions.",
+              tool_declarations=[],
+          ),
+      },
+  )
+  user_content = genai_types.Content(
+      parts=[genai_types.Part(text="User query.")]
+  )
+  invocation = Invocation(
+      app_details=app_details,
+      user_content=user_content,
+      intermediate_data=InvocationEvents(
+          invocation_events=[
+              InvocationEvent(
+                  author="root",
+                  content=genai_types.Content(
+                      parts=[genai_types.Part(text="Intermediate response.")]
+                  ),
+              ),
+          ]
+      ),
+      final_response=genai_types.Content(
+          parts=[genai_types.Part(text="Final response.")]
+      ),
+  )
+
+  in_flight = 0
+  max_in_flight = 0
+
+  async def mock_evaluate_nl_response(nl_response, context):
+    nonlocal in_flight, max_in_flight
+    in_flight += 1
+    max_in_flight = max(max_in_flight, in_flight)
+    await asyncio.sleep(0)
+    in_flight -= 1
+    return 1.0, ""
+
+  mocker.patch(
+      "google.adk.evaluation.hallucinations_v1.HallucinationsV1Evaluator._evaluate_nl_response",
+      side_effect=mock_evaluate_nl_response,
+  )
+  result = await metric.evaluate_invocations([invocation], [invocation])
+
+  assert result.overall_score == 1.0
+  assert max_in_flight == 2
+
+
 @pytest.mark.asyncio
 async def test_evaluate_invocations_no_nl_response(hallucinations_metric):
   metric = hallucinations_metric
@@ -407,6 +407,74 @@ async def test_evaluate_single_inference_result(
     assert metric_result.eval_status == EvalStatus.PASSED
 
 
+@pytest.mark.asyncio
+async def test_evaluate_single_inference_result_evaluates_metrics_concurrently(
+    eval_service, mock_eval_sets_manager, mocker
+):
+  invocation = Invocation(
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="test user content.")]
+      ),
+  )
+  inference_result = InferenceResult(
+      app_name="test_app",
+      eval_set_id="test_eval_set",
+      eval_case_id="case1",
+      inferences=[invocation.model_copy(deep=True)],
+      session_id="session1",
+  )
+  evaluate_config = EvaluateConfig(
+      eval_metrics=[
+          EvalMetric(metric_name="fake_metric", threshold=0.5),
+          EvalMetric(metric_name="fake_single_sided_metric", threshold=0.5),
+      ],
+      parallelism=1,
+  )
+
+  mock_eval_case = mocker.MagicMock(spec=EvalCase)
+  mock_eval_case.conversation = [invocation.model_copy(deep=True)]
+  mock_eval_case.conversation_scenario = None
+  mock_eval_case.session_input = None
+  mock_eval_sets_manager.get_eval_case.return_value = mock_eval_case
+
+  in_flight = 0
+  max_in_flight = 0
+
+  async def fake_evaluate_metric(
+      eval_metric, actual_invocations, expected_invocations
+  ):
+    nonlocal in_flight, max_in_flight
+    in_flight += 1
+    max_in_flight = max(max_in_flight, in_flight)
+    await asyncio.sleep(0)
+    in_flight -= 1
+    return EvaluationResult(
+        overall_score=1.0,
+        overall_eval_status=EvalStatus.PASSED,
+        per_invocation_results=[
+            PerInvocationResult(
+                actual_invocation=actual_invocations[0],
+                score=1.0,
+                eval_status=EvalStatus.PASSED,
+            )
+        ],
+    )
+
+  mocker.patch.object(
+      eval_service, "_evaluate_metric", side_effect=fake_evaluate_metric
+  )
+
+  _, result = await eval_service._evaluate_single_inference_result(
+      inference_result=inference_result, evaluate_config=evaluate_config
+  )
+
+  assert max_in_flight == 2
+  assert [r.metric_name for r in result.overall_eval_metric_results] == [
+      "fake_metric",
+      "fake_single_sided_metric",
+  ]
+
+
 @pytest.mark.asyncio
 async def test_evaluate_single_inference_result_for_conversation_scenario(
     eval_service, mock_eval_sets_manager, mocker
@@ -293,3 +293,54 @@ async def test_agent_transfer_no_instructions_when_no_transfer_targets():
   instructions = llm_request.config.system_instruction or ''
   assert '**NOTE**:' not in instructions
   assert 'transfer_to_agent' not in instructions
+
+
+@pytest.mark.asyncio
+async def test_agent_transfer_instructions_reflect_updated_descriptions():
+  """Test that cached instructions follow changes to target agents."""
+  mockModel = testing_utils.MockModel.create(responses=[])
+  sub_agent = Agent(
+      name='sub_agent', model=mockModel, description='Original description'
+  )
+  main_agent = Agent(name='main_agent', model=mockModel, sub_agents=[sub_agent])
+  invocation_context = await create_test_invocation_context(main_agent)
+
+  async def build_instructions() -> str:
+    llm_request = LlmRequest()
+    async for _ in agent_transfer.request_processor.run_async(
+        invocation_context, llm_request
+    ):
+      pass
+    return llm_request.config.system_instruction
+
+  first_instructions = await build_instructions()
+  assert await build_instructions() == first_instructions
+
+  sub_agent.description = 'Updated description'
+  updated_instructions = await build_instructions()
+
+  assert 'Agent description: Original description' in first_instructions
+  assert 'Agent description: Updated description' in updated_instructions
+
+
+@pytest.mark.asyncio
+async def test_agent_transfer_reuses_transfer_to_agent_tool():
+  """Test that every request gets the same transfer_to_agent tool."""
+  mockModel = testing_utils.MockModel.create(responses=[])
+  sub_agent = Agent(name='sub_agent', model=mockModel)
+  main_agent = Agent(name='main_agent', model=mockModel, sub_agents=[sub_agent])
+  invocation_context = await create_test_invocation_context(main_agent)
+
+  tools = []
+  for _ in range(2):
+    llm_request = LlmRequest()
+    async for _ in agent_transfer.request_processor.run_async(
+        invocation_context, llm_request
+    ):
+      pass
+    tools.append(llm_request.tools_dict['transfer_to_agent'])
+
+  assert tools[0] is tools[1]
+  assert llm_request.config.tools[0].function_declarations[0].name == (
+      'transfer_to_agent'
+  )
@@ -21,6 +21,7 @@ from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.flows.llm_flows.basic import _BasicLlmRequestProcessor
 from google.adk.models.llm_request import LlmRequest
+from google.adk.models.registry import LLMRegistry
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.tools.function_tool import FunctionTool
 from pydantic import BaseModel
@@ -184,3 +185,25 @@ class TestBasicLlmRequestProcessor:
 
     # Should have set the model name
     assert llm_request.model == 'gemini-1.5-flash'
+
+  @pytest.mark.asyncio
+  async def test_resolves_canonical_model_once(self):
+    """Test that processor resolves the agent model only once per request."""
+    agent = LlmAgent(
+        name='test_agent',
+        model='gemini-1.5-flash',
+    )
+
+    invocation_context = await _create_invocation_context(agent)
+    llm_request = LlmRequest()
+    processor = _BasicLlmRequestProcessor()
+
+    with mock.patch(
+        'google.adk.agents.llm_agent.LLMRegistry.new_llm',
+        wraps=LLMRegistry.new_llm,
+    ) as mock_new_llm:
+      async for _ in processor.run_async(invocation_context, llm_request):
+        pass
+
+    mock_new_llm.assert_called_once_with('gemini-1.5-flash')
+    assert llm_request.model == 'gemini-1.5-flash'
@@ -23,8 +23,13 @@ from google.adk.agents.llm_agent import Agent
 from google.adk.code_executors.base_code_executor import BaseCodeExecutor
 from google.adk.code_executors.built_in_code_executor import BuiltInCodeExecutor
 from google.adk.code_executors.code_execution_utils import CodeExecutionResult
+from google.adk.code_executors.code_execution_utils import CodeExecutionUtils
+from google.adk.code_executors.code_executor_context import CodeExecutorContext
+from google.adk.flows.llm_flows._code_execution import _extract_and_replace_inline_files
 from google.adk.flows.llm_flows._code_execution import response_processor
+from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions.state import State
 from google.genai import types
 import pytest
 
@@ -148,3 +153,43 @@ async def test_logs_executed_code(mock_logger):
   mock_logger.debug.assert_called_once_with(
       'Executed code:\n```\n%s\n```', 'print("hello")'
   )
+
+
+def test_inline_data_files_encoded_once():
+  """Test inline data files are only encoded the first time they are seen."""
+  code_executor_context = CodeExecutorContext(State({}, {}))
+
+  def _create_llm_request():
+    return LlmRequest(
+        contents=[
+            types.Content(
+                role='user',
+                parts=[
+                    types.Part(
+                        inline_data=types.Blob(
+                            mime_type='text/csv', data=b'a,b\n1,2\n'
+                        )
+                    )
+                ],
+            )
+        ]
+    )
+
+  with patch.object(
+      CodeExecutionUtils,
+      'get_encoded_file_content',
+      wraps=CodeExecutionUtils.get_encoded_file_content,
+  ) as mock_encode:
+    for _ in range(2):
+      llm_request = _create_llm_request()
+      input_files = _extract_and_replace_inline_files(
+          code_executor_context, llm_request
+      )
+
+      assert [f.name for f in input_files] == ['data_1_1.csv']
+      assert llm_request.contents[0].parts[0].text == (
+          '\nAvailable file: `data_1_1.csv`\n'
+      )
+
+  mock_encode.assert_called_once()
+  assert code_executor_context.get_input_files() == input_files
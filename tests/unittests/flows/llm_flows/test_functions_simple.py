@@ -680,6 +680,24 @@ def test_shallow_vs_deep_copy_demonstration():
   assert 'new_item' in deep_copy['list_param']  # Copy is modified
 
 
+def test_copy_function_args_copies_non_json_values():
+  """Test that values outside plain JSON types are still deep-copied."""
+  from google.adk.flows.llm_flows.functions import _copy_function_args
+
+  original = {
+      'text': 'value',
+      'items': [{'inner': {1, 2}}],
+      'pair': ([1], 2),
+  }
+
+  copied = _copy_function_args(original)
+
+  assert copied == original
+  assert copied['items'][0] is not original['items'][0]
+  assert copied['items'][0]['inner'] is not original['items'][0]['inner']
+  assert copied['pair'][0] is not original['pair'][0]
+
+
 @pytest.mark.asyncio
 async def test_parallel_function_execution_timing():
   """Test that multiple function calls are executed in parallel, not sequentially."""
@@ -97,6 +97,29 @@ Original instruction
 Test instruction""")
 
 
+@pytest.mark.asyncio
+async def test_plan_react_planner_subclass_instruction_appended():
+  """Test that a subclass can override the NL planner instruction."""
+
+  class _CustomPlanReActPlanner(PlanReActPlanner):
+
+    def _build_nl_planner_instruction(self) -> str:
+      return 'Custom instruction'
+
+  agent = Agent(name='test_agent', planner=_CustomPlanReActPlanner())
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content='test message'
+  )
+  llm_request = LlmRequest()
+
+  async for _ in request_processor.run_async(invocation_context, llm_request):
+    pass
+
+  assert llm_request.config.system_instruction == 'Custom instruction'
+  assert PlanReActPlanner()._build_nl_planner_instruction().startswith(
+      '\nWhen answering the question'
+  )
+
 @pytest.mark.asyncio
 async def test_remove_thought_from_request_with_thoughts():
   """Test that PlanReActPlanner removes thought flags from content parts."""
@@ -264,6 +264,38 @@ async def test_generate_content_async(
     mock_client.aio.models.generate_content.assert_called_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("debug_enabled", [True, False])
+async def test_generate_content_async_builds_logs_only_when_debug_enabled(
+    gemini_llm, llm_request, generate_content_response, debug_enabled
+):
+  async def mock_coro():
+    return generate_content_response
+
+  with (
+      mock.patch.object(gemini_llm, "api_client") as mock_client,
+      mock.patch(
+          "google.adk.models.google_llm.logger.isEnabledFor",
+          return_value=debug_enabled,
+      ),
+      mock.patch(
+          "google.adk.models.google_llm._build_request_log",
+          return_value="request",
+      ) as mock_build_request_log,
+      mock.patch(
+          "google.adk.models.google_llm._build_response_log",
+          return_value="response",
+      ) as mock_build_response_log,
+  ):
+    mock_client.aio.models.generate_content.return_value = mock_coro()
+
+    async for _ in gemini_llm.generate_content_async(llm_request, stream=False):
+      pass
+
+  assert mock_build_request_log.called is debug_enabled
+  assert mock_build_response_log.called is debug_enabled
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async_stream(gemini_llm, llm_request):
   with mock.patch.object(gemini_llm, "api_client") as mock_client:
@@ -298,6 +298,20 @@ def test_append_instructions_empty_string_list():
   assert len(request.contents) == 0
 
 
+def test_append_instructions_skips_empty_strings():
+  """Test that empty strings don't add blank separators."""
+  request = LlmRequest()
+
+  request.append_instructions([''])
+  assert request.config.system_instruction is None
+
+  request.append_instructions(['First instruction', ''])
+  request.append_instructions(['', 'Second instruction'])
+
+  expected = 'First instruction\n\nSecond instruction'
+  assert request.config.system_instruction == expected
+
+
 def test_append_instructions_invalid_input():
   """Test append_instructions with invalid input types."""
   request = LlmRequest()
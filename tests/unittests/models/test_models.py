@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from google.adk import models
+from google.adk.models import registry
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.google_llm import Gemini
 from google.adk.models.registry import LLMRegistry
@@ -60,3 +61,22 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+def test_register_after_resolve_invalidates_cache():
+  class _FakeLlm(Gemini):
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+      return [r'fake-registry-model-.*']
+
+  with pytest.raises(ValueError):
+    LLMRegistry.resolve('fake-registry-model-1')
+
+  LLMRegistry.register(_FakeLlm)
+  try:
+    assert LLMRegistry.resolve('fake-registry-model-1') is _FakeLlm
+  finally:
+    registry._llm_registry_dict.pop(r'fake-registry-model-.*')
+    registry._llm_registry_patterns.pop(r'fake-registry-model-.*')
+    LLMRegistry.resolve.cache_clear()
@@ -695,7 +695,9 @@ class TestBigQueryAgentAnalyticsPlugin:
           user_message=types.Content(parts=[types.Part(text="Test")]),
       )
       await asyncio.sleep(0.01)
-      mock_log_error.assert_called_with("BQ Plugin: Write Error: Test BQ Error")
+      mock_log_error.assert_called_with(
+          "BQ Plugin: Write Error: %s", "Test BQ Error"
+      )
     mock_write_client.append_rows.assert_called_once()
 
   @pytest.mark.asyncio
@@ -119,6 +119,15 @@ def test_register_and_get_plugin(service: PluginManager, plugin1: TestPlugin):
   assert service.get_plugin("plugin1") is plugin1
 
 
+def test_get_plugin_returns_none_for_unknown_name(
+    service: PluginManager, plugin1: TestPlugin
+):
+  """Tests that looking up an unregistered plugin name returns None."""
+  service.register_plugin(plugin1)
+
+  assert service.get_plugin("unknown_plugin") is None
+
+
 def test_register_duplicate_plugin_name_raises_value_error(
     service: PluginManager, plugin1: TestPlugin
 ):
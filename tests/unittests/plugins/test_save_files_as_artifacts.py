@@ -13,6 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
@@ -173,6 +174,50 @@ class TestSaveFilesAsArtifactsPlugin:
     )
     assert result.parts[4].file_data.display_name == "file2.jpg"
 
+  @pytest.mark.asyncio
+  async def test_multiple_files_are_saved_concurrently(self):
+    """Test that files with distinct names are uploaded concurrently."""
+    both_started = asyncio.Event()
+    started = []
+
+    async def _save_side_effect(*_args, **kwargs):
+      started.append(kwargs["filename"])
+      if len(started) == 2:
+        both_started.set()
+      # Blocks forever if the saves run one after another.
+      await asyncio.wait_for(both_started.wait(), timeout=1)
+      return 0
+
+    self.mock_context.artifact_service.save_artifact.side_effect = (
+        _save_side_effect
+    )
+
+    user_message = types.Content(
+        parts=[
+            types.Part(
+                inline_data=types.Blob(
+                    display_name="a.txt", data=b"a", mime_type="text/plain"
+                )
+            ),
+            types.Part(
+                inline_data=types.Blob(
+                    display_name="b.txt", data=b"b", mime_type="text/plain"
+                )
+            ),
+        ]
+    )
+
+    result = await self.plugin.on_user_message_callback(
+        invocation_context=self.mock_context, user_message=user_message
+    )
+
+    assert started == ["a.txt", "b.txt"]
+    assert result
+    assert [part.text for part in result.parts[::2]] == [
+        '[Uploaded Artifact: "a.txt"]',
+        '[Uploaded Artifact: "b.txt"]',
+    ]
+
   @pytest.mark.asyncio
   async def test_unsupported_canonical_uri_keeps_inline_data(self):
     """Fallback to inline data when artifact URI is not model-accessible."""
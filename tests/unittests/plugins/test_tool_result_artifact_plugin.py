@@ -0,0 +1,93 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from google.adk.plugins.tool_result_artifact_plugin import ToolResultArtifactPlugin
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+_RESPONSES = [
+    types.Part.from_function_call(
+        name='execute_sql', args={'query': 'SELECT 1'}
+    ),
+    'done',
+]
+
+
+def _execute_sql_returning(num_rows):
+  def execute_sql(query: str) -> dict:
+    return {'rows': [[i, 'x' * 10] for i in range(num_rows)]}
+
+  return execute_sql
+
+
+@pytest.mark.asyncio
+async def test_large_result_is_saved_as_artifact():
+  plugin = ToolResultArtifactPlugin(
+      tool_names=['execute_sql'], max_inline_bytes=1024
+  )
+  runner = testing_utils.create_tool_runner(
+      _execute_sql_returning(100), _RESPONSES, [plugin]
+  )
+
+  events = await runner.run_async('hi')
+  [response] = testing_utils.get_function_responses(events)
+
+  filename = response['result_artifact']
+  assert filename.startswith('execute_sql_result_')
+  artifact = await runner.runner.artifact_service.load_artifact(
+      app_name=runner.app_name,
+      user_id='test_user',
+      session_id=runner.session_id,
+      filename=filename,
+  )
+  assert artifact.inline_data.mime_type == 'application/json'
+  assert json.loads(artifact.inline_data.data) == {
+      'rows': [[i, 'x' * 10] for i in range(100)]
+  }
+  assert response['result_size_bytes'] == len(artifact.inline_data.data)
+
+
+@pytest.mark.asyncio
+async def test_small_result_is_inlined():
+  plugin = ToolResultArtifactPlugin(
+      tool_names=['execute_sql'], max_inline_bytes=1024
+  )
+  runner = testing_utils.create_tool_runner(
+      _execute_sql_returning(2), _RESPONSES, [plugin]
+  )
+
+  events = await runner.run_async('hi')
+  [response] = testing_utils.get_function_responses(events)
+
+  assert response == {'rows': [[0, 'x' * 10], [1, 'x' * 10]]}
+
+
+@pytest.mark.asyncio
+async def test_tool_not_listed_is_inlined():
+  plugin = ToolResultArtifactPlugin(
+      tool_names=['other_tool'], max_inline_bytes=1024
+  )
+  runner = testing_utils.create_tool_runner(
+      _execute_sql_returning(100), _RESPONSES, [plugin]
+  )
+
+  events = await runner.run_async('hi')
+  [response] = testing_utils.get_function_responses(events)
+
+  assert len(response['rows']) == 100
@@ -0,0 +1,340 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.flows.llm_flows.functions import REQUEST_CONFIRMATION_FUNCTION_CALL_NAME
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.plugins import tool_result_cache_plugin
+from google.adk.plugins.tool_result_cache_plugin import ToolResultCachePlugin
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+def _function_call(question: str) -> types.Part:
+  return types.Part.from_function_call(
+      name='generate_sql', args={'question': question}
+  )
+
+
+def _tool_call_responses(questions):
+  responses = []
+  for question in questions:
+    responses.extend([_function_call(question), 'done'])
+  return responses
+
+
+def _recording_generate_sql(calls):
+  def generate_sql(question: str) -> dict:
+    calls.append(question)
+    return {'sql': f'SELECT {len(calls)}'}
+
+  return generate_sql
+
+
+class _BlockFirstCallPlugin(BasePlugin):
+  """Short-circuits the first tool call, like a policy plugin would."""
+
+  def __init__(self):
+    super().__init__(name='block_first_call')
+    self.blocked = False
+
+  async def before_tool_callback(self, *, tool, tool_args, tool_context):
+    if self.blocked:
+      return None
+    self.blocked = True
+    return {'sql': 'blocked'}
+
+
+class _HandleToolErrorPlugin(BasePlugin):
+  """Turns tool errors into responses, like a retry plugin would."""
+
+  def __init__(self):
+    super().__init__(name='handle_tool_error')
+
+  async def on_tool_error_callback(
+      self, *, tool, tool_args, tool_context, error
+  ):
+    return {'error': str(error)}
+
+
+class _WrapResultPlugin(BasePlugin):
+  """Overrides every tool result in its after_tool_callback."""
+
+  def __init__(self):
+    super().__init__(name='wrap_result')
+
+  async def after_tool_callback(self, *, tool, tool_args, tool_context, result):
+    return {'wrapped': result}
+
+
+async def _run_three_times(runner):
+  responses = []
+  for _ in range(3):
+    events = await runner.run_async('hi')
+    responses.extend(testing_utils.get_function_responses(events))
+  return responses
+
+
+@pytest.mark.asyncio
+async def test_repeated_tool_call_is_served_from_cache():
+  calls = []
+  plugin = ToolResultCachePlugin(tool_names=['generate_sql'])
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q1', 'q2']),
+      [plugin],
+  )
+
+  responses = await _run_three_times(runner)
+
+  assert calls == ['q1', 'q2']
+  assert responses == [
+      {'sql': 'SELECT 1'},
+      {'sql': 'SELECT 1'},
+      {'sql': 'SELECT 2'},
+  ]
+
+
+@pytest.mark.asyncio
+async def test_normalized_string_args_share_cache_entry():
+  calls = []
+  plugin = ToolResultCachePlugin(
+      tool_names=['generate_sql'], normalize_string_args=True
+  )
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(
+          ['Top 5 customers', '  top 5\tCUSTOMERS ', 'top 6 customers']
+      ),
+      [plugin],
+  )
+
+  await _run_three_times(runner)
+
+  # The tool still receives the arguments as given by the model.
+  assert calls == ['Top 5 customers', 'top 6 customers']
+
+
+@pytest.mark.asyncio
+async def test_tool_not_listed_is_not_cached():
+  calls = []
+  plugin = ToolResultCachePlugin(tool_names=['other_tool'])
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q1']),
+      [plugin],
+  )
+
+  await runner.run_async('hi')
+  await runner.run_async('hi')
+
+  assert calls == ['q1', 'q1']
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_call_is_not_cached():
+  calls = []
+
+  def generate_sql(question: str) -> dict:
+    calls.append(question)
+    if len(calls) == 1:
+      raise ValueError('backend unavailable')
+    return {'sql': 'SELECT 1'}
+
+  plugin = ToolResultCachePlugin(tool_names=['generate_sql'])
+  # The failing call never gets a final model response.
+  runner = testing_utils.create_tool_runner(
+      generate_sql,
+      [_function_call('q1'), _function_call('q1'), 'done'],
+      [plugin],
+  )
+
+  with pytest.raises(ValueError):
+    await runner.run_async('hi')
+  await runner.run_async('hi')
+
+  assert calls == ['q1', 'q1']
+
+
+@pytest.mark.asyncio
+async def test_handled_tool_error_is_not_cached():
+  calls = []
+
+  def generate_sql(question: str) -> dict:
+    calls.append(question)
+    if len(calls) == 1:
+      raise ValueError('backend unavailable')
+    return {'sql': 'SELECT 1'}
+
+  # The error plugin runs first, so the cache plugin never sees the error.
+  runner = testing_utils.create_tool_runner(
+      generate_sql,
+      _tool_call_responses(['q1', 'q1', 'q1']),
+      [
+          _HandleToolErrorPlugin(),
+          ToolResultCachePlugin(tool_names=['generate_sql']),
+      ],
+  )
+
+  responses = await _run_three_times(runner)
+
+  assert responses == [
+      {'error': 'backend unavailable'},
+      {'sql': 'SELECT 1'},
+      {'sql': 'SELECT 1'},
+  ]
+  assert calls == ['q1', 'q1']
+
+
+@pytest.mark.asyncio
+async def test_expired_and_evicted_entries_are_refetched():
+  calls = []
+  plugin = ToolResultCachePlugin(
+      tool_names=['generate_sql'], max_entries=1, ttl_seconds=10
+  )
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q2', 'q1', 'q1']),
+      [plugin],
+  )
+
+  with mock.patch.object(
+      tool_result_cache_plugin.time, 'monotonic', return_value=100.0
+  ):
+    await runner.run_async('hi')
+    # Caching q2 evicts q1.
+    await runner.run_async('hi')
+    await runner.run_async('hi')
+  with mock.patch.object(
+      tool_result_cache_plugin.time, 'monotonic', return_value=200.0
+  ):
+    await runner.run_async('hi')
+
+  assert calls == ['q1', 'q2', 'q1', 'q1']
+
+
+@pytest.mark.asyncio
+async def test_confirmation_response_is_not_cached():
+  calls = []
+  plugin = ToolResultCachePlugin(tool_names=['generate_sql'])
+  runner = testing_utils.create_tool_runner(
+      FunctionTool(
+          func=_recording_generate_sql(calls), require_confirmation=True
+      ),
+      _tool_call_responses(['q1', 'q1']),
+      [plugin],
+  )
+
+  for i in range(1, 3):
+    events = await runner.run_async('hi')
+    assert testing_utils.get_function_responses(events) == [{
+        'error': (
+            'This tool call requires confirmation, please approve or reject.'
+        )
+    }]
+    confirmation_call = events[1].content.parts[0].function_call
+    assert confirmation_call.name == REQUEST_CONFIRMATION_FUNCTION_CALL_NAME
+    events = await runner.run_async(
+        testing_utils.UserContent(
+            types.Part(
+                function_response=types.FunctionResponse(
+                    id=confirmation_call.id,
+                    name=REQUEST_CONFIRMATION_FUNCTION_CALL_NAME,
+                    response={'confirmed': True},
+                )
+            )
+        )
+    )
+    assert testing_utils.get_function_responses(events) == [
+        {'sql': f'SELECT {i}'}
+    ]
+
+  # Neither the confirmation request nor the confirmed result is replayed.
+  assert calls == ['q1', 'q1']
+  assert not plugin._cache
+
+
+@pytest.mark.asyncio
+async def test_agent_before_tool_callback_response_is_not_cached():
+  calls = []
+  callback_calls = []
+
+  def before_tool_callback(tool, args, tool_context):
+    callback_calls.append(args['question'])
+    if len(callback_calls) == 1:
+      return {'sql': 'blocked'}
+    return None
+
+  plugin = ToolResultCachePlugin(tool_names=['generate_sql'])
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q1', 'q1']),
+      [plugin],
+      before_tool_callback=before_tool_callback,
+  )
+
+  responses = await _run_three_times(runner)
+
+  assert responses == [
+      {'sql': 'blocked'},
+      {'sql': 'SELECT 1'},
+      {'sql': 'SELECT 1'},
+  ]
+  assert calls == ['q1']
+  assert callback_calls == ['q1', 'q1', 'q1']
+
+
+@pytest.mark.asyncio
+async def test_later_plugin_before_tool_response_is_not_cached():
+  calls = []
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q1', 'q1']),
+      [
+          ToolResultCachePlugin(tool_names=['generate_sql']),
+          _BlockFirstCallPlugin(),
+      ],
+  )
+
+  responses = await _run_three_times(runner)
+
+  assert responses == [
+      {'sql': 'blocked'},
+      {'sql': 'SELECT 1'},
+      {'sql': 'SELECT 1'},
+  ]
+  assert calls == ['q1']
+
+
+@pytest.mark.asyncio
+async def test_earlier_plugin_after_tool_response_is_not_cached():
+  calls = []
+  runner = testing_utils.create_tool_runner(
+      _recording_generate_sql(calls),
+      _tool_call_responses(['q1', 'q1', 'q1']),
+      [
+          _WrapResultPlugin(),
+          ToolResultCachePlugin(tool_names=['generate_sql']),
+      ],
+  )
+
+  responses = await _run_three_times(runner)
+
+  # The tool's own result is cached and the override applies on every hit.
+  assert responses == [{'wrapped': {'sql': 'SELECT 1'}}] * 3
+  assert calls == ['q1']
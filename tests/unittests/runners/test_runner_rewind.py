@@ -246,3 +246,39 @@ class TestRunnerRewind:
         session_id=session_id,
         filename="f2",
     ) == types.Part.from_text(text="f2v0")
+
+  @pytest.mark.asyncio
+  async def test_rewind_async_keeps_app_and_user_state(self):
+    """Tests rewind_async leaves app- and user-scoped state untouched."""
+    runner = self.runner
+    user_id = "test_user"
+    session_id = "test_session"
+
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    event1 = Event(
+        invocation_id="invocation1",
+        author="agent",
+        actions=EventActions(state_delta={"k1": "v1", "user:u1": "v1"}),
+    )
+    await runner.session_service.append_event(session=session, event=event1)
+    event2 = Event(
+        invocation_id="invocation2",
+        author="agent",
+        actions=EventActions(
+            state_delta={"k1": "v2", "app:a1": "v2", "user:u1": "v2"}
+        ),
+    )
+    await runner.session_service.append_event(session=session, event=event2)
+
+    await runner.rewind_async(
+        user_id=user_id,
+        session_id=session_id,
+        rewind_before_invocation_id="invocation2",
+    )
+
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    assert session.state == {"k1": "v1", "app:a1": "v2", "user:u1": "v2"}
@@ -0,0 +1,40 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+
+from google.adk.sessions import _session_util
+import pytest
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        {"key": "value", "nested": {"list": [1, 2.5, None, True]}},
+        {"unicode": "héllo 世界", "big_int": 2**70},
+        {"lone_surrogate": "\ud800"},
+    ],
+)
+def test_decode_json_round_trips_json_dumps(value):
+  """Tests that anything json.dumps writes is decoded back unchanged."""
+  assert _session_util.decode_json(json.dumps(value)) == value
+
+
+def test_decode_json_raises_on_invalid_json():
+  """Tests that invalid JSON still raises a ValueError."""
+  with pytest.raises(ValueError):
+    _session_util.decode_json("{not json")
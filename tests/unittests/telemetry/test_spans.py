@@ -155,6 +155,38 @@ async def test_trace_call_llm(monkeypatch, mock_span_fixture):
   )
 
 
+@pytest.mark.asyncio
+async def test_trace_call_llm_skips_non_recording_span(
+    monkeypatch, mock_span_fixture
+):
+  """Test trace_call_llm does not serialize the request for unrecorded spans."""
+  mock_span_fixture.is_recording.return_value = False
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  build_request = mock.Mock()
+  monkeypatch.setattr(
+      'google.adk.telemetry.tracing._build_llm_request_for_trace',
+      build_request,
+  )
+
+  agent = LlmAgent(name='test_agent')
+  invocation_context = await _create_invocation_context(agent)
+  llm_request = LlmRequest(
+      model='gemini-pro',
+      contents=[
+          types.Content(role='user', parts=[types.Part(text='Hello')]),
+      ],
+      config=types.GenerateContentConfig(),
+  )
+  llm_response = LlmResponse(turn_complete=True)
+
+  trace_call_llm(invocation_context, 'test_event_id', llm_request, llm_response)
+
+  build_request.assert_not_called()
+  mock_span_fixture.set_attribute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_trace_call_llm_with_binary_content(
     monkeypatch, mock_span_fixture
@@ -517,3 +549,4 @@ def test_trace_merged_tool_disabling_request_response_content(
       "Attribute 'gcp.vertex.agent.tool_response' was incorrectly set on the"
       ' span.'
   )
+  mock_event_fixture.model_dumps_json.assert_not_called()
@@ -27,6 +27,7 @@ from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactServ
 from google.adk.cli.utils.agent_loader import AgentLoader
 from google.adk.events.event import Event
 from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.runners import _resolve_agent_origin
 from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
@@ -493,6 +494,21 @@ async def test_runner_allows_nested_agent_directories(tmp_path, monkeypatch):
     assert result is False
 
 
+def test_runner_agent_origin_resolved_once_per_agent_class():
+  _resolve_agent_origin.cache_clear()
+  for _ in range(3):
+    Runner(
+        app_name="test_app",
+        agent=MockLlmAgent("root_agent"),
+        session_service=InMemorySessionService(),
+        artifact_service=InMemoryArtifactService(),
+    )
+
+  cache_info = _resolve_agent_origin.cache_info()
+  assert cache_info.misses == 1
+  assert cache_info.hits == 2
+
+
 class TestRunnerWithPlugins:
   """Tests for Runner with plugins."""
 
@@ -15,6 +15,7 @@
 import asyncio
 import contextlib
 from typing import AsyncGenerator
+from typing import Callable
 from typing import Generator
 from typing import Optional
 from typing import Union
@@ -38,6 +39,7 @@ from google.adk.runners import InMemoryRunner as AfInMemoryRunner
 from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
+from google.adk.tools.base_tool import BaseTool
 from google.adk.utils.context_utils import Aclosing
 from google.genai import types
 from google.genai.types import Part
@@ -56,6 +58,32 @@ def create_test_agent(name: str = 'test_agent') -> LlmAgent:
   return LlmAgent(name=name)
 
 
+def create_tool_runner(
+    tool: Union[Callable, BaseTool],
+    responses: list[Union[types.Part, str]],
+    plugins: list[BasePlugin],
+    **agent_kwargs,
+) -> 'InMemoryRunner':
+  """Create a runner for a root agent with a single tool.
+
+  Args:
+    tool: The tool of the agent.
+    responses: The mocked model responses, e.g. function calls and texts.
+    plugins: The plugins of the runner.
+    **agent_kwargs: Additional arguments for the agent.
+
+  Returns:
+    An InMemoryRunner for the agent.
+  """
+  agent = Agent(
+      name='root_agent',
+      model=MockModel.create(responses=responses),
+      tools=[tool],
+      **agent_kwargs,
+  )
+  return InMemoryRunner(agent, plugins=plugins)
+
+
 class UserContent(types.Content):
 
   def __init__(self, text_or_part: str):
@@ -128,6 +156,15 @@ def simplify_events(events: list[Event]) -> list[(str, types.Part)]:
   ]
 
 
+# Extracts the responses of all function responses in the events.
+def get_function_responses(events: list[Event]) -> list[dict]:
+  return [
+      function_response.response
+      for event in events
+      for function_response in event.get_function_responses()
+  ]
+
+
 END_OF_AGENT = 'end_of_agent'
 
 
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
+from unittest import mock
 from unittest.mock import MagicMock
 
 from google.adk.auth.auth_credential import AuthCredential
 from google.adk.auth.auth_schemes import AuthScheme
+from google.adk.tools.apihub_tool import apihub_toolset
 from google.adk.tools.apihub_tool.apihub_toolset import APIHubToolset
 from google.adk.tools.apihub_tool.clients.apihub_client import BaseAPIHubClient
 import pytest
@@ -172,6 +176,108 @@ async def test_get_tools_with_auth(mock_auth_scheme, mock_auth_credential):
   assert len(tools) == 1
 
 
+@pytest.mark.asyncio
+async def test_apihub_toolset_lazy_loading_off_event_loop():
+  fetch_threads = []
+
+  class MockAPIHubClientRecordingThread(MockAPIHubClient):
+
+    def get_spec_content(self, _apihub_resource_name: str) -> str:
+      fetch_threads.append(threading.get_ident())
+      return super().get_spec_content(_apihub_resource_name)
+
+  tool = APIHubToolset(
+      apihub_resource_name='test_resource',
+      apihub_client=MockAPIHubClientRecordingThread(),
+      lazy_load_spec=True,
+  )
+  tools = await tool.get_tools()
+
+  assert len(tools) == 1
+  assert len(fetch_threads) == 1
+  assert fetch_threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_apihub_toolset_refreshes_spec_after_interval():
+  specs = [
+      MockAPIHubClient().get_spec_content(''),
+      MockAPIHubClient().get_spec_content(''),
+      MockAPIHubClient().get_spec_content('').replace('testGet', 'testList'),
+  ]
+
+  class MockAPIHubClientChangingSpec(BaseAPIHubClient):
+
+    def get_spec_content(self, _apihub_resource_name: str) -> str:
+      return specs.pop(0)
+
+  with mock.patch.object(
+      apihub_toolset.time, 'monotonic', return_value=100.0
+  ) as mock_monotonic:
+    tool = APIHubToolset(
+        apihub_resource_name='test_resource',
+        apihub_client=MockAPIHubClientChangingSpec(),
+        spec_refresh_interval_seconds=60,
+    )
+    first_tools = await tool.get_tools()
+    openapi_toolset = tool._openapi_toolset
+
+    # The spec is unchanged, so the tools are not regenerated.
+    mock_monotonic.return_value = 200.0
+    assert await tool.get_tools() == first_tools
+    assert tool._openapi_toolset is openapi_toolset
+
+    # Within the refresh interval, the spec is not fetched again.
+    mock_monotonic.return_value = 250.0
+    assert await tool.get_tools() == first_tools
+    assert len(specs) == 1
+
+    mock_monotonic.return_value = 300.0
+    tools = await tool.get_tools()
+
+  assert [t.name for t in first_tools] == ['test_get']
+  assert [t.name for t in tools] == ['test_list']
+  assert not specs
+
+
+@pytest.mark.asyncio
+async def test_apihub_toolset_failed_refresh_waits_for_next_interval():
+  fetches = []
+
+  class MockAPIHubClientUnavailable(MockAPIHubClient):
+
+    def get_spec_content(self, _apihub_resource_name: str) -> str:
+      fetches.append(_apihub_resource_name)
+      if len(fetches) > 1:
+        raise ConnectionError('API Hub is unavailable')
+      return super().get_spec_content(_apihub_resource_name)
+
+  with mock.patch.object(
+      apihub_toolset.time, 'monotonic', return_value=100.0
+  ) as mock_monotonic:
+    tool = APIHubToolset(
+        apihub_resource_name='test_resource',
+        apihub_client=MockAPIHubClientUnavailable(),
+        spec_refresh_interval_seconds=60,
+    )
+    first_tools = await tool.get_tools()
+
+    # Concurrent callers share one failed refresh and keep the current tools.
+    mock_monotonic.return_value = 200.0
+    results = await asyncio.gather(tool.get_tools(), tool.get_tools())
+    assert results == [first_tools, first_tools]
+    assert len(fetches) == 2
+
+    # The failed refresh is not retried until the interval has passed again.
+    mock_monotonic.return_value = 250.0
+    assert await tool.get_tools() == first_tools
+    assert len(fetches) == 2
+
+    mock_monotonic.return_value = 300.0
+    assert await tool.get_tools() == first_tools
+    assert len(fetches) == 3
+
+
 @pytest.mark.asyncio
 async def test_apihub_toolset_get_tools_lazy_load_empty_spec():
 
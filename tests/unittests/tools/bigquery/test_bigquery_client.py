@@ -20,6 +20,7 @@ from unittest import mock
 import google.adk
 from google.adk.tools.bigquery.client import get_bigquery_client
 import google.auth
+import google.auth.credentials
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud.bigquery import client as bigquery_client
 from google.oauth2.credentials import Credentials
@@ -201,3 +202,50 @@ def test_bigquery_client_location_custom():
   # Verify that the client has the desired project set
   assert client.project == "test-gcp-project"
   assert client.location == "us-central1"
+
+
+def test_bigquery_client_reused_for_same_credentials():
+  """Test BigQuery clients are shared only between identical requests."""
+  credentials = mock.create_autospec(
+      google.auth.credentials.Credentials, instance=True
+  )
+
+  client = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  assert (
+      get_bigquery_client(project="test-gcp-project", credentials=credentials)
+      is client
+  )
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project",
+          credentials=mock.create_autospec(
+              google.auth.credentials.Credentials, instance=True
+          ),
+      )
+      is not client
+  )
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project",
+          credentials=credentials,
+          location="us-central1",
+      )
+      is not client
+  )
+
+
+def test_bigquery_client_not_reused_for_oauth_credentials():
+  """Test BigQuery clients for user OAuth credentials are not shared."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  client = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  assert (
+      get_bigquery_client(project="test-gcp-project", credentials=credentials)
+      is not client
+  )
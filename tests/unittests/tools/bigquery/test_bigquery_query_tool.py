@@ -1136,6 +1136,41 @@ def test_execute_sql_result_dtype(
   assert result == {"status": "SUCCESS", "rows": tool_result_rows}
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch.object(bigquery.Client, "query_and_wait", autospec=True)
+@mock.patch.object(bigquery.Client, "query", autospec=True)
+def test_execute_sql_result_bigquery_rows(mock_query, mock_query_and_wait):
+  """Test execute_sql tool converts BigQuery Row objects returned by the API."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  query_job = mock.create_autospec(bigquery.QueryJob)
+  query_job.statement_type = "SELECT"
+  mock_query.return_value = query_job
+  field_to_index = {"name": 0, "tags": 1, "day": 2}
+  mock_query_and_wait.return_value = [
+      bigquery.Row(
+          ("Alice", ["a", "b"], datetime.date(2025, 7, 21)), field_to_index
+      ),
+      bigquery.Row(("Bob", [], None), field_to_index),
+  ]
+
+  result = query_tool.execute_sql(
+      "my_project",
+      "SELECT name, tags, day FROM t",
+      credentials,
+      BigQueryToolConfig(),
+      tool_context,
+  )
+
+  assert result == {
+      "status": "SUCCESS",
+      "rows": [
+          {"name": "Alice", "tags": ["a", "b"], "day": "2025-07-21"},
+          {"name": "Bob", "tags": [], "day": None},
+      ],
+  }
+
+
 @mock.patch.object(bq_client_lib, "get_bigquery_client", autospec=True)
 def test_execute_sql_bq_client_creation(mock_get_bigquery_client):
   """Test BigQuery client creation params during execute_sql tool invocation."""
@@ -1658,10 +1693,10 @@ def test_detect_anomalies_with_invalid_id_cols():
         pytest.param(WriteMode.ALLOWED, False, 0, 1, id="write-allowed"),
         pytest.param(WriteMode.ALLOWED, True, 1, 0, id="write-allowed-dry-run"),
         pytest.param(WriteMode.BLOCKED, False, 1, 1, id="write-blocked"),
-        pytest.param(WriteMode.BLOCKED, True, 2, 0, id="write-blocked-dry-run"),
+        pytest.param(WriteMode.BLOCKED, True, 1, 0, id="write-blocked-dry-run"),
         pytest.param(WriteMode.PROTECTED, False, 2, 1, id="write-protected"),
         pytest.param(
-            WriteMode.PROTECTED, True, 3, 0, id="write-protected-dry-run"
+            WriteMode.PROTECTED, True, 2, 0, id="write-protected-dry-run"
         ),
     ],
 )
@@ -131,3 +131,19 @@ async def test_bigquery_toolset_unknown_tool(selected_tools, returned_tools):
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+def test_bigquery_package_lazy_exports():
+  """Test that the package exports resolve lazily to the real classes."""
+  from google.adk.tools import bigquery
+  from google.adk.tools.bigquery import bigquery_credentials
+  from google.adk.tools.bigquery import bigquery_toolset
+
+  assert bigquery.BigQueryToolset is bigquery_toolset.BigQueryToolset
+  assert (
+      bigquery.BigQueryCredentialsConfig
+      is bigquery_credentials.BigQueryCredentialsConfig
+  )
+  assert set(bigquery.__all__) <= set(dir(bigquery))
+  with pytest.raises(AttributeError):
+    _ = bigquery.NotATool
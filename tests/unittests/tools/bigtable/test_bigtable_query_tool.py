@@ -26,6 +26,7 @@ from google.adk.tools.tool_context import ToolContext
 from google.auth.credentials import Credentials
 from google.cloud import bigtable
 from google.cloud.bigtable.data.execute_query import ExecuteQueryIterator
+from google.cloud.bigtable.data.execute_query import QueryResultRow
 import pytest
 
 
@@ -47,7 +48,7 @@ def test_execute_sql_basic():
 
     # Mock row data
     mock_row = mock.MagicMock()
-    mock_row.fields = {"col1": "val1", "col2": 123}
+    mock_row.fields = [("col1", "val1"), ("col2", 123)]
     mock_iterator.__iter__.return_value = [mock_row]
 
     result = execute_sql(
@@ -67,6 +68,39 @@ def test_execute_sql_basic():
     mock_iterator.close.assert_called_once()
 
 
+def test_execute_sql_query_result_rows():
+  """Test execute_sql tool with rows returned by the Bigtable client."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+
+  with mock.patch(
+      "google.adk.tools.bigtable.client.get_bigtable_data_client"
+  ) as mock_get_client:
+    mock_client = mock.MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_iterator = mock.create_autospec(ExecuteQueryIterator, instance=True)
+    mock_client.execute_query.return_value = mock_iterator
+
+    row = QueryResultRow()
+    row.add_field("_key", b"row-1")
+    row.add_field("count", 3)
+    mock_iterator.__iter__.return_value = [row]
+
+    result = execute_sql(
+        project_id="my_project",
+        instance_id="my_instance",
+        credentials=credentials,
+        query="SELECT _key, count FROM my_table",
+        settings=BigtableToolSettings(),
+        tool_context=tool_context,
+    )
+
+    assert result == {
+        "status": "SUCCESS",
+        "rows": [{"_key": "b'row-1'", "count": 3}],
+    }
+
+
 def test_execute_sql_truncated():
   """Test execute_sql tool truncation functionality."""
   project = "my_project"
@@ -85,9 +119,9 @@ def test_execute_sql_truncated():
 
     # Mock row data
     mock_row1 = mock.MagicMock()
-    mock_row1.fields = {"col1": "val1"}
+    mock_row1.fields = [("col1", "val1")]
     mock_row2 = mock.MagicMock()
-    mock_row2.fields = {"col1": "val2"}
+    mock_row2.fields = [("col1", "val2")]
     mock_iterator.__iter__.return_value = [mock_row1, mock_row2]
 
     result = execute_sql(
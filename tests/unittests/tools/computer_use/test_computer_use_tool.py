@@ -258,6 +258,8 @@ class TestComputerUseTool:
 
     # Check that coordinates were normalized
     specific_mock_func.assert_called_once_with(x=960, y=324)
+    # The caller's args are left untouched
+    assert args == {"x": 500, "y": 300}
 
     # Check return format for ComputerState
     expected_result = {
@@ -20,6 +20,7 @@ from google.adk.auth.auth_credential import ServiceAccountCredential
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.base_toolset import ToolPredicate
+from google.adk.tools.google_api_tool import google_api_toolset
 from google.adk.tools.google_api_tool.google_api_tool import GoogleApiTool
 from google.adk.tools.google_api_tool.google_api_toolset import GoogleApiToolset
 from google.adk.tools.google_api_tool.googleapi_to_openapi_converter import GoogleApiToOpenApiConverter
@@ -98,6 +99,14 @@ def mock_converter_instance():  # Renamed from mock_converter
   return mock_conv
 
 
+@pytest.fixture(autouse=True)
+def clear_openapi_spec_cache():
+  """Clears the process-wide spec cache so each test sees its own mocks."""
+  google_api_toolset._get_openapi_spec.cache_clear()
+  yield
+  google_api_toolset._get_openapi_spec.cache_clear()
+
+
 @pytest.fixture
 def mock_readonly_context():
   """Fixture for a mock ReadonlyContext."""
@@ -107,6 +116,35 @@ def mock_readonly_context():
 class TestGoogleApiToolset:
   """Test suite for the GoogleApiToolset class."""
 
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.OpenAPIToolset"
+  )
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.GoogleApiToOpenApiConverter"
+  )
+  def test_init_reuses_converted_spec(
+      self,
+      mock_converter_class,
+      mock_openapi_toolset_class,
+      mock_converter_instance,
+  ):
+    """Test toolsets for the same API convert the discovery doc only once."""
+    mock_converter_class.return_value = mock_converter_instance
+
+    GoogleApiToolset(api_name=TEST_API_NAME, api_version=TEST_API_VERSION)
+    GoogleApiToolset(api_name=TEST_API_NAME, api_version=TEST_API_VERSION)
+
+    mock_converter_class.assert_called_once_with(
+        TEST_API_NAME, TEST_API_VERSION
+    )
+    mock_converter_instance.convert.assert_called_once()
+    first_spec, second_spec = [
+        kwargs["spec_dict"]
+        for _, kwargs in mock_openapi_toolset_class.call_args_list
+    ]
+    assert first_spec == second_spec
+    assert first_spec is not second_spec
+
   @mock.patch(
       "google.adk.tools.google_api_tool.google_api_toolset.OpenAPIToolset"
   )
@@ -222,6 +260,59 @@ class TestGoogleApiToolset:
       )
       assert tools[i] is mock_google_api_tool_instances[i]
 
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.GoogleApiTool"
+  )
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.OpenAPIToolset"
+  )
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.GoogleApiToOpenApiConverter"
+  )
+  async def test_get_tools_reuses_wrapped_tools(
+      self,
+      mock_converter_class,
+      mock_openapi_toolset_class,
+      mock_google_api_tool_class,
+      mock_converter_instance,
+      mock_openapi_toolset_instance,
+      mock_rest_api_tools,
+      mock_readonly_context,
+  ):
+    """Test get_tools only wraps each RestApiTool once per auth config."""
+    mock_converter_class.return_value = mock_converter_instance
+    mock_openapi_toolset_class.return_value = mock_openapi_toolset_instance
+    mock_openapi_toolset_instance.get_tools = mock.AsyncMock(
+        return_value=mock_rest_api_tools
+    )
+    mock_google_api_tool_class.side_effect = lambda *args, **kwargs: (
+        mock.MagicMock(spec=GoogleApiTool)
+    )
+
+    tool_set = GoogleApiToolset(
+        api_name=TEST_API_NAME, api_version=TEST_API_VERSION
+    )
+
+    first = await tool_set.get_tools(mock_readonly_context)
+    second = await tool_set.get_tools(mock_readonly_context)
+
+    assert second == first
+    assert mock_google_api_tool_class.call_count == len(mock_rest_api_tools)
+
+    # Changing the auth config re-wraps the tools with the new credentials.
+    tool_set.configure_auth("cid", "csecret")
+    third = await tool_set.get_tools(mock_readonly_context)
+
+    assert all(new is not old for new, old in zip(third, first))
+    assert mock_google_api_tool_class.call_count == 2 * len(mock_rest_api_tools)
+    mock_google_api_tool_class.assert_called_with(
+        mock_rest_api_tools[-1],
+        "cid",
+        "csecret",
+        None,
+        additional_headers=None,
+    )
+
   @mock.patch(
       "google.adk.tools.google_api_tool.google_api_toolset.OpenAPIToolset"
   )
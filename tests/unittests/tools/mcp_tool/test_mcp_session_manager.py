@@ -14,9 +14,7 @@
 
 import asyncio
 from datetime import timedelta
-import hashlib
 from io import StringIO
-import json
 import sys
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -180,10 +178,23 @@ class TestMCPSessionManager:
     # Same headers should generate same key
     assert key1 == key3
 
-    # Should be deterministic hash
-    headers_json = json.dumps(headers1, sort_keys=True)
-    expected_hash = hashlib.md5(headers_json.encode()).hexdigest()
-    assert key1 == f"session_{expected_hash}"
+    # Key should not depend on header order
+    key4 = manager._generate_session_key(
+        {"X-Trace": "1", "Authorization": "Bearer token1"}
+    )
+    key5 = manager._generate_session_key(
+        {"Authorization": "Bearer token1", "X-Trace": "1"}
+    )
+    assert key4 == key5
+    assert key4 != key1
+
+  def test_generate_session_key_no_headers(self):
+    """Test session key generation for HTTP connections without headers."""
+    sse_params = SseConnectionParams(url="https://example.com/mcp")
+    manager = MCPSessionManager(sse_params)
+
+    assert manager._generate_session_key(None) == "session_no_headers"
+    assert manager._generate_session_key({}) == "session_no_headers"
 
   def test_merge_headers_stdio(self):
     """Test header merging for stdio connections."""
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import Any
 from typing import Dict
 
@@ -681,3 +682,53 @@ def test_parse_spec_with_path_level_parameters(openapi_spec_generator):
   assert local_param is not None
   assert local_param.param_location == "header"
   assert local_param.type_value is int
+
+
+def test_parse_does_not_mutate_input_spec(openapi_spec_generator):
+  """Test that parsing leaves the caller's spec dictionary untouched."""
+  openapi_spec = {
+      "openapi": "3.1.0",
+      "info": {"title": "No Mutation API", "version": "1.0.0"},
+      "paths": {
+          "/test": {
+              "parameters": [{"$ref": "#/components/parameters/Global"}],
+              "get": {
+                  "responses": {
+                      "200": {
+                          "description": "Successful response",
+                          "content": {
+                              "application/json": {
+                                  "schema": {
+                                      "$ref": "#/components/schemas/Item"
+                                  }
+                              }
+                          },
+                      }
+                  },
+              },
+          }
+      },
+      "components": {
+          "parameters": {
+              "Global": {
+                  "name": "global_param",
+                  "in": "query",
+                  "schema": {"type": "string"},
+              }
+          },
+          "schemas": {
+              "Item": {
+                  "type": "object",
+                  "properties": {"name": {"type": "string"}},
+              }
+          },
+      },
+  }
+  original_spec = copy.deepcopy(openapi_spec)
+
+  parsed_operations = openapi_spec_generator.parse(openapi_spec)
+
+  assert len(parsed_operations) == 1
+  assert parsed_operations[0].name == "test_get"
+  assert len(parsed_operations[0].parameters) == 1
+  assert openapi_spec == original_spec
@@ -61,6 +61,16 @@ def test_openapi_toolset_initialization_from_yaml_string(openapi_spec: Dict):
   assert all(isinstance(tool, RestApiTool) for tool in toolset._tools)
 
 
+def test_openapi_toolset_load_yaml_spec_matches_safe_load(
+    openapi_spec: Dict,
+):
+  """Test that YAML specs load to the same dict as yaml.safe_load."""
+  spec_str = yaml.dump(openapi_spec)
+  toolset = OpenAPIToolset(spec_dict=openapi_spec)
+
+  assert toolset._load_spec(spec_str, "yaml") == yaml.safe_load(spec_str)
+
+
 def test_openapi_toolset_tool_existing(openapi_spec: Dict):
   """Test the tool() method for an existing tool."""
   toolset = OpenAPIToolset(spec_dict=openapi_spec)
@@ -19,6 +19,7 @@ import re
 from unittest import mock
 
 from google.adk.tools.spanner.client import get_spanner_client
+import google.auth.credentials
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
 import pytest
@@ -140,3 +141,32 @@ def test_spanner_client_user_agent():
         r"adk-spanner-tool google-adk/([0-9A-Za-z._\-+/]+)",
         client._client_info.user_agent,
     )
+
+
+def test_spanner_client_shared_per_project_and_credentials():
+  """Test spanner clients are reused for the same project and credentials."""
+  credentials = mock.create_autospec(
+      google.auth.credentials.Credentials, instance=True
+  )
+  other_credentials = mock.create_autospec(
+      google.auth.credentials.Credentials, instance=True
+  )
+
+  client = get_spanner_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  assert (
+      get_spanner_client(project="test-gcp-project", credentials=credentials)
+      is client
+  )
+  assert (
+      get_spanner_client(
+          project="test-gcp-project", credentials=other_credentials
+      )
+      is not client
+  )
+  assert (
+      get_spanner_client(project="other-gcp-project", credentials=credentials)
+      is not client
+  )
@@ -0,0 +1,82 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from google.adk.tools.spanner import utils
+from google.adk.tools.spanner.settings import SpannerToolSettings
+from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
+
+
+def _execute_sql(mock_get_spanner_client, rows, settings=None):
+  mock_snapshot = MagicMock()
+  mock_snapshot.execute_sql.return_value = iter(rows)
+  mock_database = MagicMock()
+  mock_database.snapshot.return_value.__enter__.return_value = mock_snapshot
+  mock_database.database_dialect = DatabaseDialect.GOOGLE_STANDARD_SQL
+  mock_get_spanner_client.return_value.instance.return_value.database.return_value = (
+      mock_database
+  )
+
+  return utils.execute_sql(
+      project_id="test-project",
+      instance_id="test-instance",
+      database_id="test-database",
+      query="SELECT * FROM test_table",
+      credentials=MagicMock(),
+      settings=settings or SpannerToolSettings(),
+      tool_context=MagicMock(),
+  )
+
+
+@patch("google.adk.tools.spanner.client.get_spanner_client")
+def test_execute_sql_rows(mock_get_spanner_client):
+  """Test execute_sql keeps JSON rows and stringifies the others."""
+  timestamp = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+  rows = [
+      ["a", 1, 1.5, True, None],
+      ["b", [1, 2], {"k": "v"}],
+      ["c", timestamp],
+  ]
+
+  result = _execute_sql(mock_get_spanner_client, rows)
+
+  assert result == {
+      "status": "SUCCESS",
+      "rows": [
+          ["a", 1, 1.5, True, None],
+          ["b", [1, 2], {"k": "v"}],
+          str(["c", timestamp]),
+      ],
+  }
+
+
+@patch("google.adk.tools.spanner.client.get_spanner_client")
+def test_execute_sql_rows_truncated(mock_get_spanner_client):
+  """Test execute_sql stops at the configured maximum number of rows."""
+  rows = [[i] for i in range(5)]
+
+  result = _execute_sql(
+      mock_get_spanner_client,
+      rows,
+      settings=SpannerToolSettings(max_executed_query_result_rows=2),
+  )
+
+  assert result == {
+      "status": "SUCCESS",
+      "rows": [[0], [1]],
+      "result_is_likely_truncated": True,
+  }
@@ -304,6 +304,41 @@ def test_update_state():
   assert runner.session.state['state_1'] == 'changed_value'
 
 
+def test_internal_state_not_forwarded():
+  """The agent tool does not see the parent's ADK internal state."""
+
+  mock_model = testing_utils.MockModel.create(
+      responses=[function_call_no_schema, 'response1', 'response2']
+  )
+  tool_agent_state = {}
+
+  def set_state_callback(callback_context: CallbackContext):
+    callback_context.state['state_1'] = 'state1_value'
+    callback_context.state['_adk_internal'] = 'internal_value'
+
+  def record_state_callback(callback_context: CallbackContext):
+    tool_agent_state.update(callback_context.state.to_dict())
+
+  tool_agent = Agent(
+      name='tool_agent',
+      model=mock_model,
+      before_agent_callback=record_state_callback,
+  )
+
+  root_agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[AgentTool(agent=tool_agent)],
+      before_agent_callback=set_state_callback,
+  )
+
+  runner = testing_utils.InMemoryRunner(root_agent)
+
+  runner.run('test1')
+  assert tool_agent_state == {'state_1': 'state1_value'}
+  assert runner.session.state['_adk_internal'] == 'internal_value'
+
+
 @mark.asyncio
 async def test_update_artifacts():
   """The agent tool can read and write artifacts."""
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.sessions.session import Session
+from google.adk.tools._automatic_function_calling_util import build_function_declaration
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_confirmation import ToolConfirmation
 from google.adk.tools.tool_context import ToolContext
@@ -428,3 +431,59 @@ async def test_run_async_parameter_filtering(mock_tool_context):
   assert result == {"arg1": "test", "arg2": 42}
   # Explicitly verify that unexpected_param was filtered out and not passed to the function
   assert "unexpected_param" not in result
+
+
+@pytest.mark.asyncio
+async def test_run_async_computes_signature_once(mock_tool_context):
+  """Test that the function signature is computed once and then reused."""
+  tool = FunctionTool(async_function_for_testing_with_2_arg_and_no_tool_context)
+
+  with patch(
+      "google.adk.tools.function_tool.inspect.signature",
+      wraps=inspect.signature,
+  ) as mock_signature:
+    for _ in range(3):
+      await tool.run_async(
+          args={"arg1": "test_value_1", "arg2": "test_value_2"},
+          tool_context=mock_tool_context,
+      )
+
+  assert mock_signature.call_count == 1
+
+
+def test_signature_follows_reassigned_func():
+  """Test that reassigning func invalidates the cached signature."""
+  tool = FunctionTool(function_for_testing_with_no_args)
+  assert not tool._signature.parameters
+
+  tool.func = async_function_for_testing_with_2_arg_and_no_tool_context
+  assert list(tool._signature.parameters) == ["arg1", "arg2"]
+
+
+def test_get_declaration_is_built_once_and_copied():
+  """Test that the declaration is cached and callers get independent copies."""
+  tool = FunctionTool(async_function_for_testing_with_2_arg_and_no_tool_context)
+
+  with patch(
+      "google.adk.tools.function_tool.build_function_declaration",
+      wraps=build_function_declaration,
+  ) as mock_build:
+    first = tool._get_declaration()
+    first.name = "renamed"
+    second = tool._get_declaration()
+
+  assert mock_build.call_count == 1
+  assert (
+      second.name == "async_function_for_testing_with_2_arg_and_no_tool_context"
+  )
+  assert first is not second
+
+
+def test_get_declaration_rebuilt_when_ignore_params_change():
+  """Test that changing the ignored params invalidates the declaration."""
+  tool = FunctionTool(async_function_for_testing_with_2_arg_and_no_tool_context)
+  assert set(tool._get_declaration().parameters.properties) == {"arg1", "arg2"}
+
+  tool._ignore_params.append("arg2")
+
+  assert set(tool._get_declaration().parameters.properties) == {"arg1"}
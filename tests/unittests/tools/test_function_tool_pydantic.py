@@ -126,6 +126,29 @@ def test_preprocess_args_with_existing_pydantic_model():
   assert user.name == "Bob"
 
 
+def test_preprocess_args_without_conversion_does_not_copy():
+  """Test _preprocess_args returns the input dict when nothing is converted."""
+  tool = FunctionTool(function_with_mixed_args)
+  input_args = {"name": "test", "user": UserModel(name="Bob", age=25)}
+
+  processed_args = tool._preprocess_args(input_args)
+
+  assert processed_args is input_args
+
+
+def test_preprocess_args_with_conversion_does_not_mutate_input():
+  """Test _preprocess_args copies the input dict before converting."""
+  tool = FunctionTool(sync_function_with_pydantic_model)
+  user_dict = {"name": "Alice", "age": 30}
+  input_args = {"user": user_dict}
+
+  processed_args = tool._preprocess_args(input_args)
+
+  assert processed_args is not input_args
+  assert input_args["user"] is user_dict
+  assert isinstance(processed_args["user"], UserModel)
+
+
 def test_preprocess_args_with_optional_pydantic_model_none():
   """Test _preprocess_args handles None for optional Pydantic models."""
   tool = FunctionTool(function_with_optional_pydantic_model)
@@ -212,6 +235,21 @@ def test_preprocess_args_with_non_pydantic_parameters():
   assert processed_args == input_args
 
 
+def test_pydantic_params_resolved_once_per_function():
+  """Test Pydantic parameter types are resolved once and follow func."""
+  tool = FunctionTool(function_with_optional_pydantic_model)
+
+  pydantic_params = tool._pydantic_params
+  assert pydantic_params == {
+      "user": UserModel,
+      "preferences": PreferencesModel,
+  }
+  assert tool._pydantic_params is pydantic_params
+
+  tool.func = function_with_mixed_args
+  assert tool._pydantic_params == {"user": UserModel}
+
+
 @pytest.mark.asyncio
 async def test_run_async_with_pydantic_model_conversion_sync_function():
   """Test run_async with Pydantic model conversion for sync function."""
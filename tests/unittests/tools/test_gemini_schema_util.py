@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from google.adk.tools._gemini_schema_util import _sanitize_schema_formats_for_gemini
+from google.adk.tools._gemini_schema_util import _schema_key_to_snake_case
 from google.adk.tools._gemini_schema_util import _to_gemini_schema
 from google.adk.tools._gemini_schema_util import _to_snake_case
 from google.genai.types import Schema
@@ -594,6 +595,25 @@ class TestToGeminiSchema:
     assert gemini_schema.type == Type.OBJECT
     assert gemini_schema.properties is None
 
+  def test_sanitize_converts_each_schema_key_once(self, mocker):
+    """Tests that schema keys are snake-cased once, not per occurrence."""
+    _schema_key_to_snake_case.cache_clear()
+    mock_to_snake_case = mocker.patch(
+        "google.adk.tools._gemini_schema_util._to_snake_case",
+        wraps=_to_snake_case,
+    )
+    schema = {
+        "type": "object",
+        "properties": {
+            name: {"type": "string", "maxLength": 5} for name in ("a", "b", "c")
+        },
+    }
+
+    sanitized = _sanitize_schema_formats_for_gemini(schema)
+
+    assert sanitized["properties"]["a"] == {"type": "string", "max_length": 5}
+    assert mock_to_snake_case.call_count == 3  # type, properties, maxLength
+
 
 class TestToSnakeCase:
 
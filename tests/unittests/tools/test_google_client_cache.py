@@ -0,0 +1,61 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+from google.adk.tools._google_client_cache import GoogleClientCache
+import google.auth.credentials
+import google.oauth2.credentials
+
+
+def _credentials():
+  return mock.create_autospec(
+      google.auth.credentials.Credentials, instance=True
+  )
+
+
+def test_evicted_clients_are_closed():
+  cache = GoogleClientCache(maxsize=2)
+  credentials = [_credentials() for _ in range(3)]
+
+  clients = [
+      cache.get_or_create(creds, ("project",), mock.Mock)
+      for creds in credentials
+  ]
+  # The least recently used client is evicted and closed.
+  clients[0].close.assert_called_once()
+  clients[1].close.assert_not_called()
+  assert (
+      cache.get_or_create(credentials[1], ("project",), mock.Mock)
+      is clients[1]
+  )
+
+  cache.clear()
+  clients[1].close.assert_called_once()
+  clients[2].close.assert_called_once()
+
+
+def test_oauth_credentials_are_not_cached():
+  cache = GoogleClientCache()
+  credentials = mock.create_autospec(
+      google.oauth2.credentials.Credentials, instance=True
+  )
+
+  client = cache.get_or_create(credentials, ("project",), mock.Mock)
+
+  assert cache.get_or_create(credentials, ("project",), mock.Mock) is not client
+  cache.clear()
+  client.close.assert_not_called()
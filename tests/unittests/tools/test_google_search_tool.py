@@ -54,6 +54,18 @@ class TestGoogleSearchTool:
     assert isinstance(google_search, GoogleSearchTool)
     assert google_search.name == 'google_search'
 
+  def test_as_agent_tool_reused_per_model(self):
+    """Test that the wrapping agent tool is rebuilt only on model changes."""
+    tool = GoogleSearchTool(bypass_multi_tools_limit=True)
+
+    first = tool.as_agent_tool('gemini-2.5-flash')
+    second = tool.as_agent_tool('gemini-2.5-flash')
+    third = tool.as_agent_tool('gemini-2.5-pro')
+
+    assert second is first
+    assert third is not first
+    assert third.agent.model == 'gemini-2.5-pro'
+
   @pytest.mark.asyncio
   async def test_process_llm_request_with_gemini_1_model(self):
     """Test processing LLM request with Gemini 1.x model."""
@@ -0,0 +1,51 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for file utility functions."""
+
+import builtins
+import json
+from pathlib import Path
+
+from google.adk.utils.file_utils import load_file_cached
+import pytest
+
+
+def test_load_file_cached_rereads_only_changed_files(tmp_path: Path, mocker):
+  file_path = tmp_path / "config.json"
+  file_path.write_text('{"name": "first"}', encoding="utf-8")
+  open_spy = mocker.spy(builtins, "open")
+
+  assert load_file_cached(str(file_path)) == '{"name": "first"}'
+  assert load_file_cached(str(file_path)) == '{"name": "first"}'
+  assert open_spy.call_count == 1
+
+  # Rewriting the file changes its size and mtime, so it is re-read.
+  file_path.write_text('{"name": "renamed"}', encoding="utf-8")
+  assert load_file_cached(str(file_path)) == '{"name": "renamed"}'
+  assert open_spy.call_count == 2
+
+
+def test_load_file_cached_with_loader(tmp_path: Path):
+  file_path = tmp_path / "config.json"
+  file_path.write_text('{"name": "first"}', encoding="utf-8")
+
+  assert load_file_cached(str(file_path), json.load) == {"name": "first"}
+  # Results of different loaders are cached separately.
+  assert load_file_cached(str(file_path)) == '{"name": "first"}'
+
+
+def test_load_file_cached_missing_file(tmp_path: Path):
+  with pytest.raises(FileNotFoundError):
+    load_file_cached(str(tmp_path / "missing.json"))
@@ -267,3 +267,21 @@ async def test_inject_session_state_with_optional_missing_state_returns_empty():
       instruction_template, invocation_context
   )
   assert populated_instruction == "Optional value: "
+
+
+@pytest.mark.parametrize(
+    "var_name, expected",
+    [
+        ("user_name", True),
+        ("app:user_name", True),
+        ("user:user_name", True),
+        ("temp:user_name", True),
+        ("invalid:user_name", False),
+        ("app:user:name", False),
+        ("app:", False),
+        (":user_name", False),
+        ("not an identifier", False),
+    ],
+)
+def test_is_valid_state_name(var_name, expected):
+  assert instructions_utils._is_valid_state_name(var_name) is expected
@@ -18,8 +18,10 @@ from pathlib import Path
 from typing import Optional
 
 from google.adk.utils.yaml_utils import dump_pydantic_to_yaml
+from google.adk.utils.yaml_utils import load_yaml_file
 from google.genai import types
 from pydantic import BaseModel
+import pytest
 
 
 class SimpleModel(BaseModel):
@@ -152,3 +154,19 @@ multiline_text: |-
   Hola Mundo 🌎
 name: 你好世界
 """
+
+
+def test_load_yaml_file(tmp_path: Path):
+  """Test loading a YAML file."""
+  file_path = tmp_path / "test.yaml"
+  file_path.write_text("name: test\nitems:\n  - a\n  - b\n")
+
+  assert load_yaml_file(file_path) == {"name": "test", "items": ["a", "b"]}
+  assert load_yaml_file(str(file_path)) == {"name": "test", "items": ["a", "b"]}
+
+
+@pytest.mark.parametrize("file_name", ["missing.yaml", ""])
+def test_load_yaml_file_not_found(tmp_path: Path, file_name: str):
+  """Test that missing files and directories raise FileNotFoundError."""
+  with pytest.raises(FileNotFoundError, match="YAML file not found"):
+    load_yaml_file(tmp_path / file_name)